@@ -0,0 +1,45 @@
+"""add composite indexes for keyset listings
+
+Revision ID: 0007_add_listing_keyset_indexes
+Revises: 0006_add_animal_characteristics
+Create Date: 2025-11-03 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_add_listing_keyset_indexes"
+down_revision = "0006_add_animal_characteristics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Mesma ordem de GET /animals/mine: created_at desc, id desc.
+    op.create_index(
+        "ix_animals_org_created_at_id",
+        "animals",
+        [
+            "organization_id",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+    # Mesma ordem de GET /expenses: expense_date desc, created_at desc, id desc.
+    op.create_index(
+        "ix_expenses_org_date_created_at_id",
+        "expenses",
+        [
+            "organization_id",
+            sa.text("expense_date DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_expenses_org_date_created_at_id", table_name="expenses")
+    op.drop_index("ix_animals_org_created_at_id", table_name="animals")
@@ -0,0 +1,36 @@
+"""add GIN indexes to animal characteristic arrays
+
+Revision ID: 0008_add_animal_characteristics_gin
+Revises: 0007_add_listing_keyset_indexes
+Create Date: 2025-11-03 00:10:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_add_animal_characteristics_gin"
+down_revision = "0007_add_listing_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+CHARACTERISTIC_COLUMNS = [
+    "temperament_traits",
+    "environment_preferences",
+    "sociable_with",
+]
+
+
+def upgrade() -> None:
+    for column in CHARACTERISTIC_COLUMNS:
+        op.create_index(
+            f"ix_animals_{column}",
+            "animals",
+            [column],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(CHARACTERISTIC_COLUMNS):
+        op.drop_index(f"ix_animals_{column}", table_name="animals")
@@ -0,0 +1,167 @@
+"""create animal_search_documents projection
+
+Revision ID: 0009_create_animal_search_documents
+Revises: 0008_add_animal_characteristics_gin
+Create Date: 2025-11-04 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_create_animal_search_documents"
+down_revision = "0008_add_animal_characteristics_gin"
+branch_labels = None
+depends_on = None
+
+CHARACTERISTIC_COLUMNS = [
+    "temperament_traits",
+    "environment_preferences",
+    "sociable_with",
+]
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    return postgresql.ENUM(name=name, create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "animal_search_documents",
+        sa.Column(
+            "animal_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("animals.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("species_id", sa.Integer(), nullable=False),
+        sa.Column("species_slug", sa.String(length=50), nullable=False),
+        sa.Column("species_label", sa.String(length=100), nullable=False),
+        sa.Column("sex", _enum("animal_sex"), nullable=False),
+        sa.Column("size", _enum("animal_size"), nullable=False),
+        sa.Column("age_years", sa.Integer(), nullable=True),
+        sa.Column(
+            "temperament_traits",
+            postgresql.ARRAY(_enum("temperament_trait")),
+            nullable=False,
+        ),
+        sa.Column(
+            "environment_preferences",
+            postgresql.ARRAY(_enum("environment_preference")),
+            nullable=False,
+        ),
+        sa.Column(
+            "sociable_with",
+            postgresql.ARRAY(_enum("sociable_target")),
+            nullable=False,
+        ),
+        sa.Column("vaccinated", sa.Boolean(), nullable=False),
+        sa.Column("neutered", sa.Boolean(), nullable=False),
+        sa.Column("dewormed", sa.Boolean(), nullable=False),
+        sa.Column("status", _enum("animal_status"), nullable=False),
+        sa.Column("photo_url", sa.String(length=255), nullable=True),
+        sa.Column("organization_name", sa.String(length=255), nullable=False),
+        sa.Column("organization_city", sa.String(length=100), nullable=True),
+        sa.Column("organization_state", sa.String(length=2), nullable=True),
+        sa.Column("organization_latitude", sa.Numeric(9, 6), nullable=True),
+        sa.Column("organization_longitude", sa.Numeric(9, 6), nullable=True),
+        sa.Column("organization_logo_url", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute(
+        "ALTER TABLE animal_search_documents "
+        "ADD COLUMN location geography(Point, 4326)"
+    )
+
+    op.create_index(
+        "ix_animal_search_documents_location",
+        "animal_search_documents",
+        ["location"],
+        postgresql_using="gist",
+    )
+    op.create_index(
+        "ix_animal_search_documents_organization_id",
+        "animal_search_documents",
+        ["organization_id"],
+    )
+    for column in CHARACTERISTIC_COLUMNS:
+        op.create_index(
+            f"ix_animal_search_documents_{column}",
+            "animal_search_documents",
+            [column],
+            postgresql_using="gin",
+        )
+    # A busca passa a filtrar as características na projeção; os índices GIN
+    # de animals (0008) só encareceriam as escritas.
+    for column in CHARACTERISTIC_COLUMNS:
+        op.drop_index(f"ix_animals_{column}", table_name="animals")
+
+    op.execute(
+        """
+        INSERT INTO animal_search_documents (
+            animal_id, organization_id, name, species_id, species_slug,
+            species_label, sex, size, age_years, temperament_traits,
+            environment_preferences, sociable_with, vaccinated, neutered,
+            dewormed, status, photo_url, organization_name, organization_city,
+            organization_state, organization_latitude, organization_longitude,
+            organization_logo_url, location, created_at
+        )
+        SELECT
+            a.id, a.organization_id, a.name, a.species_id, s.slug,
+            s.label, a.sex, a.size, a.age_years, a.temperament_traits,
+            a.environment_preferences, a.sociable_with, a.vaccinated, a.neutered,
+            a.dewormed, a.status,
+            (
+                SELECT p.url
+                FROM animal_photos p
+                WHERE p.animal_id = a.id
+                ORDER BY p.position ASC NULLS LAST, p.created_at
+                LIMIT 1
+            ),
+            o.name, o.city, o.state, o.latitude, o.longitude, o.logo_url,
+            o.location, a.created_at
+        FROM animals a
+        JOIN organizations o ON o.id = a.organization_id
+        JOIN animal_species s ON s.id = a.species_id
+        """
+    )
+
+
+def downgrade() -> None:
+    for column in CHARACTERISTIC_COLUMNS:
+        op.create_index(
+            f"ix_animals_{column}",
+            "animals",
+            [column],
+            postgresql_using="gin",
+        )
+    for column in reversed(CHARACTERISTIC_COLUMNS):
+        op.drop_index(
+            f"ix_animal_search_documents_{column}",
+            table_name="animal_search_documents",
+        )
+    op.drop_index(
+        "ix_animal_search_documents_organization_id",
+        table_name="animal_search_documents",
+    )
+    op.drop_index(
+        "ix_animal_search_documents_location",
+        table_name="animal_search_documents",
+    )
+    op.drop_table("animal_search_documents")
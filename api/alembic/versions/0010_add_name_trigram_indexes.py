@@ -0,0 +1,39 @@
+"""add trigram indexes for partial name search
+
+Revision ID: 0010_add_name_trigram_indexes
+Revises: 0009_create_animal_search_documents
+Create Date: 2025-11-05 00:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_add_name_trigram_indexes"
+down_revision = "0009_create_animal_search_documents"
+branch_labels = None
+depends_on = None
+
+NAME_INDEXES = [
+    ("ix_animals_name_trgm", "animals"),
+    ("ix_organizations_name_trgm", "organizations"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Atendem ILIKE '%termo%' e os operadores de similaridade (<%, %).
+    for index_name, table_name in NAME_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for index_name, table_name in reversed(NAME_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,64 @@
+"""create organization_animal_stats counters
+
+Revision ID: 0011_create_organization_animal_stats
+Revises: 0010_add_name_trigram_indexes
+Create Date: 2025-11-05 01:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_create_organization_animal_stats"
+down_revision = "0010_add_name_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_animal_stats",
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "species_id",
+            sa.Integer(),
+            sa.ForeignKey("animal_species.id", ondelete="RESTRICT"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="animal_status", create_type=False),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint("count >= 0", name="ck_organization_animal_stats_count"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO organization_animal_stats (organization_id, species_id, status, count)
+        SELECT organization_id, species_id, status, count(*)
+        FROM animals
+        GROUP BY organization_id, species_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("organization_animal_stats")
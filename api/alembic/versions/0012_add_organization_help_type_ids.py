@@ -0,0 +1,54 @@
+"""denormalize organization help types into an int array
+
+Revision ID: 0012_add_organization_help_type_ids
+Revises: 0011_create_organization_animal_stats
+Create Date: 2025-11-05 02:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_add_organization_help_type_ids"
+down_revision = "0011_create_organization_animal_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "organizations",
+        sa.Column(
+            "help_type_ids",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE organizations AS o
+        SET help_type_ids = ht.ids
+        FROM (
+            SELECT organization_id, array_agg(help_type_id ORDER BY help_type_id) AS ids
+            FROM organization_help_types
+            GROUP BY organization_id
+        ) AS ht
+        WHERE ht.organization_id = o.id
+        """
+    )
+
+    op.create_index(
+        "ix_organizations_help_type_ids",
+        "organizations",
+        ["help_type_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organizations_help_type_ids", table_name="organizations")
+    op.drop_column("organizations", "help_type_ids")
@@ -0,0 +1,74 @@
+"""create expense_monthly_rollups
+
+Revision ID: 0013_create_expense_monthly_rollups
+Revises: 0012_add_organization_help_type_ids
+Create Date: 2025-11-06 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_create_expense_monthly_rollups"
+down_revision = "0012_add_organization_help_type_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "expense_monthly_rollups",
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column(
+            "category_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("expense_categories.id", ondelete="RESTRICT"),
+            nullable=False,
+        ),
+        sa.Column(
+            "cost_center", sa.String(length=100), nullable=False, server_default=""
+        ),
+        sa.Column("total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("expense_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        # organização + mês primeiro: o painel e os totais filtram por intervalo de meses.
+        sa.PrimaryKeyConstraint(
+            "organization_id", "month", "category_id", "cost_center"
+        ),
+        sa.CheckConstraint(
+            "expense_count >= 0", name="ck_expense_monthly_rollups_expense_count"
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO expense_monthly_rollups
+            (organization_id, month, category_id, cost_center, total, expense_count)
+        SELECT
+            organization_id,
+            date_trunc('month', expense_date)::date,
+            category_id,
+            coalesce(cost_center, ''),
+            sum(amount),
+            count(*)
+        FROM expenses
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("expense_monthly_rollups")
@@ -0,0 +1,73 @@
+"""create organization_adoption_stats aggregates
+
+Revision ID: 0014_create_organization_adoption_stats
+Revises: 0013_create_expense_monthly_rollups
+Create Date: 2025-11-06 01:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_create_organization_adoption_stats"
+down_revision = "0013_create_expense_monthly_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_adoption_stats",
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("adoption_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("closed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "days_until_adoption_sum",
+            sa.Float(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "adoption_count >= 0",
+            name="ck_organization_adoption_stats_adoption_count",
+        ),
+        sa.CheckConstraint(
+            "closed_count >= 0", name="ck_organization_adoption_stats_closed_count"
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO organization_adoption_stats
+            (organization_id, adoption_count, closed_count, days_until_adoption_sum)
+        SELECT
+            adoptions.organization_id,
+            count(*),
+            count(adoptions.closed_at),
+            coalesce(
+                sum(extract(epoch FROM adoptions.adoption_date - animals.created_at) / 86400.0),
+                0
+            )
+        FROM adoptions
+        JOIN animals ON animals.id = adoptions.animal_id
+        GROUP BY adoptions.organization_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("organization_adoption_stats")
@@ -0,0 +1,95 @@
+"""add indexes for the repository query shapes
+
+Revision ID: 0015_add_index_audit_indexes
+Revises: 0014_create_organization_adoption_stats
+Create Date: 2025-11-07 00:00:00
+
+Criados com CREATE INDEX CONCURRENTLY para não bloquear escritas nas
+tabelas em produção; por isso rodam fora da transação da migração.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_add_index_audit_indexes"
+down_revision = "0014_create_organization_adoption_stats"
+branch_labels = None
+depends_on = None
+
+# (nome, tabela, colunas, opções extras de create_index)
+INDEXES = [
+    # Adoções do mês no painel e na série mensal: organização + intervalo de datas.
+    (
+        "ix_adoptions_org_adoption_date",
+        "adoptions",
+        ["organization_id", "adoption_date"],
+        {},
+    ),
+    # Devoluções por mês na série mensal; só adoções encerradas entram.
+    (
+        "ix_adoptions_org_closed_at",
+        "adoptions",
+        ["organization_id", "closed_at"],
+        {"postgresql_where": sa.text("closed_at IS NOT NULL")},
+    ),
+    # JOIN do rebuild dos agregados e ON DELETE CASCADE a partir de animals
+    # (uq_adoptions_active_animal é parcial e só cobre adoções ativas).
+    ("ix_adoptions_animal_id", "adoptions", ["animal_id"], {}),
+    # Animais ativos no painel (status IN ...) e GET /animals/mine?status=.
+    ("ix_animals_org_status", "animals", ["organization_id", "status"], {}),
+    # GET /expenses?category_id=: mesma ordem do keyset de 0007.
+    (
+        "ix_expenses_org_category_date",
+        "expenses",
+        [
+            "organization_id",
+            "category_id",
+            sa.text("expense_date DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+        {},
+    ),
+    # Contagem de despesas por animal e ON DELETE SET NULL a partir de animals.
+    ("ix_expenses_animal_id", "expenses", ["animal_id"], {}),
+    # ExpenseCategoryRepository.exists_with_key compara lower(key).
+    (
+        "ix_expense_categories_lower_key",
+        "expense_categories",
+        [sa.text("lower(key)")],
+        {},
+    ),
+    # GET /ongs sem filtros ordena por created_at desc.
+    (
+        "ix_organizations_created_at",
+        "organizations",
+        [sa.text("created_at DESC")],
+        {},
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, options in INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _columns, _options in reversed(INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
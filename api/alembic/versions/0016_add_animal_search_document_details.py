@@ -0,0 +1,108 @@
+"""add public detail columns to animal_search_documents
+
+Revision ID: 0016_add_animal_search_document_details
+Revises: 0015_add_index_audit_indexes
+Create Date: 2025-11-08 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0016_add_animal_search_document_details"
+down_revision = "0015_add_index_audit_indexes"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "species_description",
+    "weight_kg",
+    "rescue_date",
+    "microchip",
+    "description",
+    "adoption_requirements",
+    "photos",
+    "updated_at",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("species_description", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("weight_kg", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("rescue_date", sa.Date(), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("microchip", sa.String(length=50), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("description", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("adoption_requirements", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column(
+            "photos",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+    )
+    op.add_column(
+        "animal_search_documents",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE animal_search_documents d
+        SET
+            species_description = s.description,
+            weight_kg = a.weight_kg,
+            rescue_date = a.rescue_date,
+            microchip = a.microchip,
+            description = a.description,
+            adoption_requirements = a.adoption_requirements,
+            photos = COALESCE(
+                (
+                    SELECT jsonb_agg(
+                        jsonb_build_object(
+                            'id', p.id,
+                            'url', p.url,
+                            'position', p.position,
+                            'created_at', p.created_at
+                        )
+                        ORDER BY p.position ASC NULLS LAST, p.created_at
+                    )
+                    FROM animal_photos p
+                    WHERE p.animal_id = a.id
+                ),
+                '[]'::jsonb
+            ),
+            updated_at = a.updated_at,
+            refreshed_at = now()
+        FROM animals a
+        JOIN animal_species s ON s.id = a.species_id
+        WHERE a.id = d.animal_id
+        """
+    )
+    op.alter_column("animal_search_documents", "updated_at", nullable=False)
+
+
+def downgrade() -> None:
+    for column in reversed(COLUMNS):
+        op.drop_column("animal_search_documents", column)
@@ -0,0 +1,44 @@
+"""rebuild organization_adoption_stats
+
+Revision ID: 0017_rebuild_organization_adoption_stats
+Revises: 0016_add_animal_search_document_details
+Create Date: 2025-11-09 00:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_rebuild_organization_adoption_stats"
+down_revision = "0016_add_animal_search_document_details"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Até aqui os agregados só eram gravados pelo backfill da 0014; adoções
+    # escritas depois disso ficaram de fora. Daqui em diante são mantidos a
+    # cada escrita em ``adoptions``.
+    op.execute("DELETE FROM organization_adoption_stats")
+    op.execute(
+        """
+        INSERT INTO organization_adoption_stats
+            (organization_id, adoption_count, closed_count, days_until_adoption_sum)
+        SELECT
+            adoptions.organization_id,
+            count(*),
+            count(adoptions.closed_at),
+            coalesce(
+                sum(extract(epoch FROM adoptions.adoption_date - animals.created_at) / 86400.0),
+                0
+            )
+        FROM adoptions
+        JOIN animals ON animals.id = adoptions.animal_id
+        GROUP BY adoptions.organization_id
+        """
+    )
+
+
+def downgrade() -> None:
+    # Os agregados recalculados continuam válidos na revisão anterior.
+    pass
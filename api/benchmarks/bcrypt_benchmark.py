@@ -0,0 +1,62 @@
+"""Benchmark de vazão do bcrypt por custo.
+
+Mede hashes por segundo em uma única thread e através do ``PasswordHasher``
+(pool de processos) para cada custo, ajudando a escolher ``BCRYPT_ROUNDS`` e
+``PASSWORD_HASH_WORKERS``.
+
+Uso (a partir de ``api/``)::
+
+    python -m benchmarks.bcrypt_benchmark --rounds 10 11 12 13 --workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.security import PasswordHasher, _hash_password
+
+PASSWORD = b"correct horse battery staple"
+
+
+def _inline_rate(rounds: int, samples: int) -> float:
+    started = time.perf_counter()
+    for _ in range(samples):
+        _hash_password(PASSWORD, rounds)
+    return samples / (time.perf_counter() - started)
+
+
+def _pool_rate(rounds: int, samples: int, workers: int) -> float:
+    hasher = PasswordHasher(workers=workers, max_pending=samples)
+    hasher.start()
+    try:
+        with ThreadPoolExecutor(max_workers=samples) as callers:
+            started = time.perf_counter()
+            futures = [
+                callers.submit(hasher.run, _hash_password, PASSWORD, rounds)
+                for _ in range(samples)
+            ]
+            for future in futures:
+                future.result()
+            return samples / (time.perf_counter() - started)
+    finally:
+        hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--samples", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'custo':>5}  {'ms/hash':>8}  {'hash/s':>7}  {'pool hash/s':>11}")
+    for rounds in args.rounds:
+        inline = _inline_rate(rounds, args.samples)
+        pooled = _pool_rate(rounds, args.samples, args.workers)
+        print(f"{rounds:>5}  {1000 / inline:>8.1f}  {inline:>7.1f}  {pooled:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Relatório do tempo de import da aplicação.
+
+Roda ``python -X importtime -c "import main"`` em um processo novo e resume
+a saída: tempo total, módulos com maior tempo próprio e o tempo agrupado por
+pacote de primeiro nível, separando os pacotes da aplicação das dependências.
+
+Uso (a partir de ``api/``)::
+
+    python -m benchmarks.import_profile --top 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+APP_PACKAGES = {
+    "controllers",
+    "core",
+    "db",
+    "main",
+    "models",
+    "repositories",
+    "routers",
+    "schemas",
+    "services",
+}
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def _importtime() -> list[tuple[str, int, int, int]]:
+    """Retorna (módulo, próprio µs, acumulado µs, profundidade) por import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent)))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    entries = _importtime()
+    total_us = next(cumulative for module, _, cumulative, _ in entries if module == "main")
+
+    by_package: dict[str, int] = defaultdict(int)
+    for module, self_us, _, _ in entries:
+        by_package[module.partition(".")[0]] += self_us
+
+    print(f"import main: {total_us / 1000:.1f} ms ({len(entries)} módulos)\n")
+    print(f"{'próprio ms':>10}  {'acumulado ms':>12}  módulo")
+    for module, self_us, cumulative_us, _ in sorted(
+        entries, key=lambda entry: entry[1], reverse=True
+    )[: args.top]:
+        print(f"{self_us / 1000:>10.1f}  {cumulative_us / 1000:>12.1f}  {module}")
+
+    app_us = sum(us for package, us in by_package.items() if package in APP_PACKAGES)
+    print(f"\naplicação: {app_us / 1000:.1f} ms, dependências: "
+          f"{(sum(by_package.values()) - app_us) / 1000:.1f} ms")
+    print(f"{'ms':>8}  pacote")
+    for package, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[
+        : args.top
+    ]:
+        marker = " *" if package in APP_PACKAGES else ""
+        print(f"{us / 1000:>8.1f}  {package}{marker}")
+
+
+if __name__ == "__main__":
+    main()
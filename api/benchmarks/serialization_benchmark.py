@@ -0,0 +1,152 @@
+"""Microbenchmark da serialização dos cards da busca pública.
+
+Compara, para páginas de 100 itens, o caminho antigo (modelo Pydantic por
+item, ``model_dump`` e revalidação contra o ``response_model`` antes do
+``json.dumps``) com o caminho atual (dicionário montado da linha e
+``PydanticJSONResponse``). Não acessa o banco: as linhas são simuladas.
+
+Uso (a partir de ``api/``)::
+
+    python -m benchmarks.serialization_benchmark --pages 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from controllers.animal_controller import _serialize_card
+from core.responses import PydanticJSONResponse
+from models.animal import (
+    AnimalSex,
+    AnimalSize,
+    AnimalStatus,
+    EnvironmentPreference,
+    SociableTarget,
+    TemperamentTrait,
+)
+from schemas.animal import (
+    AnimalCardRead,
+    AnimalOrganizationSummary,
+    AnimalSpeciesRead,
+)
+
+PAGE_SIZE = 100
+
+
+def _fake_documents(count: int) -> list[tuple[SimpleNamespace, float]]:
+    organization_id = uuid4()
+    created_at = datetime.now(timezone.utc)
+    return [
+        (
+            SimpleNamespace(
+                animal_id=uuid4(),
+                organization_id=organization_id,
+                name=f"Animal {index}",
+                species_id=1,
+                species_slug="dog",
+                species_label="Cachorro",
+                sex=AnimalSex.female,
+                age_years=index % 15,
+                size=AnimalSize.medium,
+                temperament_traits=[TemperamentTrait.playful, TemperamentTrait.calm],
+                environment_preferences=[EnvironmentPreference.house_with_yard],
+                sociable_with=[SociableTarget.children, SociableTarget.dogs],
+                vaccinated=True,
+                neutered=True,
+                dewormed=False,
+                status=AnimalStatus.available,
+                created_at=created_at,
+                photo_url=f"https://cdn.example.com/animals/{index}.jpg",
+                organization_name="ONG Exemplo",
+                organization_city="Curitiba",
+                organization_state="PR",
+                organization_latitude=-25.4284,
+                organization_longitude=-49.2733,
+                organization_logo_url="https://cdn.example.com/logo.png",
+            ),
+            index * 0.25,
+        )
+        for index in range(count)
+    ]
+
+
+_response_adapter = TypeAdapter(list[AnimalCardRead])
+
+
+def _legacy_page(rows: list[tuple[SimpleNamespace, float]]) -> bytes:
+    items = [
+        AnimalCardRead(
+            id=document.animal_id,
+            organization_id=document.organization_id,
+            name=document.name,
+            species=AnimalSpeciesRead(
+                id=document.species_id,
+                slug=document.species_slug,
+                label=document.species_label,
+            ),
+            sex=document.sex,
+            age_years=document.age_years,
+            size=document.size,
+            temperament_traits=document.temperament_traits,
+            environment_preferences=document.environment_preferences,
+            sociable_with=document.sociable_with,
+            vaccinated=document.vaccinated,
+            neutered=document.neutered,
+            dewormed=document.dewormed,
+            status=document.status,
+            created_at=document.created_at,
+            photo_url=document.photo_url,
+            distance_km=distance,
+            organization=AnimalOrganizationSummary(
+                id=document.organization_id,
+                name=document.organization_name,
+                city=document.organization_city,
+                state=document.organization_state,
+                latitude=document.organization_latitude,
+                longitude=document.organization_longitude,
+                logo_url=document.organization_logo_url,
+            ),
+        ).model_dump()
+        for document, distance in rows
+    ]
+    # O que o FastAPI faz com o retorno: valida contra o response_model,
+    # converte com jsonable_encoder e serializa com json.dumps.
+    validated = _response_adapter.validate_python(items)
+    content = jsonable_encoder(_response_adapter.dump_python(validated, mode="json"))
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _current_page(rows: list[tuple[SimpleNamespace, float]]) -> bytes:
+    return PydanticJSONResponse(
+        [_serialize_card(document, distance) for document, distance in rows]
+    ).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = _fake_documents(PAGE_SIZE)
+    assert json.loads(_legacy_page(rows)) == json.loads(_current_page(rows))
+
+    for label, render in (("legado", _legacy_page), ("atual", _current_page)):
+        render(rows)
+        elapsed = min(
+            timeit.repeat(lambda: render(rows), number=args.pages, repeat=5)
+        )
+        per_item_us = elapsed / (args.pages * PAGE_SIZE) * 1_000_000
+        per_page_ms = elapsed / args.pages * 1000
+        print(f"{label:>7}: {per_item_us:8.2f} µs/item  {per_page_ms:7.3f} ms/página")
+
+
+if __name__ == "__main__":
+    main()
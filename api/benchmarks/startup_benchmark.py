@@ -0,0 +1,78 @@
+"""Benchmark de latência de inicialização de um worker.
+
+Cada amostra roda em um processo novo e mede o ``import main`` (rotas,
+modelos, engine) e o primeiro acesso ao schema OpenAPI, com o schema montado
+sob demanda e com o ``openapi.json`` gerado antes (``OPENAPI_SCHEMA_PATH``).
+
+Uso (a partir de ``api/``)::
+
+    python -m benchmarks.startup_benchmark --samples 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.app.openapi()
+finished = time.perf_counter()
+print(json.dumps({"import": imported - started, "openapi": finished - imported}))
+"""
+
+
+def _sample(env: dict[str, str]) -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=API_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _report(label: str, samples: list[dict[str, float]]) -> None:
+    import_ms = statistics.median(sample["import"] for sample in samples) * 1000
+    openapi_ms = statistics.median(sample["openapi"] for sample in samples) * 1000
+    print(
+        f"{label:>12}: import {import_ms:7.1f} ms  openapi {openapi_ms:7.1f} ms  "
+        f"total {import_ms + openapi_ms:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    base_env = {**os.environ, "OPENAPI_SCHEMA_PATH": ""}
+    with tempfile.TemporaryDirectory() as directory:
+        schema_path = str(Path(directory) / "openapi.json")
+        subprocess.run(
+            [sys.executable, "-m", "core.openapi", schema_path],
+            cwd=API_DIR,
+            env=base_env,
+            check=True,
+        )
+        prebuilt_env = {**base_env, "OPENAPI_SCHEMA_PATH": schema_path}
+
+        print(f"mediana de {args.samples} processos")
+        _report("sob demanda", [_sample(base_env) for _ in range(args.samples)])
+        _report("pré-gerado", [_sample(prebuilt_env) for _ in range(args.samples)])
+
+
+if __name__ == "__main__":
+    main()
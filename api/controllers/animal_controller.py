@@ -1,27 +1,41 @@
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status as http_status
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, Page
+from core.principal import OrganizationPrincipal
+from core.responses import PydanticJSONResponse
 from models.animal import (
     Animal,
     AnimalSex,
     AnimalSize,
     AnimalStatus,
+    EnvironmentPreference,
+    SociableTarget,
     TemperamentTrait,
 )
-from models.organization import Organization
 from schemas.animal import (
     AnimalCharacteristicsRead,
     AnimalCreate,
-    AnimalListItemRead,
     AnimalPhotoRead,
     AnimalRead,
-    AnimalOrganizationSummary,
-    AnimalPublicRead,
     AnimalSpeciesRead,
+    AnimalStatusUpdate,
+    CharacteristicMatch,
+)
+from repositories.animal_search_document_repository import AnimalSearchFacets
+from services.animal_service import (
+    AnimalHasExpensesError,
+    AnimalNotFoundError,
+    AnimalService,
+    AnimalSpeciesNotFoundError,
 )
-from services.animal_service import AnimalService, AnimalSpeciesNotFoundError
 
 service = AnimalService()
 
@@ -29,24 +43,66 @@ service = AnimalService()
 def create_animal(
     payload: AnimalCreate,
     *,
-    organization: Organization,
+    organization: OrganizationPrincipal,
     db: Session,
 ) -> AnimalRead:
     try:
         animal = service.create_animal(db, organization, payload)
     except AnimalSpeciesNotFoundError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=http_status.HTTP_404_NOT_FOUND,
             detail="Tipo de animal não encontrado.",
         )
     return _serialize(animal)
 
 
+def update_animal_status(
+    animal_id: UUID,
+    payload: AnimalStatusUpdate,
+    *,
+    organization: OrganizationPrincipal,
+    db: Session,
+) -> AnimalRead:
+    try:
+        animal = service.update_status(db, organization, animal_id, payload.status)
+    except AnimalNotFoundError:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Animal não encontrado.",
+        )
+    return _serialize(animal)
+
+
+def delete_animal(
+    animal_id: UUID,
+    *,
+    organization: OrganizationPrincipal,
+    db: Session,
+) -> None:
+    try:
+        service.delete_animal(db, organization, animal_id)
+    except AnimalNotFoundError:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Animal não encontrado.",
+        )
+    except AnimalHasExpensesError:
+        raise HTTPException(
+            status_code=http_status.HTTP_409_CONFLICT,
+            detail="O animal possui despesas vinculadas.",
+        )
+
+
 def list_species(db: Session) -> list[AnimalSpeciesRead]:
     species = service.list_species(db)
     return [AnimalSpeciesRead.model_validate(item) for item in species]
 
 
+async def list_species_async(db: AsyncSession) -> list[AnimalSpeciesRead]:
+    species = await service.list_species_async(db)
+    return [AnimalSpeciesRead.model_validate(item) for item in species]
+
+
 def list_characteristics() -> AnimalCharacteristicsRead:
     return service.list_characteristics()
 
@@ -54,21 +110,43 @@ def list_characteristics() -> AnimalCharacteristicsRead:
 def list_animals_by_organization(
     db: Session,
     *,
-    organization: Organization,
+    organization: OrganizationPrincipal,
     skip: int = 0,
     limit: int = 50,
     name: str | None = None,
     status: AnimalStatus | None = None,
-) -> list[AnimalListItemRead]:
-    animals = service.list_animals_by_organization(
-        db,
-        organization=organization,
-        skip=skip,
-        limit=limit,
-        name=name,
-        status=status,
-    )
-    return [_serialize_list_item(animal) for animal in animals]
+    cursor: str | None = None,
+) -> PydanticJSONResponse:
+    try:
+        page = service.list_animals_by_organization(
+            db,
+            organization=organization,
+            skip=skip,
+            limit=limit,
+            name=name,
+            status=status,
+            cursor=cursor,
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+
+    return _organization_list_response(page)
+
+
+async def list_animals_by_organization_async(
+    db: AsyncSession,
+    *,
+    organization: OrganizationPrincipal,
+    **criteria: Any,
+) -> PydanticJSONResponse:
+    try:
+        page = await service.list_animals_by_organization_async(
+            db, organization=organization, **criteria
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+
+    return _organization_list_response(page)
 
 
 def search_available_animals(
@@ -84,21 +162,111 @@ def search_available_animals(
     sex: AnimalSex | None = None,
     age_years: int | None = None,
     temperament_traits: list[TemperamentTrait] | None = None,
-) -> list[AnimalPublicRead]:
-    animals = service.search_available_animals(
-        db,
+    environment_preferences: list[EnvironmentPreference] | None = None,
+    sociable_with: list[SociableTarget] | None = None,
+    match: CharacteristicMatch = CharacteristicMatch.all,
+    cursor: str | None = None,
+) -> PydanticJSONResponse:
+    try:
+        page = service.search_available_animals(
+            db,
+            latitude=latitude,
+            longitude=longitude,
+            skip=skip,
+            limit=limit,
+            radius_km=radius_km,
+            species_id=species_id,
+            size=size,
+            sex=sex,
+            age_years=age_years,
+            temperament_traits=temperament_traits,
+            environment_preferences=environment_preferences,
+            sociable_with=sociable_with,
+            match=match,
+            cursor=cursor,
+            detailed=True,
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+
+    return _search_response(page)
+
+
+async def search_available_animals_async(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: str | None = None,
+    **criteria: Any,
+) -> PydanticJSONResponse:
+    try:
+        page = await service.search_available_animals_async(
+            db, skip=skip, limit=limit, cursor=cursor, detailed=True, **criteria
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+
+    return _search_response(page)
+
+
+def search_animals_with_facets(
+    db: Session,
+    *,
+    latitude: float,
+    longitude: float,
+    limit: int = 50,
+    radius_km: float | None = None,
+    species_id: int | None = None,
+    size: AnimalSize | None = None,
+    sex: AnimalSex | None = None,
+    age_years: int | None = None,
+    temperament_traits: list[TemperamentTrait] | None = None,
+    environment_preferences: list[EnvironmentPreference] | None = None,
+    sociable_with: list[SociableTarget] | None = None,
+    match: CharacteristicMatch = CharacteristicMatch.all,
+    cursor: str | None = None,
+) -> PydanticJSONResponse:
+    filters = dict(
         latitude=latitude,
         longitude=longitude,
-        skip=skip,
-        limit=limit,
         radius_km=radius_km,
         species_id=species_id,
         size=size,
         sex=sex,
         age_years=age_years,
         temperament_traits=temperament_traits,
+        environment_preferences=environment_preferences,
+        sociable_with=sociable_with,
+        match=match,
     )
-    return [_serialize_public(animal, distance) for animal, distance in animals]
+    try:
+        page = service.search_available_animals(
+            db, limit=limit, cursor=cursor, **filters
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+    facets = service.search_facets(db, **filters)
+
+    return _search_with_facets_response(page, facets)
+
+
+async def search_animals_with_facets_async(
+    db: AsyncSession,
+    *,
+    limit: int = 50,
+    cursor: str | None = None,
+    **criteria: Any,
+) -> PydanticJSONResponse:
+    try:
+        page = await service.search_available_animals_async(
+            db, limit=limit, cursor=cursor, **criteria
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+    facets = await service.search_facets_async(db, **criteria)
+
+    return _search_with_facets_response(page, facets)
 
 
 def _serialize(animal: Animal) -> AnimalRead:
@@ -143,41 +311,168 @@ def _serialize(animal: Animal) -> AnimalRead:
     )
 
 
-def _serialize_list_item(animal: Animal) -> AnimalListItemRead:
-    first_photo = animal.photos[0] if animal.photos else None
-    return AnimalListItemRead(
-        id=animal.id,
-        name=animal.name,
-        status=animal.status,
-        species=animal.species,
-        photo_url=first_photo.url if first_photo else None,
+# As listagens abaixo montam o JSON direto das linhas do banco, no formato de
+# AnimalListItemRead/AnimalPublicRead/AnimalCardRead/AnimalSearchFacetsRead,
+# sem instanciar os modelos Pydantic: os valores já foram validados na escrita.
+
+
+def _serialize_list_item(animal: Row) -> dict[str, Any]:
+    return {
+        "id": animal.id,
+        "name": animal.name,
+        "status": animal.status,
+        "species": {
+            "slug": animal.species_slug,
+            "label": animal.species_label,
+            "description": animal.species_description,
+            "id": animal.species_id,
+        },
+        "photo_url": animal.photo_url,
+    }
+
+
+def _serialize_card(
+    document: Row, distance_km: float
+) -> dict[str, Any]:
+    return {
+        "id": document.animal_id,
+        "organization_id": document.organization_id,
+        "name": document.name,
+        "species": {
+            "slug": document.species_slug,
+            "label": document.species_label,
+            "description": None,
+            "id": document.species_id,
+        },
+        "sex": document.sex,
+        "age_years": document.age_years,
+        "size": document.size,
+        "temperament_traits": document.temperament_traits,
+        "environment_preferences": document.environment_preferences,
+        "sociable_with": document.sociable_with,
+        "vaccinated": document.vaccinated,
+        "neutered": document.neutered,
+        "dewormed": document.dewormed,
+        "status": document.status,
+        "created_at": document.created_at,
+        "photo_url": document.photo_url,
+        "distance_km": distance_km,
+        "organization": _serialize_organization_summary(document),
+    }
+
+
+def _serialize_public(document: Row, distance_km: float) -> dict[str, Any]:
+    return {
+        "id": document.animal_id,
+        "organization_id": document.organization_id,
+        "name": document.name,
+        "species": {
+            "slug": document.species_slug,
+            "label": document.species_label,
+            "description": document.species_description,
+            "id": document.species_id,
+        },
+        "sex": document.sex,
+        "age_years": document.age_years,
+        "weight_kg": document.weight_kg,
+        "size": document.size,
+        "temperament_traits": document.temperament_traits,
+        "environment_preferences": document.environment_preferences,
+        "sociable_with": document.sociable_with,
+        "vaccinated": document.vaccinated,
+        "neutered": document.neutered,
+        "dewormed": document.dewormed,
+        "rescue_date": document.rescue_date,
+        "microchip": document.microchip,
+        "description": document.description,
+        "adoption_requirements": document.adoption_requirements,
+        "status": document.status,
+        "created_at": document.created_at,
+        "updated_at": document.updated_at,
+        # Já ordenadas e no formato de AnimalPhotoRead (ver o refresh do documento).
+        "photos": document.photos,
+        "distance_km": distance_km,
+        "organization": _serialize_organization_summary(document),
+    }
+
+
+def _serialize_organization_summary(document: Row) -> dict[str, Any]:
+    return {
+        "id": document.organization_id,
+        "name": document.organization_name,
+        "city": document.organization_city,
+        "state": document.organization_state,
+        "latitude": _to_float(document.organization_latitude),
+        "longitude": _to_float(document.organization_longitude),
+        "logo_url": document.organization_logo_url,
+    }
+
+
+def _serialize_facets(facets: AnimalSearchFacets) -> dict[str, Any]:
+    return {
+        "species": [
+            {"value": str(species_id), "label": label, "count": count}
+            for species_id, label, count in facets.species
+        ],
+        "size": [
+            {"value": size.value, "label": size.value, "count": count}
+            for size, count in facets.size
+        ],
+        "sex": [
+            {"value": sex.value, "label": sex.value, "count": count}
+            for sex, count in facets.sex
+        ],
+        "temperament_traits": [
+            {
+                "value": trait.value,
+                "label": service.temperament_label(trait),
+                "count": count,
+            }
+            for trait, count in facets.temperament_traits
+        ],
+    }
+
+
+def _organization_list_response(page: Page[Row]) -> PydanticJSONResponse:
+    return PydanticJSONResponse(
+        [_serialize_list_item(animal) for animal in page.items],
+        headers=_cursor_headers(page.next_cursor),
     )
 
 
-def _serialize_public(animal: Animal, distance_km: float) -> AnimalPublicRead:
-    if animal.organization is None:
-        raise ValueError("Animal não possui ONG associada.")
+def _search_response(page: Page[tuple[Row, float]]) -> PydanticJSONResponse:
+    return PydanticJSONResponse(
+        [_serialize_public(document, distance) for document, distance in page.items],
+        headers=_cursor_headers(page.next_cursor),
+    )
+
 
-    return AnimalPublicRead(
-        **_serialize(animal).model_dump(),
-        distance_km=distance_km,
-        organization=_serialize_organization_summary(animal.organization),
+def _search_with_facets_response(
+    page: Page[tuple[Row, float]], facets: AnimalSearchFacets
+) -> PydanticJSONResponse:
+    return PydanticJSONResponse(
+        {
+            "total": facets.total,
+            "items": [
+                _serialize_card(document, distance)
+                for document, distance in page.items
+            ],
+            "next_cursor": page.next_cursor,
+            "facets": _serialize_facets(facets),
+        }
     )
 
 
-def _serialize_organization_summary(
-    organization: Organization,
-) -> AnimalOrganizationSummary:
-    return AnimalOrganizationSummary(
-        id=organization.id,
-        name=organization.name,
-        city=organization.city,
-        state=organization.state,
-        latitude=_to_float(organization.latitude),
-        longitude=_to_float(organization.longitude),
-        logo_url=organization.logo_url,
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=http_status.HTTP_400_BAD_REQUEST,
+        detail="Cursor de paginação inválido.",
     )
 
 
+def _cursor_headers(next_cursor: str | None) -> dict[str, str] | None:
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+
+
 def _to_float(value: float | None) -> float | None:
     return float(value) if value is not None else None
@@ -1,6 +1,7 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from core.security import PasswordHasherBusyError
 from schemas.auth import LoginRequest, LogoutResponse, TokenResponse
 from services.auth_service import AuthResult, AuthService
 from services.organization_service import (
@@ -26,6 +27,12 @@ def login(payload: LoginRequest, db: Session) -> TokenResponse:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="ONG inativa.",
         )
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação ocupado. Tente novamente em instantes.",
+            headers={"Retry-After": "1"},
+        )
 
     return TokenResponse(
         access_token=result.access_token,
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from core.dependencies import get_current_organization
+from core.principal import OrganizationPrincipal
 from db.session import get_db
-from models.organization import Organization
-from schemas.dashboard import DashboardSummaryRead
+from schemas.dashboard import DashboardSummaryRead, DashboardTimeseriesRead
 from services.dashboard_service import DashboardService
 
 service = DashboardService()
@@ -14,10 +15,40 @@ service = DashboardService()
 
 def get_dashboard_summary(
     db: Session = Depends(get_db),
-    organization: Organization = Depends(get_current_organization),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
 ) -> DashboardSummaryRead:
     """Retorna os números consolidados para o painel da ONG autenticada."""
     return service.get_summary(db, organization.id)
 
 
-__all__ = ["get_dashboard_summary"]
+async def get_dashboard_summary_async(
+    db: AsyncSession, organization: OrganizationPrincipal
+) -> DashboardSummaryRead:
+    return await service.get_summary_async(db, organization.id)
+
+
+def get_dashboard_timeseries(
+    db: Session,
+    organization: OrganizationPrincipal,
+    *,
+    months: int,
+) -> DashboardTimeseriesRead:
+    """Retorna a série mensal para os gráficos do painel da ONG autenticada."""
+    return service.get_timeseries(db, organization.id, months=months)
+
+
+async def get_dashboard_timeseries_async(
+    db: AsyncSession,
+    organization: OrganizationPrincipal,
+    *,
+    months: int,
+) -> DashboardTimeseriesRead:
+    return await service.get_timeseries_async(db, organization.id, months=months)
+
+
+__all__ = [
+    "get_dashboard_summary",
+    "get_dashboard_summary_async",
+    "get_dashboard_timeseries",
+    "get_dashboard_timeseries_async",
+]
@@ -3,10 +3,11 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.principal import OrganizationPrincipal
 from models.expense_category import ExpenseCategory
-from models.organization import Organization
 from schemas.expense_category import ExpenseCategoryCreate, ExpenseCategoryRead
 from services.expense_category_service import (
     ExpenseCategoryDeleteForbiddenError,
@@ -21,14 +22,21 @@ service = ExpenseCategoryService()
 
 
 def list_categories(
-    organization: Organization, db: Session
+    organization: OrganizationPrincipal, db: Session
 ) -> list[ExpenseCategoryRead]:
     categories = service.list_categories(db, organization)
     return [_serialize(category) for category in categories]
 
 
+async def list_categories_async(
+    organization: OrganizationPrincipal, db: AsyncSession
+) -> list[ExpenseCategoryRead]:
+    categories = await service.list_categories_async(db, organization)
+    return [_serialize(category) for category in categories]
+
+
 def create_category(
-    organization: Organization, payload: ExpenseCategoryCreate, db: Session
+    organization: OrganizationPrincipal, payload: ExpenseCategoryCreate, db: Session
 ) -> ExpenseCategoryRead:
     try:
         category = service.create_category(db, organization, payload)
@@ -46,7 +54,7 @@ def create_category(
 
 
 def delete_category(
-    organization: Organization, category_id: UUID, db: Session
+    organization: OrganizationPrincipal, category_id: UUID, db: Session
 ) -> None:
     try:
         service.delete_category(db, organization, category_id)
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, Page
+from core.principal import OrganizationPrincipal
 from models.expense import Expense
-from models.organization import Organization
 from schemas.expense import ExpenseCreate, ExpenseRead
 from services.expense_service import (
     ExpenseAnimalNotFoundError,
@@ -21,7 +24,7 @@ service = ExpenseService()
 
 
 def create_expense(
-    organization: Organization, payload: ExpenseCreate, db: Session
+    organization: OrganizationPrincipal, payload: ExpenseCreate, db: Session
 ) -> ExpenseRead:
     try:
         expense = service.create_expense(db, organization, payload)
@@ -39,42 +42,68 @@ def create_expense(
 
 
 def list_expenses(
-    organization: Organization,
+    organization: OrganizationPrincipal,
     db: Session,
+    response: Response,
     *,
     skip: int = 0,
     limit: int = 50,
     category_id: UUID | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
+    cursor: str | None = None,
 ) -> list[ExpenseRead]:
-    expenses = service.list_expenses(
-        db,
-        organization,
-        skip=skip,
-        limit=limit,
-        category_id=category_id,
-        start_date=start_date,
-        end_date=end_date,
-    )
-    return [_serialize(expense) for expense in expenses]
+    try:
+        page = service.list_expenses(
+            db,
+            organization,
+            skip=skip,
+            limit=limit,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor()
+    return _serialize_page(page, response)
+
+
+async def list_expenses_async(
+    organization: OrganizationPrincipal,
+    db: AsyncSession,
+    response: Response,
+    **filters: Any,
+) -> list[ExpenseRead]:
+    try:
+        page = await service.list_expenses_async(db, organization, **filters)
+    except InvalidCursorError:
+        raise _invalid_cursor()
+    return _serialize_page(page, response)
 
 
 def get_expense(
-    organization: Organization, expense_id: UUID, db: Session
+    organization: OrganizationPrincipal, expense_id: UUID, db: Session
 ) -> ExpenseRead:
     try:
         expense = service.get_expense(db, organization, expense_id)
     except ExpenseNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Despesa não encontrada.",
-        )
+        raise _expense_not_found()
+    return _serialize(expense)
+
+
+async def get_expense_async(
+    organization: OrganizationPrincipal, expense_id: UUID, db: AsyncSession
+) -> ExpenseRead:
+    try:
+        expense = await service.get_expense_async(db, organization, expense_id)
+    except ExpenseNotFoundError:
+        raise _expense_not_found()
     return _serialize(expense)
 
 
 def summarize_expenses_by_category(
-    organization: Organization,
+    organization: OrganizationPrincipal,
     db: Session,
     *,
     start_date: date,
@@ -88,5 +117,40 @@ def summarize_expenses_by_category(
     )
 
 
+async def summarize_expenses_by_category_async(
+    organization: OrganizationPrincipal,
+    db: AsyncSession,
+    *,
+    start_date: date,
+    end_date: date,
+) -> dict[str, Decimal]:
+    return await service.totals_by_category_async(
+        db,
+        organization,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
 def _serialize(expense: Expense) -> ExpenseRead:
     return ExpenseRead.model_validate(expense)
+
+
+def _serialize_page(page: Page[Expense], response: Response) -> list[ExpenseRead]:
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [_serialize(expense) for expense in page.items]
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cursor de paginação inválido.",
+    )
+
+
+def _expense_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Despesa não encontrada.",
+    )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from core.cache import CacheStats, cache_stats
+from db.index_audit import index_audit_findings
+from db.pool import PoolStats, pool_stats
+from schemas.metrics import CacheStatsRead, IndexAuditFindingRead, PoolStatsRead
+
+
+def list_cache_stats() -> dict[str, CacheStatsRead]:
+    return {name: _serialize_cache(stats) for name, stats in cache_stats().items()}
+
+
+def _serialize_cache(stats: CacheStats) -> CacheStatsRead:
+    return CacheStatsRead(
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+        evictions=stats.evictions,
+        invalidations=stats.invalidations,
+        size=stats.size,
+        maxsize=stats.maxsize,
+        ttl_seconds=stats.ttl_seconds,
+    )
+
+
+def list_pool_stats() -> dict[str, PoolStatsRead]:
+    return {name: _serialize_pool(stats) for name, stats in pool_stats().items()}
+
+
+def _serialize_pool(stats: PoolStats) -> PoolStatsRead:
+    return PoolStatsRead(
+        size=stats.size,
+        max_overflow=stats.max_overflow,
+        checked_out=stats.checked_out,
+        idle=stats.idle,
+        overflow=stats.overflow,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        wait_avg_ms=stats.wait_avg_seconds * 1000,
+        wait_max_ms=stats.wait_max_seconds * 1000,
+    )
+
+
+def list_index_audit_findings() -> list[IndexAuditFindingRead]:
+    return [
+        IndexAuditFindingRead(
+            table=finding.table, filter=finding.filter, statement=finding.statement
+        )
+        for finding in index_audit_findings()
+    ]
+
+
+__all__ = ["list_cache_stats", "list_index_audit_findings", "list_pool_stats"]
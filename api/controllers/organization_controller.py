@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from core.security import PasswordHasherBusyError
 from models.organization import Organization
 from schemas.organization import (
     HelpType as HelpTypeEnum,
@@ -35,15 +36,24 @@ def create_organization(payload: OrganizationCreate, db: Session) -> Organizatio
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         )
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de cadastro ocupado. Tente novamente em instantes.",
+            headers={"Retry-After": "1"},
+        )
 
-    return _serialize(organization)
+    return _serialize(organization, service.help_type_keys(db, organization))
 
 
 def list_organizations(
     db: Session, *, skip: int = 0, limit: int = 50
 ) -> list[OrganizationRead]:
     organizations = service.list_organizations(db, skip=skip, limit=limit)
-    return [_serialize(organization) for organization in organizations]
+    return [
+        _serialize(organization, service.help_type_keys(db, organization))
+        for organization in organizations
+    ]
 
 
 def search_organizations(
@@ -52,6 +62,7 @@ def search_organizations(
     skip: int = 0,
     limit: int = 50,
     name: str | None = None,
+    fuzzy: bool = False,
     help_types: list[HelpTypeEnum] | None = None,
     latitude: float | None = None,
     longitude: float | None = None,
@@ -62,14 +73,20 @@ def search_organizations(
         skip=skip,
         limit=limit,
         name=name,
+        fuzzy=fuzzy,
         help_types=help_types,
         latitude=latitude,
         longitude=longitude,
         radius_km=radius_km,
     )
     return [
-        _serialize_search(organization, distance, dogs_count, cats_count)
-        for organization, distance, dogs_count, cats_count in results
+        _serialize_search(
+            organization,
+            service.help_type_keys(db, organization),
+            distance,
+            species_counts,
+        )
+        for organization, distance, species_counts in results
     ]
 
 
@@ -81,10 +98,12 @@ def get_organization(organization_id: UUID, db: Session) -> OrganizationRead:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="ONG não encontrada.",
         )
-    return _serialize(organization)
+    return _serialize(organization, service.help_type_keys(db, organization))
 
 
-def _serialize(organization: Organization) -> OrganizationRead:
+def _serialize(
+    organization: Organization, help_type_keys: list[str]
+) -> OrganizationRead:
     return OrganizationRead(
         id=organization.id,
         name=organization.name,
@@ -97,7 +116,7 @@ def _serialize(organization: Organization) -> OrganizationRead:
         website=organization.website,
         instagram=organization.instagram,
         mission=organization.mission,
-        help_types=[HelpTypeEnum(help_type.key) for help_type in organization.help_types],
+        help_types=[HelpTypeEnum(key) for key in help_type_keys],
         logo_url=organization.logo_url,
         accepts_terms=organization.accepts_terms,
         latitude=_to_float(organization.latitude),
@@ -109,15 +128,16 @@ def _serialize(organization: Organization) -> OrganizationRead:
 
 def _serialize_search(
     organization: Organization,
+    help_type_keys: list[str],
     distance_km: float | None,
-    dogs_count: int,
-    cats_count: int,
+    species_counts: dict[str, int],
 ) -> OrganizationSearchRead:
     return OrganizationSearchRead(
-        **_serialize(organization).model_dump(),
+        **_serialize(organization, help_type_keys).model_dump(),
         distance_km=_to_float(distance_km),
-        dogs_count=dogs_count,
-        cats_count=cats_count,
+        dogs_count=species_counts.get("dog", 0),
+        cats_count=species_counts.get("cat", 0),
+        species_counts=species_counts,
     )
 
 
@@ -0,0 +1,44 @@
+"""Reconstrução dos agregados de adoção por ONG.
+
+Para backfills, correções manuais em ``adoptions`` ou se os agregados
+divergirem. Sem argumentos recalcula todas as ONGs.
+
+Uso (a partir de ``api/``)::
+
+    python -m core.adoption_stats [organization_id ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+from uuid import UUID
+
+from db.session import SessionLocal
+from repositories.organization_adoption_stat_repository import (
+    OrganizationAdoptionStatRepository,
+)
+
+
+def rebuild_adoption_stats(organization_ids: list[UUID] | None = None) -> int:
+    """Recalcula e grava os agregados em uma única transação."""
+    with SessionLocal() as db:
+        try:
+            count = OrganizationAdoptionStatRepository().rebuild(db, organization_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("organization_ids", nargs="*", type=UUID)
+    args = parser.parse_args()
+
+    count = rebuild_adoption_stats(args.organization_ids or None)
+    print(f"agregados de adoção recalculados para {count} ONG(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    maxsize: int
+    ttl_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Cache em memória com expiração por tempo e descarte LRU.
+
+    Seguro para uso entre as threads do worker; não é compartilhado entre
+    processos, então cada worker mantém a própria cópia.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            expires_at, value = entry  # type: ignore[misc]
+            if expires_at <= now:
+                del self._data[key]
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V, *, ttl_seconds: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        with self._lock:
+            removed = self._data.pop(key, _MISSING) is not _MISSING
+            if removed:
+                self._invalidations += 1
+            return removed
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._data),
+                maxsize=self.maxsize,
+                ttl_seconds=self.ttl_seconds,
+            )
+
+
+_registry: dict[str, TTLCache] = {}
+
+
+def register_cache(name: str, cache: TTLCache[K, V]) -> TTLCache[K, V]:
+    """Registra o cache para que suas métricas sejam expostas."""
+    _registry[name] = cache
+    return cache
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+__all__ = ["CacheStats", "TTLCache", "cache_stats", "register_cache"]
@@ -17,6 +17,131 @@ class Settings(BaseSettings):
     database_url: str = Field(
         "sqlite:///./app.db", alias="DATABASE_URL", description="SQLAlchemy database URL"
     )
+    database_async: bool = Field(
+        False,
+        alias="DATABASE_ASYNC",
+        description=(
+            "Atende as rotas de leitura (públicas e da ONG autenticada, incluindo "
+            "a autenticação) com AsyncEngine (psycopg async) em vez do threadpool; "
+            "as escritas seguem síncronas."
+        ),
+    )
+    database_replica_urls: list[str] = Field(
+        default_factory=list,
+        alias="DATABASE_REPLICA_URLS",
+        description=(
+            "Réplicas de leitura usadas pelas rotas públicas de consulta, em "
+            "rodízio; sem réplicas saudáveis as leituras vão para DATABASE_URL."
+        ),
+    )
+    replica_health_check_seconds: float = Field(
+        5.0,
+        alias="REPLICA_HEALTH_CHECK_SECONDS",
+        gt=0,
+        description="Intervalo entre as verificações de saúde das réplicas.",
+    )
+    read_your_writes_seconds: float = Field(
+        10.0,
+        alias="READ_YOUR_WRITES_SECONDS",
+        ge=0,
+        description=(
+            "Após uma escrita, as leituras da mesma ONG ficam no primário por este "
+            "tempo para não verem dados atrasados da réplica. O registro fica na "
+            "memória de cada worker e só vale para o worker que recebeu a escrita; "
+            "no mesmo período, buscas lidas de réplicas não entram no cache."
+        ),
+    )
+    db_pool_size: int = Field(
+        5,
+        alias="DB_POOL_SIZE",
+        ge=1,
+        description="Conexões mantidas abertas no pool de cada worker.",
+    )
+    db_max_overflow: int = Field(
+        10,
+        alias="DB_MAX_OVERFLOW",
+        ge=0,
+        description="Conexões extras abertas sob pico e fechadas ao serem devolvidas.",
+    )
+    db_pool_timeout_seconds: float = Field(
+        30.0,
+        alias="DB_POOL_TIMEOUT_SECONDS",
+        gt=0,
+        description="Espera máxima por uma conexão livre antes de falhar o checkout.",
+    )
+    db_pool_recycle_seconds: int = Field(
+        1800,
+        alias="DB_POOL_RECYCLE_SECONDS",
+        ge=-1,
+        description=(
+            "Idade máxima de uma conexão antes de ser reaberta no checkout "
+            "(-1 desativa)."
+        ),
+    )
+    db_pool_pre_ping: bool = Field(
+        True,
+        alias="DB_POOL_PRE_PING",
+        description=(
+            "Testa a conexão com um round trip a cada checkout. Desligado, conexões "
+            "mortas só são descartadas pelo recycle ou ao falhar a consulta."
+        ),
+    )
+    db_pgbouncer: bool = Field(
+        False,
+        alias="DB_PGBOUNCER",
+        description=(
+            "Compatibilidade com PgBouncer em modo transaction: desativa prepared "
+            "statements no servidor, que não sobrevivem à troca de backend."
+        ),
+    )
+    db_prepare_threshold: int = Field(
+        2,
+        alias="DB_PREPARE_THRESHOLD",
+        ge=0,
+        description=(
+            "Execuções de uma mesma consulta antes de o psycopg prepará-la no "
+            "servidor (0 prepara já na primeira). Ignorado com DB_PGBOUNCER."
+        ),
+    )
+    metrics_enabled: bool = Field(
+        False,
+        alias="METRICS_ENABLED",
+        description=(
+            "Monta /metrics/caches e /metrics/pool, que não exigem autenticação; "
+            "habilite só em ambientes em que a API não fica exposta publicamente."
+        ),
+    )
+    db_index_audit: bool = Field(
+        False,
+        alias="DB_INDEX_AUDIT",
+        description=(
+            "Desenvolvimento/CI: faz EXPLAIN de cada SELECT distinto e aponta em "
+            "log e em /metrics/index-audit (montada só com esta opção) os filtros "
+            "sem índice que os atenda."
+        ),
+    )
+    openapi_schema_path: str | None = Field(
+        None,
+        alias="OPENAPI_SCHEMA_PATH",
+        description=(
+            "openapi.json gerado no build (python -m core.openapi); servido no "
+            "lugar do schema montado no primeiro acesso à documentação."
+        ),
+    )
+    warmup_enabled: bool = Field(
+        True,
+        alias="WARMUP_ENABLED",
+        description=(
+            "Aquece conexões, statements e catálogos na inicialização; /ready "
+            "responde 503 até o fim do aquecimento."
+        ),
+    )
+    warmup_connections: int = Field(
+        2,
+        alias="WARMUP_CONNECTIONS",
+        ge=0,
+        description="Conexões abertas antecipadamente em cada pool (até DB_POOL_SIZE).",
+    )
     debug: bool = Field(False, alias="DEBUG")
     jwt_secret: str = Field(
         ...,
@@ -35,6 +160,90 @@ class Settings(BaseSettings):
         ge=1,
         description="Access token expiration time in minutes.",
     )
+    search_cache_ttl_seconds: float = Field(
+        30.0,
+        alias="SEARCH_CACHE_TTL_SECONDS",
+        ge=0,
+        description="Tempo de vida das respostas em cache da busca de animais.",
+    )
+    search_cache_max_entries: int = Field(
+        1024,
+        alias="SEARCH_CACHE_MAX_ENTRIES",
+        ge=0,
+        description="Número máximo de buscas mantidas em cache (0 desativa).",
+    )
+    search_cache_cell_degrees: float = Field(
+        0.001,
+        alias="SEARCH_CACHE_CELL_DEGREES",
+        gt=0,
+        description="Tamanho da célula (em graus) usada para quantizar lat/lon da busca.",
+    )
+    dashboard_cache_ttl_seconds: float = Field(
+        300.0,
+        alias="DASHBOARD_CACHE_TTL_SECONDS",
+        ge=0,
+        description=(
+            "Tempo máximo de um retrato do painel em cache; limita a defasagem de "
+            "escritas feitas em outros processos, que não invalidam este worker."
+        ),
+    )
+    dashboard_cache_max_entries: int = Field(
+        1024,
+        alias="DASHBOARD_CACHE_MAX_ENTRIES",
+        ge=0,
+        description="Número máximo de painéis de ONGs mantidos em cache (0 desativa).",
+    )
+    bcrypt_rounds: int = Field(
+        12,
+        alias="BCRYPT_ROUNDS",
+        ge=4,
+        le=31,
+        description=(
+            "Custo do bcrypt para novos hashes. Senhas com outro custo são "
+            "refeitas no próximo login."
+        ),
+    )
+    password_hash_workers: int = Field(
+        2,
+        alias="PASSWORD_HASH_WORKERS",
+        ge=0,
+        description="Processos dedicados ao bcrypt (0 executa na própria thread).",
+    )
+    password_hash_max_pending: int = Field(
+        16,
+        alias="PASSWORD_HASH_MAX_PENDING",
+        ge=0,
+        description=(
+            "Operações de bcrypt aguardando um processo livre antes de responder 503."
+        ),
+    )
+    token_cache_max_entries: int = Field(
+        8192,
+        alias="TOKEN_CACHE_MAX_ENTRIES",
+        ge=0,
+        description="Número máximo de tokens JWT já verificados mantidos em cache (0 desativa).",
+    )
+    principal_cache_ttl_seconds: float = Field(
+        60.0,
+        alias="PRINCIPAL_CACHE_TTL_SECONDS",
+        ge=0,
+        description=(
+            "Tempo máximo que a ONG autenticada fica em cache; limita a defasagem "
+            "de alterações feitas por outros processos."
+        ),
+    )
+    principal_cache_max_entries: int = Field(
+        4096,
+        alias="PRINCIPAL_CACHE_MAX_ENTRIES",
+        ge=0,
+        description="Número máximo de ONGs autenticadas mantidas em cache (0 desativa).",
+    )
+    reference_cache_ttl_seconds: float = Field(
+        3600.0,
+        alias="REFERENCE_CACHE_TTL_SECONDS",
+        ge=0,
+        description="Tempo de vida dos catálogos em cache (tipos de ajuda, espécies).",
+    )
 
     # Pydantic v2 style
     model_config = SettingsConfigDict(
@@ -1,36 +1,130 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from typing import Any
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.config import get_settings
+from core.principal import OrganizationPrincipal, principal_cache
 from core.security import InvalidTokenError, decode_token
-from db.session import get_db
+from db.replicas import track_organization_writes
+from db.session import get_async_db, get_db, open_async_read_db, open_read_db
 from models.organization import Organization
 from repositories.organization_repository import OrganizationRepository
 
+settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/ongs/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/ongs/login", auto_error=False)
 organization_repository = OrganizationRepository()
 
 
 def get_current_organization(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-) -> Organization:
+) -> OrganizationPrincipal:
     """Dependência planejada para proteger rotas com autenticação JWT."""
+    organization_id = _authenticated_organization_id(token)
+    track_organization_writes(db, organization_id)
+    principal = principal_cache.get(organization_id)
+    if principal is not None:
+        return principal
+
+    organization = organization_repository.get_by_id(db, organization_id)
+    return _cache_principal(organization_id, organization)
+
+
+async def get_current_organization_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> OrganizationPrincipal:
+    """Versão assíncrona de ``get_current_organization`` para rotas de leitura."""
+    organization_id = _authenticated_organization_id(token)
+    principal = principal_cache.get(organization_id)
+    if principal is not None:
+        return principal
+
+    organization = await organization_repository.get_by_id_async(db, organization_id)
+    return _cache_principal(organization_id, organization)
+
+
+def _authenticated_organization_id(token: str) -> UUID:
     try:
         payload = decode_token(token)
-        organization_id = UUID(payload.get("sub", ""))
+        return UUID(payload.get("sub", ""))
     except (InvalidTokenError, ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido ou expirado.",
         )
 
-    organization = organization_repository.get_by_id(db, organization_id)
+
+def _cache_principal(
+    organization_id: UUID, organization: Organization | None
+) -> OrganizationPrincipal:
     if organization is None or not organization.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Autenticação necessária.",
         )
-    return organization
+    principal = OrganizationPrincipal.from_organization(organization)
+    principal_cache.set(organization_id, principal)
+    return principal
+
+
+def _token_organization_id(token: str | None) -> UUID | None:
+    if token is None:
+        return None
+    try:
+        return UUID(decode_token(token).get("sub", ""))
+    except (InvalidTokenError, ValueError, TypeError):
+        return None
+
+
+def get_read_db(
+    token: str | None = Depends(optional_oauth2_scheme),
+) -> Generator[Session, None, None]:
+    """Sessão para rotas somente leitura, servida por uma réplica quando possível.
+
+    O token é opcional e serve apenas para manter no primário as leituras de
+    uma ONG que acabou de escrever.
+    """
+    with open_read_db(_token_organization_id(token)) as db:
+        yield db
+
+
+async def get_async_read_db(
+    token: str | None = Depends(optional_oauth2_scheme),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Versão assíncrona de ``get_read_db``."""
+    async with open_async_read_db(_token_organization_id(token)) as db:
+        yield db
+
+
+# Dependências das rotas de leitura atendidas por ``dispatch``: seguem o modo
+# escolhido por DATABASE_ASYNC na importação.
+get_dispatch_db = get_async_db if settings.database_async else get_db
+get_dispatch_read_db = get_async_read_db if settings.database_async else get_read_db
+get_dispatch_organization = (
+    get_current_organization_async
+    if settings.database_async
+    else get_current_organization
+)
+
+
+async def dispatch(
+    sync_handler: Callable[..., Any],
+    async_handler: Callable[..., Awaitable[Any]],
+    db: Session | AsyncSession,
+    **kwargs: Any,
+) -> Any:
+    """Chama o handler assíncrono com DATABASE_ASYNC; sem ele, o síncrono no threadpool.
+
+    ``db`` deve vir de ``get_dispatch_db`` ou ``get_dispatch_read_db``.
+    """
+    if settings.database_async:
+        return await async_handler(db=db, **kwargs)
+    return await run_in_threadpool(sync_handler, db=db, **kwargs)
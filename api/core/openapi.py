@@ -0,0 +1,47 @@
+"""Schema OpenAPI gerado no build.
+
+O FastAPI monta o schema percorrendo todas as rotas e modelos no primeiro
+acesso a ``/openapi.json`` ou ``/docs``. Com ``OPENAPI_SCHEMA_PATH`` o worker
+carrega o arquivo gerado ahead-of-time em vez disso.
+
+Gerar (a partir de ``api/``)::
+
+    python -m core.openapi openapi.json
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+def use_prebuilt_openapi(app: FastAPI, path: str) -> bool:
+    """Passa a servir o schema do arquivo; sem o arquivo, mantém a geração."""
+    schema_path = Path(path)
+    if not schema_path.is_file():
+        logger.warning(
+            "OPENAPI_SCHEMA_PATH=%s não encontrado; o schema será gerado sob demanda.",
+            path,
+        )
+        return False
+    app.openapi_schema = json.loads(schema_path.read_bytes())
+    return True
+
+
+def export_openapi(app: FastAPI, path: str) -> None:
+    Path(path).write_text(
+        json.dumps(app.openapi(), ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+
+if __name__ == "__main__":
+    from main import app
+
+    export_openapi(app, sys.argv[1] if len(sys.argv) > 1 else "openapi.json")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Generic, Sequence, TypeVar
+from uuid import UUID
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """Página de resultados com o cursor para a próxima consulta."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    """Serialize the sort key of the last row into an opaque cursor."""
+    payload = json.dumps([_dump(value) for value in values], separators=(",", ":"))
+    token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+    return token.rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """Decode a cursor produced by ``encode_cursor`` using the expected types."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Cursor de paginação inválido.") from exc
+
+    if not isinstance(raw, list) or len(raw) != len(types):
+        raise InvalidCursorError("Cursor de paginação inválido.")
+
+    try:
+        return tuple(_load(value, type_) for value, type_ in zip(raw, types))
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorError("Cursor de paginação inválido.") from exc
+
+
+def _dump(value: object) -> object:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _load(value: object, type_: type) -> Any:
+    if value is None:
+        return None
+    if type_ is datetime:
+        return datetime.fromisoformat(str(value))
+    if type_ is date:
+        return date.fromisoformat(str(value))
+    if type_ is UUID:
+        return UUID(str(value))
+    if type_ is float:
+        return float(value)  # type: ignore[arg-type]
+    if type_ is int:
+        return int(value)  # type: ignore[arg-type]
+    return type_(value)
+
+
+__all__ = [
+    "NEXT_CURSOR_HEADER",
+    "InvalidCursorError",
+    "Page",
+    "decode_cursor",
+    "encode_cursor",
+]
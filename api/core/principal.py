@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from core.cache import TTLCache, register_cache
+from core.config import get_settings
+from models.organization import Organization
+
+
+@dataclass(frozen=True, slots=True)
+class OrganizationPrincipal:
+    """Retrato imutável da ONG autenticada, usado pelas rotas protegidas."""
+
+    id: UUID
+    name: str
+    email: str
+    latitude: float | None = None
+    longitude: float | None = None
+
+    @classmethod
+    def from_organization(cls, organization: Organization) -> OrganizationPrincipal:
+        return cls(
+            id=organization.id,
+            name=organization.name,
+            email=organization.email,
+            latitude=organization.latitude,
+            longitude=organization.longitude,
+        )
+
+
+settings = get_settings()
+# Só ONGs ativas entram no cache; o TTL limita por quanto tempo uma
+# desativação feita fora deste processo pode passar despercebida.
+principal_cache: TTLCache[UUID, OrganizationPrincipal] = register_cache(
+    "principals",
+    TTLCache(
+        maxsize=settings.principal_cache_max_entries,
+        ttl_seconds=settings.principal_cache_ttl_seconds,
+    ),
+)
+_PENDING_KEY = "principal_organizations"
+
+
+def invalidate_principal(organization_id: UUID) -> None:
+    """Descarta o retrato em cache para que a próxima requisição releia a ONG."""
+    principal_cache.invalidate(organization_id)
+
+
+@event.listens_for(Organization, "after_update")
+@event.listens_for(Organization, "after_delete")
+def _mark_pending(_mapper: Any, _connection: Any, target: Organization) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+# Invalida só após o commit: no flush, outra requisição ainda leria a ONG sem
+# a alteração e guardaria o retrato antigo de novo.
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for organization_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_principal(organization_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = [
+    "OrganizationPrincipal",
+    "invalidate_principal",
+    "principal_cache",
+]
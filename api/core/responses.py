@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    """Resposta JSON serializada diretamente pelo pydantic-core.
+
+    Aceita dicionários e listas com UUID, datetime, Decimal e enums sem
+    passar por ``jsonable_encoder``. Quando uma rota retorna esta resposta,
+    o FastAPI não revalida o conteúdo contra o ``response_model``: quem a
+    monta é responsável por produzir dados já no formato do schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+__all__ = ["PydanticJSONResponse"]
@@ -1,23 +1,111 @@
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping, TypeVar
 from uuid import UUID
 
 from jose import JWTError, jwt
 import bcrypt
 
+from core.cache import TTLCache, register_cache
 from core.config import get_settings
 
+_settings = get_settings()
+# Tokens já verificados, indexados pelo SHA-256; cada entrada vale até o exp.
+verified_token_cache: TTLCache[bytes, Dict[str, Any]] = register_cache(
+    "verified_tokens",
+    TTLCache(
+        maxsize=_settings.token_cache_max_entries,
+        ttl_seconds=_settings.access_token_expire_minutes * 60.0,
+    ),
+)
+
+
+T = TypeVar("T")
+
+
 class InvalidTokenError(Exception):
     """Raised when a JWT token cannot be validated."""
 
 
+class PasswordHasherBusyError(Exception):
+    """Raised when every bcrypt worker and queue slot is already taken."""
+
+
+def _hash_password(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _check_password(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+class PasswordHasher:
+    """Executa o bcrypt em um pool de processos com fila limitada.
+
+    Mantém as threads do servidor livres do custo de CPU do bcrypt. Quando
+    os processos e a fila estão ocupados, falha na hora com
+    ``PasswordHasherBusyError`` em vez de acumular requisições.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + max_pending)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusyError
+        try:
+            if self.workers == 0:
+                return fn(*args)
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def start(self) -> None:
+        """Sobe os processos antecipadamente, evitando o custo no primeiro login."""
+        if self.workers:
+            executor = self._get_executor()
+            futures = [executor.submit(int, 0) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: não herda as threads e conexões do processo do servidor.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+password_hasher = PasswordHasher(
+    workers=_settings.password_hash_workers,
+    max_pending=_settings.password_hash_max_pending,
+)
+
+
 def get_password_hash(password: str) -> str:
-    """Generate a password hash using bcrypt."""
-    hashed = bcrypt.hashpw(
+    """Generate a password hash using bcrypt with the configured cost."""
+    hashed = password_hasher.run(
+        _hash_password,
         password.encode("utf-8"),
-        bcrypt.gensalt(),
+        get_settings().bcrypt_rounds,
     )
     return hashed.decode("utf-8")
 
@@ -29,12 +117,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     else:
         hashed_bytes = hashed_password
 
-    return bcrypt.checkpw(
+    return password_hasher.run(
+        _check_password,
         plain_password.encode("utf-8"),
         hashed_bytes,
     )
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Tell whether the stored hash was created with a different bcrypt cost."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != get_settings().bcrypt_rounds
+
+
 def create_access_token(
     *,
     subject: str | UUID,
@@ -59,7 +157,16 @@ def create_access_token(
 
 
 def decode_token(token: str) -> Dict[str, Any]:
-    """Decode and validate a JWT token, returning its payload."""
+    """Decode and validate a JWT token, returning its payload.
+
+    The signature is checked once per token; later calls reuse the cached
+    claims until the token's ``exp``.
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = verified_token_cache.get(digest)
+    if cached is not None:
+        return dict(cached)
+
     settings = get_settings()
     try:
         payload = jwt.decode(
@@ -69,4 +176,10 @@ def decode_token(token: str) -> Dict[str, Any]:
         )
     except JWTError as exc:
         raise InvalidTokenError("Token inválido ou expirado.") from exc
+
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        remaining = expires_at - time.time()
+        if remaining > 0:
+            verified_token_cache.set(digest, dict(payload), ttl_seconds=remaining)
     return payload
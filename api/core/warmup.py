@@ -0,0 +1,194 @@
+"""Aquecimento do worker antes de ele ser reportado como pronto.
+
+Abre conexões dos pools, executa uma vez as consultas quentes (o que compila
+e guarda o SQL no cache de cada engine e configura os mappers), carrega os
+catálogos de referência e sobe os processos do bcrypt. Cada etapa é de melhor
+esforço: uma falha é registrada no log e não impede o worker de ficar pronto.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, configure_mappers
+
+from core.config import get_settings
+from core.security import password_hasher
+from db import session as db_session
+from repositories.animal_repository import AnimalRepository
+from repositories.animal_search_document_repository import (
+    AnimalSearchDocumentRepository,
+)
+from repositories.dashboard_repository import DashboardRepository
+from repositories.organization_repository import OrganizationRepository
+from services.animal_service import AnimalService
+from services.organization_service import OrganizationService
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+_ready = False
+
+
+def is_ready() -> bool:
+    return _ready
+
+
+def mark_ready() -> None:
+    global _ready
+    _ready = True
+
+
+def _step(name: str, action: Callable[[], object]) -> None:
+    try:
+        action()
+    except Exception:  # noqa: BLE001 - o aquecimento nunca derruba o worker
+        logger.warning("Aquecimento: etapa %s falhou.", name, exc_info=True)
+
+
+def _open_connections(engine: Engine, count: int) -> None:
+    """Abre ``count`` conexões ao mesmo tempo e as devolve ao pool."""
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _fetch_headline_metrics(db: Session, organization_id: UUID) -> None:
+    # Direto no repositório: pelo serviço, o retrato vazio da ONG sorteada
+    # iria para o cache do painel.
+    now = datetime.now(timezone.utc)
+    DashboardRepository().fetch_headline_metrics(
+        db,
+        organization_id,
+        current_start=now,
+        current_end=now,
+        previous_start=now,
+        previous_end=now,
+    )
+
+
+def _run_hot_queries(db: Session) -> None:
+    probe_id = uuid4()
+    search_repository = AnimalSearchDocumentRepository()
+    for name, action in (
+        ("animal.get_by_id", lambda: AnimalRepository().get_by_id(db, probe_id)),
+        (
+            "organization.get_by_id",
+            lambda: OrganizationRepository().get_by_id(db, probe_id),
+        ),
+        (
+            "search_available",
+            lambda: search_repository.search_available(
+                db, latitude=0.0, longitude=0.0, radius_km=1.0, limit=1
+            ),
+        ),
+        (
+            "search_available (detalhado)",
+            lambda: search_repository.search_available(
+                db, latitude=0.0, longitude=0.0, radius_km=1.0, limit=1, detailed=True
+            ),
+        ),
+        (
+            "count_facets",
+            lambda: search_repository.count_facets(
+                db, latitude=0.0, longitude=0.0, radius_km=1.0
+            ),
+        ),
+        ("dashboard", lambda: _fetch_headline_metrics(db, probe_id)),
+    ):
+        _step(name, action)
+        db.rollback()
+
+
+def _warm_up_engine(engine: Engine, open_session: Callable[[], Session]) -> None:
+    _step("conexões", lambda: _open_connections(engine, _connection_count()))
+    with open_session() as db:
+        _run_hot_queries(db)
+
+
+def _connection_count() -> int:
+    return min(settings.warmup_connections, settings.db_pool_size)
+
+
+def warm_up_sync() -> None:
+    _step("mappers", configure_mappers)
+    _warm_up_engine(db_session.engine, db_session.SessionLocal)
+    for replica in db_session.replica_engines:
+        _warm_up_engine(
+            replica,
+            lambda replica=replica: db_session.ReplicaSessionLocal(bind=replica),
+        )
+
+    with db_session.SessionLocal() as db:
+        _step("tipos de ajuda", lambda: OrganizationService().help_type_catalog(db))
+        _step("espécies", lambda: AnimalService().list_species(db))
+    _step("bcrypt", password_hasher.start)
+
+
+async def _open_async_connections(engine: AsyncEngine, count: int) -> None:
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
+async def warm_up_async(
+    engine: AsyncEngine, open_session: Callable[[], AsyncSession]
+) -> None:
+    try:
+        await _open_async_connections(engine, _connection_count())
+        search_repository = AnimalSearchDocumentRepository()
+        async with open_session() as db:
+            await search_repository.search_available_async(
+                db, latitude=0.0, longitude=0.0, radius_km=1.0, limit=1
+            )
+            await search_repository.search_available_async(
+                db,
+                latitude=0.0,
+                longitude=0.0,
+                radius_km=1.0,
+                limit=1,
+                detailed=True,
+            )
+            await search_repository.count_facets_async(
+                db, latitude=0.0, longitude=0.0, radius_km=1.0
+            )
+    except Exception:  # noqa: BLE001 - o aquecimento nunca derruba o worker
+        logger.warning("Aquecimento: engine assíncrono falhou.", exc_info=True)
+
+
+async def warm_up() -> None:
+    """Executa o aquecimento completo e marca o worker como pronto."""
+    started = time.perf_counter()
+    try:
+        await asyncio.to_thread(warm_up_sync)
+        if db_session.async_engine is not None:
+            await warm_up_async(db_session.async_engine, db_session.AsyncSessionLocal)
+            for replica in db_session.async_replica_engines:
+                await warm_up_async(
+                    replica,
+                    lambda replica=replica: db_session.AsyncReplicaSessionLocal(
+                        bind=replica
+                    ),
+                )
+    finally:
+        mark_ready()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info("Aquecimento concluído em %.0f ms.", elapsed_ms)
+
+
+__all__ = ["is_ready", "mark_ready", "warm_up"]
@@ -0,0 +1,109 @@
+"""Auditoria de índices das consultas emitidas pela aplicação.
+
+Com ``DB_INDEX_AUDIT`` ligado, cada SELECT distinto recebe um ``EXPLAIN``
+com ``enable_seqscan`` desligado. Nessa condição o planejador só mantém um
+``Seq Scan`` com filtro quando nenhum índice atende o predicado; esses casos
+são registrados em log e expostos em ``/metrics/index-audit``.
+
+Custa um EXPLAIN por consulta distinta: pensado para desenvolvimento e CI
+(exercitando a API ou os benchmarks), não para produção.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+_SAVEPOINT = "index_audit"
+
+
+@dataclass(frozen=True, slots=True)
+class IndexAuditFinding:
+    table: str
+    filter: str
+    statement: str
+
+
+_lock = threading.Lock()
+_audited: set[str] = set()
+_findings: dict[tuple[str, str], IndexAuditFinding] = {}
+
+
+def install_index_audit(engine: Engine) -> None:
+    """Audita os SELECTs executados pela engine (somente PostgreSQL)."""
+    if engine.dialect.name == "postgresql":
+        event.listen(engine, "after_cursor_execute", _audit)
+
+
+def index_audit_findings() -> list[IndexAuditFinding]:
+    with _lock:
+        return list(_findings.values())
+
+
+def _audit(
+    conn: Connection,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    _context: Any,
+    executemany: bool,
+) -> None:
+    if executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return
+    with _lock:
+        if statement in _audited:
+            return
+        _audited.add(statement)
+
+    # SET LOCAL dentro de um savepoint desfeito logo em seguida: a transação
+    # da requisição continua com o planejador padrão e intacta se o EXPLAIN falhar.
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_SAVEPOINT}")
+        try:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+            cursor.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+    except Exception:
+        logger.debug("EXPLAIN da auditoria de índices falhou", exc_info=True)
+        return
+    finally:
+        cursor.close()
+
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    for node in _walk(plan[0]["Plan"]):
+        if node.get("Node Type") != "Seq Scan" or "Filter" not in node:
+            continue
+        finding = IndexAuditFinding(
+            table=node["Relation Name"], filter=node["Filter"], statement=statement
+        )
+        with _lock:
+            if (finding.table, finding.filter) in _findings:
+                continue
+            _findings[(finding.table, finding.filter)] = finding
+        logger.warning(
+            "Consulta sem índice para o filtro %s em %s: %s",
+            finding.filter,
+            finding.table,
+            statement,
+        )
+
+
+def _walk(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+__all__ = ["IndexAuditFinding", "index_audit_findings", "install_index_audit"]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_total_seconds: float
+    wait_max_seconds: float
+
+    @property
+    def wait_avg_seconds(self) -> float:
+        return self.wait_total_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class _WaitTimer:
+    """Acumula o tempo que os checkouts esperaram por uma conexão livre."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, *, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+
+
+class _TimedCheckoutMixin:
+    """Mede o tempo até o pool entregar uma conexão (espera + eventual abertura)."""
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.wait_timer = _WaitTimer()
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.wait_timer.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_timer.record(time.perf_counter() - started, timed_out=False)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """``QueuePool`` que mede a espera de cada checkout."""
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` que mede a espera de cada checkout."""
+
+
+_registry: dict[str, Engine] = {}
+
+
+def register_engine(name: str, engine: Engine) -> Engine:
+    """Registra o engine para que as métricas do pool sejam expostas."""
+    _registry[name] = engine
+    return engine
+
+
+def _stats(pool: Pool) -> PoolStats:
+    timer = getattr(pool, "wait_timer", None) or _WaitTimer()
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        checked_out = pool.checkedout()
+        idle = pool.checkedin()
+        overflow = max(pool.overflow(), 0)
+        max_overflow = pool._max_overflow
+    else:
+        size = checked_out = idle = overflow = max_overflow = 0
+    return PoolStats(
+        size=size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        idle=idle,
+        overflow=overflow,
+        checkouts=timer.checkouts,
+        timeouts=timer.timeouts,
+        wait_total_seconds=timer.wait_total,
+        wait_max_seconds=timer.wait_max,
+    )
+
+
+def pool_stats() -> dict[str, PoolStats]:
+    return {name: _stats(engine.pool) for name, engine in _registry.items()}
+
+
+__all__ = [
+    "PoolStats",
+    "TimedAsyncQueuePool",
+    "TimedQueuePool",
+    "pool_stats",
+    "register_engine",
+]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from core.cache import TTLCache, register_cache
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_settings = get_settings()
+# ONGs que escreveram há pouco; suas leituras ficam no primário até expirar.
+# Fica na memória do worker, como os demais caches: só as requisições
+# atendidas pelo worker que confirmou a escrita são desviadas ao primário.
+recent_writers: TTLCache[UUID, bool] = register_cache(
+    "recent_writers",
+    TTLCache(maxsize=4096, ttl_seconds=_settings.read_your_writes_seconds),
+)
+# Momento (time.monotonic) da última escrita confirmada neste worker.
+_last_write_at = float("-inf")
+
+
+class ReplicaSet:
+    """Escolhe réplicas de leitura saudáveis em rodízio.
+
+    Uma thread verifica cada réplica periodicamente com ``SELECT 1``; falhas
+    observadas pelas requisições também a retiram do rodízio até a próxima
+    verificação bem-sucedida.
+    """
+
+    def __init__(self, engines: list[Engine], *, check_interval: float) -> None:
+        self.engines = engines
+        self.check_interval = check_interval
+        self._healthy = [True] * len(engines)
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def choose(self) -> int | None:
+        """Retorna o índice da próxima réplica saudável ou ``None``."""
+        healthy = [index for index, ok in enumerate(self._healthy) if ok]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_down(self, index: int) -> None:
+        if self._healthy[index]:
+            logger.warning(
+                "Réplica %d indisponível; leituras seguem no primário.", index + 1
+            )
+        self._healthy[index] = False
+
+    def check(self) -> None:
+        for index, engine in enumerate(self.engines):
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            except Exception:  # noqa: BLE001 - qualquer falha tira a réplica do rodízio
+                self.mark_down(index)
+            else:
+                self._healthy[index] = True
+
+    def start(self) -> None:
+        if not self.engines or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="replica-health", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            self.check()
+
+
+def replica_may_lag(session: Session | AsyncSession) -> bool:
+    """Indica se a sessão lê de uma réplica que pode não ter a última escrita.
+
+    Vale durante READ_YOUR_WRITES_SECONDS após qualquer escrita confirmada
+    neste worker. Resultados lidos assim não devem ir para caches
+    compartilhados: a invalidação da escrita já passou e a cópia atrasada
+    ficaria até o TTL.
+    """
+    if not session.info.get("replica"):
+        return False
+    return time.monotonic() - _last_write_at < _settings.read_your_writes_seconds
+
+
+def track_organization_writes(session: Session, organization_id: UUID) -> None:
+    """Associa a sessão à ONG para registrar suas escritas ao confirmar."""
+    session.info["organization_id"] = organization_id
+
+
+def install_write_tracking(factory: sessionmaker) -> None:
+    """Registra em ``recent_writers`` as ONGs que confirmaram escritas."""
+    event.listen(factory, "after_flush", _after_flush)
+    event.listen(factory, "do_orm_execute", _on_execute)
+    event.listen(factory, "after_commit", _after_commit)
+    event.listen(factory, "after_rollback", _after_rollback)
+
+
+def _after_flush(session: Session, _flush_context: object) -> None:
+    session.info["wrote"] = True
+
+
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["wrote"] = True
+
+
+def _after_commit(session: Session) -> None:
+    global _last_write_at
+    if not session.info.pop("wrote", False):
+        return
+    _last_write_at = time.monotonic()
+    organization_id = session.info.get("organization_id")
+    if organization_id is not None:
+        recent_writers.set(organization_id, True)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop("wrote", None)
+
+
+__all__ = [
+    "ReplicaSet",
+    "install_write_tracking",
+    "recent_writers",
+    "replica_may_lag",
+    "track_organization_writes",
+]
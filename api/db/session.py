@@ -1,23 +1,107 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
+from uuid import UUID
 
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from core.config import get_settings
+from db.index_audit import install_index_audit
+from db.pool import TimedAsyncQueuePool, TimedQueuePool, register_engine
+from db.replicas import ReplicaSet, install_write_tracking, recent_writers
 
 settings = get_settings()
 
 connect_args: dict[str, Any] = {}
 if settings.database_url.startswith("sqlite"):
     connect_args["check_same_thread"] = False
+elif settings.db_pgbouncer:
+    # PgBouncer (transaction) pode trocar o backend entre transações; prepared
+    # statements criados pelo psycopg em uma conexão não existiriam na outra.
+    connect_args["prepare_threshold"] = None
+else:
+    # O SQL gerado pelos statements em cache é idêntico entre chamadas, então o
+    # psycopg reaproveita o plano preparado por conexão.
+    connect_args["prepare_threshold"] = settings.db_prepare_threshold
+
+pool_options: dict[str, Any] = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout_seconds,
+    "pool_recycle": settings.db_pool_recycle_seconds,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
 
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    poolclass=TimedQueuePool,
     connect_args=connect_args,
+    **pool_options,
 )
+register_engine("primary", engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+install_write_tracking(SessionLocal)
+
+replica_engines = [
+    register_engine(
+        f"replica_{number}",
+        create_engine(
+            url,
+            poolclass=TimedQueuePool,
+            connect_args=connect_args,
+            **pool_options,
+        ),
+    )
+    for number, url in enumerate(settings.database_replica_urls, start=1)
+]
+replica_set = ReplicaSet(
+    replica_engines, check_interval=settings.replica_health_check_seconds
+)
+ReplicaSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, info={"replica": True}
+)
+if settings.db_index_audit:
+    for audited_engine in (engine, *replica_engines):
+        install_index_audit(audited_engine)
+
+# Com DATABASE_ASYNC, "postgresql+psycopg://" usa o driver assíncrono do psycopg.
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+async_replica_engines: list[AsyncEngine] = []
+AsyncReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_async:
+    async_engine = create_async_engine(
+        settings.database_url,
+        poolclass=TimedAsyncQueuePool,
+        connect_args=connect_args,
+        **pool_options,
+    )
+    register_engine("primary_async", async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    async_replica_engines = [
+        create_async_engine(
+            url,
+            poolclass=TimedAsyncQueuePool,
+            connect_args=connect_args,
+            **pool_options,
+        )
+        for url in settings.database_replica_urls
+    ]
+    for number, replica in enumerate(async_replica_engines, start=1):
+        register_engine(f"replica_{number}_async", replica.sync_engine)
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        autoflush=False, expire_on_commit=False, info={"replica": True}
+    )
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -27,3 +111,74 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields an async database session."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DATABASE_ASYNC is disabled.")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _reads_from_primary(organization_id: UUID | None) -> bool:
+    if organization_id is None:
+        return False
+    return recent_writers.get(organization_id) is not None
+
+
+@contextmanager
+def open_read_db(organization_id: UUID | None) -> Iterator[Session]:
+    """Yield a session on a healthy replica, falling back to the primary.
+
+    Organizations that committed a write in the last READ_YOUR_WRITES_SECONDS
+    read from the primary so they never see their own changes missing. The
+    list of recent writers lives in each worker's memory, so this only holds
+    for requests served by the worker that took the write.
+    """
+    if not _reads_from_primary(organization_id):
+        while (index := replica_set.choose()) is not None:
+            db = ReplicaSessionLocal(bind=replica_engines[index])
+            try:
+                db.connection()
+            except OperationalError:
+                db.close()
+                replica_set.mark_down(index)
+                continue
+            try:
+                yield db
+            finally:
+                db.close()
+            return
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def open_async_read_db(
+    organization_id: UUID | None,
+) -> AsyncIterator[AsyncSession]:
+    """Async counterpart of ``open_read_db``."""
+    if AsyncReplicaSessionLocal is not None and not _reads_from_primary(
+        organization_id
+    ):
+        while (index := replica_set.choose()) is not None:
+            db = AsyncReplicaSessionLocal(bind=async_replica_engines[index])
+            try:
+                await db.connection()
+            except OperationalError:
+                await db.close()
+                replica_set.mark_down(index)
+                continue
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DATABASE_ASYNC is disabled.")
+    async with AsyncSessionLocal() as db:
+        yield db
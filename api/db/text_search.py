@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, func, literal, or_
+
+
+def contains_pattern(term: str) -> str:
+    """Monta o padrão ``%termo%`` escapando os curingas digitados pelo usuário."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def name_matches(
+    column: ColumnElement[str], term: str, *, fuzzy: bool = False
+) -> ColumnElement[bool]:
+    """Filtro por trecho do nome, atendido pelos índices GIN ``gin_trgm_ops``.
+
+    Com ``fuzzy``, também aceita nomes com alguma palavra parecida com o
+    termo (``<%`` do pg_trgm), tolerando erros de digitação.
+    """
+    condition = column.ilike(contains_pattern(term), escape="\\")
+    if fuzzy:
+        condition = or_(condition, literal(term).op("<%")(column))
+    return condition
+
+
+def name_similarity(column: ColumnElement[str], term: str) -> ColumnElement[float]:
+    """Grau de semelhança entre o termo e a palavra mais próxima do nome."""
+    return func.word_similarity(term, column)
+
+
+__all__ = ["contains_pattern", "name_matches", "name_similarity"]
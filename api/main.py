@@ -1,14 +1,40 @@
-from fastapi import FastAPI
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from core.config import get_settings
+from core.openapi import use_prebuilt_openapi
+from core.pagination import NEXT_CURSOR_HEADER
+from core.security import password_hasher
+from core.warmup import is_ready, mark_ready, warm_up
+from db.session import replica_set
 from routers import api_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    replica_set.start()
+    # Em segundo plano: /health já responde enquanto /ready espera o aquecimento.
+    warmup_task = asyncio.create_task(warm_up()) if settings.warmup_enabled else None
+    if warmup_task is None:
+        mark_ready()
+    yield
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    replica_set.shutdown()
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -17,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router)
@@ -32,3 +59,18 @@ def read_root():
 def health_check():
     """Verifica se a aplicação está funcionando."""
     return {"status": "ok"}
+
+
+@app.get("/ready", tags=["Health Check"])
+def readiness_check():
+    """Indica se o worker terminou o aquecimento e pode receber tráfego."""
+    if not is_ready():
+        return JSONResponse(
+            {"status": "warming_up"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return {"status": "ready"}
+
+
+if settings.openapi_schema_path:
+    use_prebuilt_openapi(app, settings.openapi_schema_path)
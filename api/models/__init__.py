@@ -1,24 +1,32 @@
 from models.adoption import Adoption
 from models.animal import Animal, AnimalSex, AnimalSize, AnimalStatus
 from models.animal_photo import AnimalPhoto
+from models.animal_search_document import AnimalSearchDocument
 from models.animal_species import AnimalSpecies
 from models.expense import Expense
 from models.expense_attachment import ExpenseAttachment
 from models.expense_category import ExpenseCategory
+from models.expense_monthly_rollup import ExpenseMonthlyRollup
 from models.help_type import HelpType
 from models.organization import Organization
+from models.organization_adoption_stat import OrganizationAdoptionStat
+from models.organization_animal_stat import OrganizationAnimalStat
 
 __all__ = [
     "Animal",
     "AnimalPhoto",
+    "AnimalSearchDocument",
     "AnimalSpecies",
     "Expense",
     "ExpenseAttachment",
     "ExpenseCategory",
+    "ExpenseMonthlyRollup",
     "AnimalSex",
     "AnimalSize",
     "AnimalStatus",
     "Organization",
+    "OrganizationAdoptionStat",
+    "OrganizationAnimalStat",
     "HelpType",
     "Adoption",
 ]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    Enum as SAEnum,
+    Float,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+from models.animal import (
+    AnimalSex,
+    AnimalSize,
+    AnimalStatus,
+    EnvironmentPreference,
+    SociableTarget,
+    TemperamentTrait,
+)
+from models.organization import GeographyPoint
+
+
+class AnimalSearchDocument(Base):
+    """Projeção de leitura usada pela busca pública de animais.
+
+    Reúne os campos do animal, o resumo e a localização da ONG, a espécie e
+    as fotos, evitando joins e consultas extras na busca. Os cards usam só a
+    primeira foto (``photo_url``); a listagem completa usa ``photos``.
+    """
+
+    __tablename__ = "animal_search_documents"
+
+    animal_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("animals.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    species_id: Mapped[int] = mapped_column(Integer(), nullable=False)
+    species_slug: Mapped[str] = mapped_column(String(50), nullable=False)
+    species_label: Mapped[str] = mapped_column(String(100), nullable=False)
+    species_description: Mapped[str | None] = mapped_column(Text())
+    sex: Mapped[AnimalSex] = mapped_column(
+        SAEnum(AnimalSex, name="animal_sex"),
+        nullable=False,
+    )
+    size: Mapped[AnimalSize] = mapped_column(
+        SAEnum(AnimalSize, name="animal_size"),
+        nullable=False,
+    )
+    age_years: Mapped[int | None] = mapped_column(Integer())
+    weight_kg: Mapped[float | None] = mapped_column(Float())
+    temperament_traits: Mapped[list[TemperamentTrait]] = mapped_column(
+        ARRAY(SAEnum(TemperamentTrait, name="temperament_trait")),
+        nullable=False,
+    )
+    environment_preferences: Mapped[list[EnvironmentPreference]] = mapped_column(
+        ARRAY(SAEnum(EnvironmentPreference, name="environment_preference")),
+        nullable=False,
+    )
+    sociable_with: Mapped[list[SociableTarget]] = mapped_column(
+        ARRAY(SAEnum(SociableTarget, name="sociable_target")),
+        nullable=False,
+    )
+    vaccinated: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    neutered: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    dewormed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    rescue_date: Mapped[date | None] = mapped_column(Date())
+    microchip: Mapped[str | None] = mapped_column(String(50))
+    description: Mapped[str | None] = mapped_column(Text())
+    adoption_requirements: Mapped[str | None] = mapped_column(Text())
+    status: Mapped[AnimalStatus] = mapped_column(
+        SAEnum(AnimalStatus, name="animal_status"),
+        nullable=False,
+    )
+    photo_url: Mapped[str | None] = mapped_column(String(255))
+    # Fotos já ordenadas: [{"id", "url", "position", "created_at"}, ...].
+    photos: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB(),
+        nullable=False,
+        server_default="[]",
+    )
+    organization_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    organization_city: Mapped[str | None] = mapped_column(String(100))
+    organization_state: Mapped[str | None] = mapped_column(String(2))
+    organization_latitude: Mapped[float | None] = mapped_column(
+        Numeric(9, 6, asdecimal=False),
+    )
+    organization_longitude: Mapped[float | None] = mapped_column(
+        Numeric(9, 6, asdecimal=False),
+    )
+    organization_logo_url: Mapped[str | None] = mapped_column(String(255))
+    location: Mapped[object | None] = mapped_column(GeographyPoint())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging helper
+        return f"AnimalSearchDocument(animal_id={self.animal_id!s}, name={self.name!r})"
+
+
+__all__ = ["AnimalSearchDocument"]
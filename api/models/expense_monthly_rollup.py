@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class ExpenseMonthlyRollup(Base):
+    """Total mensal das despesas de uma ONG por categoria e centro de custo.
+
+    Mantido pelo ``ExpenseService`` na mesma transação que registra a despesa.
+    ``month`` é sempre o primeiro dia do mês e ``cost_center`` vazio representa
+    as despesas sem centro de custo.
+    """
+
+    __tablename__ = "expense_monthly_rollups"
+    __table_args__ = (
+        CheckConstraint(
+            "expense_count >= 0", name="ck_expense_monthly_rollups_expense_count"
+        ),
+    )
+
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month: Mapped[date] = mapped_column(Date(), primary_key=True)
+    category_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("expense_categories.id", ondelete="RESTRICT"),
+        primary_key=True,
+    )
+    cost_center: Mapped[str] = mapped_column(
+        String(100), primary_key=True, server_default=""
+    )
+    total: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0")
+    )
+    expense_count: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+__all__ = ["ExpenseMonthlyRollup"]
@@ -2,8 +2,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Numeric, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import Boolean, DateTime, Integer, Numeric, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import UserDefinedType
 
@@ -14,6 +14,10 @@ from models.association_tables import organization_help_types
 class GeographyPoint(UserDefinedType):
     """PostGIS geography point column."""
 
+    # Sem estado: permite ao SQLAlchemy cachear o SQL compilado das consultas
+    # que usam o tipo (busca por raio, ordenação por distância).
+    cache_ok = True
+
     def get_col_spec(self, **kw: object) -> str:
         return "GEOGRAPHY(Point, 4326)"
 
@@ -63,6 +67,14 @@ class Organization(Base):
         GeographyPoint(),
         nullable=True,
     )
+    # Cópia de organization_help_types mantida pelo OrganizationService, usada
+    # para filtrar (índice GIN) e exibir os tipos de ajuda sem join.
+    help_type_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer()),
+        nullable=False,
+        default=list,
+        server_default="{}",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -79,7 +91,6 @@ class Organization(Base):
         "HelpType",
         secondary=organization_help_types,
         back_populates="organizations",
-        lazy="joined",
     )
     animals: Mapped[list["Animal"]] = relationship(
         "Animal",
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class OrganizationAdoptionStat(Base):
+    """Agregados de todas as adoções de uma ONG.
+
+    Mantidos na mesma transação que registra ou encerra a adoção; a média de
+    dias até a adoção e a taxa de devolução do painel saem desta linha.
+    """
+
+    __tablename__ = "organization_adoption_stats"
+    __table_args__ = (
+        CheckConstraint(
+            "adoption_count >= 0", name="ck_organization_adoption_stats_adoption_count"
+        ),
+        CheckConstraint(
+            "closed_count >= 0", name="ck_organization_adoption_stats_closed_count"
+        ),
+    )
+
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    adoption_count: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    closed_count: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    days_until_adoption_sum: Mapped[float] = mapped_column(
+        Float(), nullable=False, default=0.0
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+__all__ = ["OrganizationAdoptionStat"]
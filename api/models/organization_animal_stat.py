@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Integer,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+from models.animal import AnimalStatus
+
+
+class OrganizationAnimalStat(Base):
+    """Contagem de animais de uma ONG por espécie e status.
+
+    Mantida pelo ``AnimalService`` na mesma transação que cadastra, altera o
+    status ou remove o animal.
+    """
+
+    __tablename__ = "organization_animal_stats"
+    __table_args__ = (
+        CheckConstraint("count >= 0", name="ck_organization_animal_stats_count"),
+    )
+
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    species_id: Mapped[int] = mapped_column(
+        ForeignKey("animal_species.id", ondelete="RESTRICT"),
+        primary_key=True,
+    )
+    status: Mapped[AnimalStatus] = mapped_column(
+        SAEnum(AnimalStatus, name="animal_status"),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+__all__ = ["OrganizationAnimalStat"]
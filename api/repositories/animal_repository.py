@@ -1,35 +1,71 @@
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Row, Select, bindparam, func, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from models.animal import (
-    Animal,
-    AnimalSex,
-    AnimalSize,
-    AnimalStatus,
-    TemperamentTrait,
-)
-from models.organization import GeographyPoint, Organization
+from db.text_search import name_matches
+from models.animal import Animal, AnimalStatus
+from models.animal_photo import AnimalPhoto
+from models.animal_species import AnimalSpecies
+from models.expense import Expense
+
+
+def _load_options():
+    return (selectinload(Animal.photos), selectinload(Animal.species))
+
+
+# Montada na primeira chamada (criar as opções de carga configura os mappers,
+# o que não deve pesar no import) e reaproveitada depois, com a chave de cache
+# e o SQL compilado.
+@lru_cache(maxsize=1)
+def _get_by_id_statement() -> Select[tuple[Animal]]:
+    return (
+        select(Animal)
+        .options(*_load_options())
+        .where(Animal.id == bindparam("animal_id"))
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_by_id_for_update_statement() -> Select[tuple[Animal]]:
+    # populate_existing: a linha bloqueada sobrescreve o que já estiver na sessão.
+    return (
+        _get_by_id_statement()
+        .with_for_update(of=Animal)
+        .execution_options(populate_existing=True)
+    )
 
 
 class AnimalRepository:
     """Operações de persistência relacionadas aos animais."""
 
     def _base_query(self) -> Select[tuple[Animal]]:
-        return select(Animal).options(
-            selectinload(Animal.photos), selectinload(Animal.species)
-        )
+        return select(Animal).options(*_load_options())
 
     def add(self, db: Session, animal: Animal) -> Animal:
         db.add(animal)
         return animal
 
+    def count_expenses(self, db: Session, animal_id: UUID) -> int:
+        stmt = select(func.count(Expense.id)).where(Expense.animal_id == animal_id)
+        return db.execute(stmt).scalar_one()
+
+    def delete(self, db: Session, animal: Animal) -> None:
+        db.delete(animal)
+
     def get_by_id(self, db: Session, animal_id: UUID) -> Animal | None:
-        stmt = self._base_query().where(Animal.id == animal_id)
-        return db.execute(stmt).unique().scalar_one_or_none()
+        result = db.execute(_get_by_id_statement(), {"animal_id": animal_id})
+        return result.unique().scalar_one_or_none()
+
+    def get_by_id_for_update(self, db: Session, animal_id: UUID) -> Animal | None:
+        """Como ``get_by_id``, mas bloqueia a linha até o fim da transação."""
+        result = db.execute(_get_by_id_for_update_statement(), {"animal_id": animal_id})
+        return result.unique().scalar_one_or_none()
 
     def list_by_organization(
         self,
@@ -40,86 +76,92 @@ class AnimalRepository:
         limit: int = 50,
         name: str | None = None,
         status: AnimalStatus | None = None,
-    ) -> list[Animal]:
-        stmt = (
-            self._base_query()
-            .where(Animal.organization_id == organization_id)
-            .order_by(Animal.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Row]:
+        """Lista apenas as colunas exibidas em ``AnimalListItemRead``.
+
+        Textos longos e arrays de características não são lidos, e a foto
+        principal vem de um ``LATERAL`` limitado a uma linha por animal.
+        """
+        stmt = self._list_by_organization_statement(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            name=name,
+            status=status,
+            after=after,
         )
+        return list(db.execute(stmt).all())
 
-        if name:
-            clean_name = name.strip()
-            if clean_name:
-                stmt = stmt.where(Animal.name.ilike(f"%{clean_name}%"))
-        if status is not None:
-            stmt = stmt.where(Animal.status == status)
-
-        return list(db.execute(stmt).scalars())
-
-    def search_available(
+    async def list_by_organization_async(
         self,
-        db: Session,
+        db: AsyncSession,
+        organization_id: UUID,
         *,
-        latitude: float,
-        longitude: float,
-        radius_km: float,
         skip: int = 0,
         limit: int = 50,
-        species_id: int | None = None,
-        size: AnimalSize | None = None,
-        sex: AnimalSex | None = None,
-        age_years: int | None = None,
-        temperament_traits: list[TemperamentTrait] | None = None,
-    ) -> list[tuple[Animal, float]]:
-        reference_point = func.ST_SetSRID(
-            func.ST_MakePoint(longitude, latitude),
-            4326,
+        name: str | None = None,
+        status: AnimalStatus | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Row]:
+        stmt = self._list_by_organization_statement(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            name=name,
+            status=status,
+            after=after,
         )
-        reference_point_geog = func.cast(reference_point, GeographyPoint())
-        distance_expr = (
-            func.ST_Distance(Organization.location, reference_point_geog) / 1000.0
-        ).label("distance_km")
+        return list((await db.execute(stmt)).all())
 
-        stmt = (
-            select(Animal, distance_expr)
-            .join(Organization, Animal.organization_id == Organization.id)
-            .options(
-                selectinload(Animal.photos),
-                selectinload(Animal.species),
-                joinedload(Animal.organization),
-            )
-            .where(Animal.status == AnimalStatus.available)
-            .where(Organization.location.isnot(None))
-            .where(
-                func.ST_DWithin(
-                    Organization.location,
-                    reference_point_geog,
-                    radius_km * 1000.0,
-                )
+    def _list_by_organization_statement(
+        self,
+        organization_id: UUID,
+        *,
+        skip: int,
+        limit: int,
+        name: str | None,
+        status: AnimalStatus | None,
+        after: tuple[datetime, UUID] | None,
+    ) -> Select:
+        first_photo = (
+            select(AnimalPhoto.url)
+            .where(AnimalPhoto.animal_id == Animal.id)
+            .order_by(
+                AnimalPhoto.position.asc().nulls_last(),
+                AnimalPhoto.created_at,
             )
+            .limit(1)
+            .lateral("first_photo")
         )
-
-        if species_id is not None:
-            stmt = stmt.where(Animal.species_id == species_id)
-        if size is not None:
-            stmt = stmt.where(Animal.size == size)
-        if sex is not None:
-            stmt = stmt.where(Animal.sex == sex)
-        if age_years is not None:
-            stmt = stmt.where(Animal.age_years == age_years)
-        if temperament_traits:
-            stmt = stmt.where(Animal.temperament_traits.contains(temperament_traits))
-
         stmt = (
-            stmt.order_by(distance_expr, Animal.created_at.desc())
-            .offset(skip)
+            select(
+                Animal.id,
+                Animal.name,
+                Animal.status,
+                Animal.created_at,
+                AnimalSpecies.id.label("species_id"),
+                AnimalSpecies.slug.label("species_slug"),
+                AnimalSpecies.label.label("species_label"),
+                AnimalSpecies.description.label("species_description"),
+                first_photo.c.url.label("photo_url"),
+            )
+            .join(AnimalSpecies, Animal.species_id == AnimalSpecies.id)
+            .outerjoin(first_photo, true())
+            .where(Animal.organization_id == organization_id)
+            .order_by(Animal.created_at.desc(), Animal.id.desc())
             .limit(limit)
         )
+        if after is not None:
+            stmt = stmt.where(tuple_(Animal.created_at, Animal.id) < tuple_(*after))
+        else:
+            stmt = stmt.offset(skip)
+
+        if name:
+            clean_name = name.strip()
+            if clean_name:
+                stmt = stmt.where(name_matches(Animal.name, clean_name))
+        if status is not None:
+            stmt = stmt.where(Animal.status == status)
 
-        results = db.execute(stmt).unique().all()
-        return [
-            (animal, float(distance_km or 0.0))
-            for animal, distance_km in results
-        ]
+        return stmt
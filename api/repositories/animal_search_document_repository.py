@@ -0,0 +1,607 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models.animal import (
+    Animal,
+    AnimalSex,
+    AnimalSize,
+    AnimalStatus,
+    EnvironmentPreference,
+    SociableTarget,
+    TemperamentTrait,
+)
+from models.animal_photo import AnimalPhoto
+from models.animal_search_document import AnimalSearchDocument
+from models.animal_species import AnimalSpecies
+from models.organization import GeographyPoint, Organization
+
+
+# Colunas do documento usadas em AnimalCardRead.
+_CARD_COLUMNS = (
+    "animal_id",
+    "organization_id",
+    "name",
+    "species_id",
+    "species_slug",
+    "species_label",
+    "sex",
+    "size",
+    "age_years",
+    "temperament_traits",
+    "environment_preferences",
+    "sociable_with",
+    "vaccinated",
+    "neutered",
+    "dewormed",
+    "status",
+    "photo_url",
+    "organization_name",
+    "organization_city",
+    "organization_state",
+    "organization_latitude",
+    "organization_longitude",
+    "organization_logo_url",
+    "created_at",
+)
+# Colunas adicionais de AnimalPublicRead (GET /animals).
+_DETAIL_COLUMNS = (
+    "species_description",
+    "weight_kg",
+    "rescue_date",
+    "microchip",
+    "description",
+    "adoption_requirements",
+    "photos",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AnimalSearchFilters:
+    species_id: int | None = None
+    size: AnimalSize | None = None
+    sex: AnimalSex | None = None
+    age_years: int | None = None
+    temperament_traits: tuple[TemperamentTrait, ...] = ()
+    environment_preferences: tuple[EnvironmentPreference, ...] = ()
+    sociable_with: tuple[SociableTarget, ...] = ()
+    match_all: bool = True
+
+
+@dataclass(slots=True)
+class AnimalSearchFacets:
+    total: int = 0
+    species: list[tuple[int, str, int]] = field(default_factory=list)
+    size: list[tuple[AnimalSize, int]] = field(default_factory=list)
+    sex: list[tuple[AnimalSex, int]] = field(default_factory=list)
+    temperament_traits: list[tuple[TemperamentTrait, int]] = field(
+        default_factory=list
+    )
+
+
+class AnimalSearchDocumentRepository:
+    """Mantém e consulta a projeção de leitura da busca de animais."""
+
+    def refresh(
+        self,
+        db: Session,
+        *,
+        animal_ids: Iterable[UUID] | None = None,
+        organization_id: UUID | None = None,
+    ) -> None:
+        """Recalcula os documentos a partir das tabelas de origem.
+
+        Deve ser chamado após o ``flush`` das alterações, dentro da mesma
+        transação da escrita que tornou o documento desatualizado.
+        """
+        photo_order = (
+            AnimalPhoto.position.asc().nulls_last(),
+            AnimalPhoto.created_at,
+        )
+        first_photo_url = (
+            select(AnimalPhoto.url)
+            .where(AnimalPhoto.animal_id == Animal.id)
+            .order_by(*photo_order)
+            .limit(1)
+            .correlate(Animal)
+            .scalar_subquery()
+        )
+        # As chaves vão no SQL: jsonb_build_object não infere o tipo de
+        # parâmetros textuais sem conversão explícita.
+        photo_object = func.jsonb_build_object(
+            literal_column("'id'"),
+            AnimalPhoto.id,
+            literal_column("'url'"),
+            AnimalPhoto.url,
+            literal_column("'position'"),
+            AnimalPhoto.position,
+            literal_column("'created_at'"),
+            AnimalPhoto.created_at,
+        )
+        photos = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(aggregate_order_by(photo_object, *photo_order)),
+                    func.jsonb_build_array(),
+                )
+            )
+            .where(AnimalPhoto.animal_id == Animal.id)
+            .correlate(Animal)
+            .scalar_subquery()
+        )
+
+        source = (
+            select(
+                Animal.id,
+                Animal.organization_id,
+                Animal.name,
+                Animal.species_id,
+                AnimalSpecies.slug,
+                AnimalSpecies.label,
+                AnimalSpecies.description,
+                Animal.sex,
+                Animal.size,
+                Animal.age_years,
+                Animal.weight_kg,
+                Animal.temperament_traits,
+                Animal.environment_preferences,
+                Animal.sociable_with,
+                Animal.vaccinated,
+                Animal.neutered,
+                Animal.dewormed,
+                Animal.rescue_date,
+                Animal.microchip,
+                Animal.description,
+                Animal.adoption_requirements,
+                Animal.status,
+                first_photo_url,
+                photos,
+                Organization.name,
+                Organization.city,
+                Organization.state,
+                Organization.latitude,
+                Organization.longitude,
+                Organization.logo_url,
+                Organization.location,
+                Animal.created_at,
+                Animal.updated_at,
+            )
+            .join(Organization, Animal.organization_id == Organization.id)
+            .join(AnimalSpecies, Animal.species_id == AnimalSpecies.id)
+        )
+        if animal_ids is not None:
+            animal_ids = list(animal_ids)
+            if not animal_ids:
+                return
+            source = source.where(Animal.id.in_(animal_ids))
+        if organization_id is not None:
+            source = source.where(Animal.organization_id == organization_id)
+
+        columns = [
+            "animal_id",
+            "organization_id",
+            "name",
+            "species_id",
+            "species_slug",
+            "species_label",
+            "species_description",
+            "sex",
+            "size",
+            "age_years",
+            "weight_kg",
+            "temperament_traits",
+            "environment_preferences",
+            "sociable_with",
+            "vaccinated",
+            "neutered",
+            "dewormed",
+            "rescue_date",
+            "microchip",
+            "description",
+            "adoption_requirements",
+            "status",
+            "photo_url",
+            "photos",
+            "organization_name",
+            "organization_city",
+            "organization_state",
+            "organization_latitude",
+            "organization_longitude",
+            "organization_logo_url",
+            "location",
+            "created_at",
+            "updated_at",
+        ]
+        stmt = insert(AnimalSearchDocument).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnimalSearchDocument.animal_id],
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in columns
+                    if column != "animal_id"
+                },
+                "refreshed_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def search_available(
+        self,
+        db: Session,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters = AnimalSearchFilters(),
+        skip: int = 0,
+        limit: int = 50,
+        after: tuple[float, datetime, UUID] | None = None,
+        detailed: bool = False,
+    ) -> list[tuple[Row, float]]:
+        """Busca os cards no raio, lendo apenas as colunas exibidas.
+
+        Cada item traz uma linha com os atributos de ``_CARD_COLUMNS`` (e de
+        ``_DETAIL_COLUMNS`` quando ``detailed``) e a distância em
+        quilômetros; a geografia e o ``refreshed_at`` do documento não são
+        carregados.
+        """
+        stmt, params = self._search_statement(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            filters=filters,
+            skip=skip,
+            limit=limit,
+            after=after,
+            detailed=detailed,
+        )
+        return self._search_items(db.execute(stmt, params).all())
+
+    async def search_available_async(
+        self,
+        db: AsyncSession,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters = AnimalSearchFilters(),
+        skip: int = 0,
+        limit: int = 50,
+        after: tuple[float, datetime, UUID] | None = None,
+        detailed: bool = False,
+    ) -> list[tuple[Row, float]]:
+        stmt, params = self._search_statement(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            filters=filters,
+            skip=skip,
+            limit=limit,
+            after=after,
+            detailed=detailed,
+        )
+        return self._search_items((await db.execute(stmt, params)).all())
+
+    def count_facets(
+        self,
+        db: Session,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters = AnimalSearchFilters(),
+    ) -> AnimalSearchFacets:
+        """Conta o total e as facetas do raio informado em uma única consulta.
+
+        Cada faceta ignora o próprio filtro (ex.: a contagem por porte não
+        aplica o filtro ``size``), para que o cliente exiba as alternativas.
+        """
+        stmt, params = self._facets_statement(
+            latitude=latitude, longitude=longitude, radius_km=radius_km, filters=filters
+        )
+        return self._facets_from_rows(db.execute(stmt, params).all())
+
+    async def count_facets_async(
+        self,
+        db: AsyncSession,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters = AnimalSearchFilters(),
+    ) -> AnimalSearchFacets:
+        stmt, params = self._facets_statement(
+            latitude=latitude, longitude=longitude, radius_km=radius_km, filters=filters
+        )
+        return self._facets_from_rows((await db.execute(stmt, params)).all())
+
+    def _search_statement(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters,
+        skip: int,
+        limit: int,
+        after: tuple[float, datetime, UUID] | None,
+        detailed: bool,
+    ) -> tuple[Select, dict[str, Any]]:
+        params = _search_params(latitude, longitude, radius_km, filters)
+        params["limit"] = limit
+        if after is not None:
+            (
+                params["last_distance"],
+                params["last_created_at"],
+                params["last_id"],
+            ) = after
+        else:
+            params["skip"] = skip
+        stmt = _search_statement(
+            _filter_names(filters),
+            filters.match_all,
+            keyset=after is not None,
+            detailed=detailed,
+        )
+        return stmt, params
+
+    def _search_items(self, rows: Sequence[Row]) -> list[tuple[Row, float]]:
+        return [(row, float(row.distance_km or 0.0)) for row in rows]
+
+    def _facets_statement(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        filters: AnimalSearchFilters,
+    ) -> tuple[Select, dict[str, Any]]:
+        params = _search_params(latitude, longitude, radius_km, filters)
+        return _facets_statement(_filter_names(filters), filters.match_all), params
+
+    def _facets_from_rows(self, rows: Sequence[Row]) -> AnimalSearchFacets:
+        facets = AnimalSearchFacets()
+        for row in rows:
+            if not row.g_species:
+                if row.species_count:
+                    facets.species.append(
+                        (row.species_id, row.species_label, int(row.species_count))
+                    )
+            elif not row.g_size:
+                if row.size_count:
+                    facets.size.append((AnimalSize(row.size), int(row.size_count)))
+            elif not row.g_sex:
+                if row.sex_count:
+                    facets.sex.append((AnimalSex(row.sex), int(row.sex_count)))
+            elif not row.g_trait:
+                if row.trait is not None and row.trait_count:
+                    facets.temperament_traits.append(
+                        (TemperamentTrait(row.trait), int(row.trait_count))
+                    )
+            else:
+                facets.total = int(row.total or 0)
+
+        for buckets in (
+            facets.species,
+            facets.size,
+            facets.sex,
+            facets.temperament_traits,
+        ):
+            buckets.sort(key=lambda bucket: bucket[-1], reverse=True)
+        return facets
+
+
+# As consultas da busca são montadas uma vez por combinação de filtros
+# presentes, com os valores como parâmetros nomeados. Cada execução reaproveita
+# a chave de cache e o SQL compilado do SQLAlchemy, e o texto idêntico deixa o
+# psycopg preparar a consulta no servidor.
+_ARRAY_FILTERS = ("temperament_traits", "environment_preferences", "sociable_with")
+_FILTER_NAMES = ("species_id", "size", "sex", "age_years", *_ARRAY_FILTERS)
+
+
+def _filter_names(filters: AnimalSearchFilters) -> tuple[str, ...]:
+    return tuple(
+        name
+        for name in _FILTER_NAMES
+        if getattr(filters, name) not in (None, ())
+    )
+
+
+def _search_params(
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    filters: AnimalSearchFilters,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "radius_m": radius_km * 1000.0,
+    }
+    for name in _filter_names(filters):
+        value = getattr(filters, name)
+        params[name] = list(value) if name in _ARRAY_FILTERS else value
+    return params
+
+
+def _reference_point():
+    reference_point = func.ST_SetSRID(
+        func.ST_MakePoint(
+            bindparam("longitude", type_=Float),
+            bindparam("latitude", type_=Float),
+        ),
+        4326,
+    )
+    return func.cast(reference_point, GeographyPoint())
+
+
+def _geo_conditions(reference_point_geog) -> list[ColumnElement[bool]]:
+    document = AnimalSearchDocument
+    return [
+        document.status == AnimalStatus.available,
+        document.location.isnot(None),
+        func.ST_DWithin(
+            document.location,
+            reference_point_geog,
+            bindparam("radius_m", type_=Float),
+        ),
+    ]
+
+
+def _filter_conditions(
+    names: tuple[str, ...], match_all: bool
+) -> dict[str, ColumnElement[bool]]:
+    document = AnimalSearchDocument
+    conditions: dict[str, ColumnElement[bool]] = {}
+    for name in names:
+        column = getattr(document, name)
+        value = bindparam(name, type_=column.type)
+        if name in _ARRAY_FILTERS:
+            # @> (todos) e && (qualquer) são atendidos pelos índices GIN.
+            conditions[name] = (
+                column.contains(value) if match_all else column.overlap(value)
+            )
+        else:
+            conditions[name] = column == value
+    return conditions
+
+
+@lru_cache(maxsize=512)
+def _search_statement(
+    filter_names: tuple[str, ...],
+    match_all: bool,
+    *,
+    keyset: bool,
+    detailed: bool = False,
+) -> Select:
+    document = AnimalSearchDocument
+    reference_point_geog = _reference_point()
+    distance_value = func.ST_Distance(document.location, reference_point_geog) / 1000.0
+    distance_expr = distance_value.label("distance_km")
+
+    columns = _CARD_COLUMNS + _DETAIL_COLUMNS if detailed else _CARD_COLUMNS
+
+    stmt = (
+        select(
+            *(getattr(document, column) for column in columns),
+            distance_expr,
+        )
+        .where(*_geo_conditions(reference_point_geog))
+        .where(*_filter_conditions(filter_names, match_all).values())
+        .order_by(distance_expr, document.created_at.desc(), document.animal_id)
+    )
+    if keyset:
+        # Keyset: continua após a última linha (distância, criação, id) vista.
+        last_distance = bindparam("last_distance", type_=Float)
+        last_created_at = bindparam("last_created_at", type_=document.created_at.type)
+        last_id = bindparam("last_id", type_=document.animal_id.type)
+        stmt = stmt.where(
+            or_(
+                distance_value > last_distance,
+                and_(
+                    distance_value == last_distance,
+                    or_(
+                        document.created_at < last_created_at,
+                        and_(
+                            document.created_at == last_created_at,
+                            document.animal_id > last_id,
+                        ),
+                    ),
+                ),
+            )
+        )
+    else:
+        stmt = stmt.offset(bindparam("skip", type_=Integer))
+    return stmt.limit(bindparam("limit", type_=Integer))
+
+
+@lru_cache(maxsize=512)
+def _facets_statement(filter_names: tuple[str, ...], match_all: bool) -> Select:
+    document = AnimalSearchDocument
+    reference_point_geog = _reference_point()
+    conditions = _filter_conditions(filter_names, match_all)
+    # render_derived(): "AS traits(trait)". Sem a lista de colunas o Postgres
+    # nomeia a única coluna do unnest com o alias ("traits.traits").
+    traits = (
+        func.unnest(document.temperament_traits)
+        .table_valued("trait")
+        .render_derived()
+        .lateral("traits")
+    )
+
+    def _count_without(*excluded: str):
+        remaining = [
+            condition
+            for name, condition in conditions.items()
+            if name not in excluded
+        ]
+        matches = func.count(document.animal_id.distinct())
+        return matches.filter(and_(true(), *remaining))
+
+    grouping_species = func.grouping(document.species_id)
+    grouping_size = func.grouping(document.size)
+    grouping_sex = func.grouping(document.sex)
+    grouping_trait = func.grouping(traits.c.trait)
+
+    return (
+        select(
+            grouping_species.label("g_species"),
+            grouping_size.label("g_size"),
+            grouping_sex.label("g_sex"),
+            grouping_trait.label("g_trait"),
+            document.species_id,
+            document.species_label,
+            document.size,
+            document.sex,
+            traits.c.trait,
+            _count_without().label("total"),
+            _count_without("species_id").label("species_count"),
+            _count_without("size").label("size_count"),
+            _count_without("sex").label("sex_count"),
+            _count_without("temperament_traits").label("trait_count"),
+        )
+        .select_from(document)
+        .outerjoin(traits, true())
+        .where(*_geo_conditions(reference_point_geog))
+        .group_by(
+            func.grouping_sets(
+                tuple_(),
+                tuple_(document.species_id, document.species_label),
+                tuple_(document.size),
+                tuple_(document.sex),
+                tuple_(traits.c.trait),
+            )
+        )
+    )
+
+
+__all__ = [
+    "AnimalSearchDocumentRepository",
+    "AnimalSearchFacets",
+    "AnimalSearchFilters",
+]
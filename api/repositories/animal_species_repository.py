@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Iterable
 
 from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from models.animal_species import AnimalSpecies
@@ -17,6 +18,9 @@ class AnimalSpeciesRepository:
     def list_all(self, db: Session) -> list[AnimalSpecies]:
         return list(db.execute(self._base_query()).scalars())
 
+    async def list_all_async(self, db: AsyncSession) -> list[AnimalSpecies]:
+        return list((await db.execute(self._base_query())).scalars())
+
     def get_by_id(self, db: Session, species_id: int) -> AnimalSpecies | None:
         stmt = self._base_query().where(AnimalSpecies.id == species_id)
         return db.execute(stmt).unique().scalar_one_or_none()
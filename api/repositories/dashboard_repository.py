@@ -3,15 +3,36 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import Float, cast, func, select
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    Numeric,
+    Row,
+    Select,
+    String,
+    bindparam,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from models.adoption import Adoption
 from models.animal import Animal, AnimalStatus
 from models.expense import Expense
 from models.expense_category import ExpenseCategory
+from models.expense_monthly_rollup import ExpenseMonthlyRollup
+from models.organization_adoption_stat import OrganizationAdoptionStat
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,6 +52,209 @@ class ExpenseCategoryRow:
     total: Decimal
 
 
+@dataclass(frozen=True, slots=True)
+class MonthlySeriesRow:
+    """Uma linha da série mensal; ``kind`` é None nos meses sem movimento."""
+
+    month: date
+    kind: str | None
+    category_id: UUID | None
+    category_name: str | None
+    value: Decimal
+
+
+@lru_cache(maxsize=1)
+def _headline_metrics_statement() -> Select:
+    """Monta a consulta dos indicadores com parâmetros nomeados.
+
+    Construída uma única vez: cada execução reaproveita a chave de cache e o
+    SQL compilado, e o texto idêntico permite ao psycopg preparar a consulta.
+    """
+    organization_id = bindparam("organization_id", type_=Animal.organization_id.type)
+    current_start = bindparam("current_start", type_=Adoption.adoption_date.type)
+    current_end = bindparam("current_end", type_=Adoption.adoption_date.type)
+    current_start_date = bindparam(
+        "current_start_date", type_=Expense.expense_date.type
+    )
+    current_end_date = bindparam("current_end_date", type_=Expense.expense_date.type)
+    previous_start_date = bindparam(
+        "previous_start_date", type_=Expense.expense_date.type
+    )
+    previous_end_date = bindparam("previous_end_date", type_=Expense.expense_date.type)
+    # Os intervalos de despesas começam na virada do mês, então os totais saem
+    # direto de expense_monthly_rollups sem varrer as despesas do período.
+
+    active_animals = (
+        select(func.count(Animal.id))
+        .where(
+            Animal.organization_id == organization_id,
+            Animal.status.in_([AnimalStatus.available, AnimalStatus.reserved]),
+        )
+        .scalar_subquery()
+    )
+
+    adoptions_current_month = (
+        select(func.count(Adoption.id))
+        .where(
+            Adoption.organization_id == organization_id,
+            Adoption.adoption_date >= current_start,
+            Adoption.adoption_date < current_end,
+        )
+        .scalar_subquery()
+    )
+
+    # Agregados de todas as adoções mantidos incrementalmente: uma linha por
+    # ONG em vez de varrer e juntar o histórico inteiro a cada requisição.
+    stat = OrganizationAdoptionStat
+    avg_days_until_adoption = (
+        select(stat.days_until_adoption_sum / func.nullif(stat.adoption_count, 0))
+        .where(stat.organization_id == organization_id)
+        .scalar_subquery()
+    )
+    return_rate = func.coalesce(
+        select(
+            cast(stat.closed_count, Float)
+            / func.nullif(cast(stat.adoption_count, Float), 0.0)
+        )
+        .where(stat.organization_id == organization_id)
+        .scalar_subquery(),
+        0.0,
+    )
+
+    expenses_current_month = (
+        select(func.coalesce(func.sum(ExpenseMonthlyRollup.total), 0))
+        .where(
+            ExpenseMonthlyRollup.organization_id == organization_id,
+            ExpenseMonthlyRollup.month >= current_start_date,
+            ExpenseMonthlyRollup.month < current_end_date,
+        )
+        .scalar_subquery()
+    )
+
+    expenses_previous_month = (
+        select(func.coalesce(func.sum(ExpenseMonthlyRollup.total), 0))
+        .where(
+            ExpenseMonthlyRollup.organization_id == organization_id,
+            ExpenseMonthlyRollup.month >= previous_start_date,
+            ExpenseMonthlyRollup.month < previous_end_date,
+        )
+        .scalar_subquery()
+    )
+
+    return select(
+        active_animals.label("active_animals"),
+        adoptions_current_month.label("adoptions_current_month"),
+        avg_days_until_adoption.label("avg_days_until_adoption"),
+        return_rate.label("return_rate"),
+        expenses_current_month.label("expenses_current_month"),
+        expenses_previous_month.label("expenses_previous_month"),
+    )
+
+
+def _utc_month(column):
+    return cast(func.date_trunc("month", func.timezone("UTC", column)), Date)
+
+
+@lru_cache(maxsize=1)
+def _monthly_series_statement() -> Select:
+    """Série mensal de adoções, devoluções, entradas e despesas por categoria.
+
+    Um único ``GROUP BY`` sobre ``generate_series``: cada mês da janela
+    aparece ao menos uma vez, mesmo sem movimento. Os eventos com horário são
+    agrupados pelo mês em UTC, como os intervalos do resumo.
+    """
+    organization_id = bindparam("organization_id", type_=Animal.organization_id.type)
+    start_month = bindparam("start_month", type_=Date())
+    end_month = bindparam("end_month", type_=Date())
+    range_start = bindparam("range_start", type_=Adoption.adoption_date.type)
+    range_end = bindparam("range_end", type_=Adoption.adoption_date.type)
+
+    no_category = cast(null(), ExpenseMonthlyRollup.category_id.type)
+    no_name = cast(null(), String())
+    one = cast(literal(1), Numeric())
+
+    adoptions = select(
+        _utc_month(Adoption.adoption_date).label("month"),
+        literal("adoptions").label("kind"),
+        no_category.label("category_id"),
+        no_name.label("category_name"),
+        one.label("value"),
+    ).where(
+        Adoption.organization_id == organization_id,
+        Adoption.adoption_date >= range_start,
+        Adoption.adoption_date < range_end,
+    )
+    returns = select(
+        _utc_month(Adoption.closed_at),
+        literal("returns"),
+        no_category,
+        no_name,
+        one,
+    ).where(
+        Adoption.organization_id == organization_id,
+        Adoption.closed_at >= range_start,
+        Adoption.closed_at < range_end,
+    )
+    intake = select(
+        _utc_month(Animal.created_at),
+        literal("intake"),
+        no_category,
+        no_name,
+        one,
+    ).where(
+        Animal.organization_id == organization_id,
+        Animal.created_at >= range_start,
+        Animal.created_at < range_end,
+    )
+    rollup = ExpenseMonthlyRollup
+    expenses = (
+        select(
+            rollup.month,
+            literal("expenses"),
+            rollup.category_id,
+            ExpenseCategory.name,
+            rollup.total,
+        )
+        .join(ExpenseCategory, ExpenseCategory.id == rollup.category_id)
+        .where(
+            rollup.organization_id == organization_id,
+            rollup.month >= start_month,
+            rollup.month < end_month,
+            rollup.expense_count > 0,
+        )
+    )
+    events = union_all(adoptions, returns, intake, expenses).subquery("events")
+
+    months = select(
+        cast(
+            func.generate_series(
+                cast(start_month, DateTime()),
+                cast(end_month, DateTime()) - literal_column("interval '1 month'"),
+                literal_column("interval '1 month'"),
+            ),
+            Date,
+        ).label("month")
+    ).subquery("months")
+
+    return (
+        select(
+            months.c.month,
+            events.c.kind,
+            events.c.category_id,
+            events.c.category_name,
+            func.sum(events.c.value).label("value"),
+        )
+        .select_from(months.outerjoin(events, events.c.month == months.c.month))
+        .group_by(
+            months.c.month,
+            events.c.kind,
+            events.c.category_id,
+            events.c.category_name,
+        )
+        .order_by(months.c.month)
+    )
+
+
 class DashboardRepository:
     """Consultas otimizadas para o painel da ONG."""
 
@@ -44,96 +268,123 @@ class DashboardRepository:
         previous_start: datetime,
         previous_end: datetime,
     ) -> HeadlineMetrics:
-        current_start_date = current_start.date()
-        current_end_date = current_end.date()
-        previous_start_date = previous_start.date()
-        previous_end_date = previous_end.date()
+        result = db.execute(
+            _headline_metrics_statement(),
+            self._headline_params(
+                organization_id,
+                current_start=current_start,
+                current_end=current_end,
+                previous_start=previous_start,
+                previous_end=previous_end,
+            ),
+        ).one()
+        return self._headline_from_row(result)
 
-        active_animals = (
-            select(func.count(Animal.id))
-            .where(
-                Animal.organization_id == organization_id,
-                Animal.status.in_(
-                    [AnimalStatus.available, AnimalStatus.reserved]
+    async def fetch_headline_metrics_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        *,
+        current_start: datetime,
+        current_end: datetime,
+        previous_start: datetime,
+        previous_end: datetime,
+    ) -> HeadlineMetrics:
+        result = (
+            await db.execute(
+                _headline_metrics_statement(),
+                self._headline_params(
+                    organization_id,
+                    current_start=current_start,
+                    current_end=current_end,
+                    previous_start=previous_start,
+                    previous_end=previous_end,
                 ),
             )
-            .scalar_subquery()
-        )
-
-        adoptions_current_month = (
-            select(func.count(Adoption.id))
-            .where(
-                Adoption.organization_id == organization_id,
-                Adoption.adoption_date >= current_start,
-                Adoption.adoption_date < current_end,
-            )
-            .scalar_subquery()
-        )
+        ).one()
+        return self._headline_from_row(result)
 
-        avg_days_until_adoption = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        Adoption.adoption_date - Animal.created_at,
-                    )
-                    / 86400.0
-                )
-            )
-            .join(Animal, Animal.id == Adoption.animal_id)
-            .where(Adoption.organization_id == organization_id)
-            .scalar_subquery()
+    def fetch_expenses_by_category(
+        self,
+        db: Session,
+        organization_id: UUID,
+        *,
+        current_start_date: date,
+        current_end_date: date,
+    ) -> list[ExpenseCategoryRow]:
+        stmt = self._expenses_by_category_statement(
+            organization_id,
+            current_start_date=current_start_date,
+            current_end_date=current_end_date,
         )
+        return self._category_rows(db.execute(stmt).all())
 
-        total_adoptions = (
-            select(func.count(Adoption.id))
-            .where(Adoption.organization_id == organization_id)
-            .scalar_subquery()
-        )
-        returned_adoptions = (
-            select(func.count(Adoption.id))
-            .where(
-                Adoption.organization_id == organization_id,
-                Adoption.closed_at.isnot(None),
-            )
-            .scalar_subquery()
-        )
-        return_rate = func.coalesce(
-            cast(returned_adoptions, Float)
-            / func.nullif(cast(total_adoptions, Float), 0.0),
-            0.0,
+    async def fetch_expenses_by_category_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        *,
+        current_start_date: date,
+        current_end_date: date,
+    ) -> list[ExpenseCategoryRow]:
+        stmt = self._expenses_by_category_statement(
+            organization_id,
+            current_start_date=current_start_date,
+            current_end_date=current_end_date,
         )
+        return self._category_rows((await db.execute(stmt)).all())
 
-        expenses_current_month = (
-            select(func.coalesce(func.sum(Expense.amount), 0))
-            .where(
-                Expense.organization_id == organization_id,
-                Expense.expense_date >= current_start_date,
-                Expense.expense_date < current_end_date,
-            )
-            .scalar_subquery()
-        )
+    def fetch_monthly_series(
+        self,
+        db: Session,
+        organization_id: UUID,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> list[MonthlySeriesRow]:
+        """Série de ``start`` (inclusivo) a ``end`` (exclusivo), ambos viradas de mês."""
+        rows = db.execute(
+            _monthly_series_statement(),
+            self._monthly_series_params(organization_id, start=start, end=end),
+        ).all()
+        return self._series_rows(rows)
 
-        expenses_previous_month = (
-            select(func.coalesce(func.sum(Expense.amount), 0))
-            .where(
-                Expense.organization_id == organization_id,
-                Expense.expense_date >= previous_start_date,
-                Expense.expense_date < previous_end_date,
+    async def fetch_monthly_series_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> list[MonthlySeriesRow]:
+        rows = (
+            await db.execute(
+                _monthly_series_statement(),
+                self._monthly_series_params(organization_id, start=start, end=end),
             )
-            .scalar_subquery()
-        )
+        ).all()
+        return self._series_rows(rows)
 
-        stmt = select(
-            active_animals.label("active_animals"),
-            adoptions_current_month.label("adoptions_current_month"),
-            avg_days_until_adoption.label("avg_days_until_adoption"),
-            return_rate.label("return_rate"),
-            expenses_current_month.label("expenses_current_month"),
-            expenses_previous_month.label("expenses_previous_month"),
-        )
+    def _headline_params(
+        self,
+        organization_id: UUID,
+        *,
+        current_start: datetime,
+        current_end: datetime,
+        previous_start: datetime,
+        previous_end: datetime,
+    ) -> dict[str, Any]:
+        return {
+            "organization_id": organization_id,
+            "current_start": current_start,
+            "current_end": current_end,
+            "current_start_date": current_start.date(),
+            "current_end_date": current_end.date(),
+            "previous_start_date": previous_start.date(),
+            "previous_end_date": previous_end.date(),
+        }
 
-        result = db.execute(stmt).one()
+    def _headline_from_row(self, result: Row) -> HeadlineMetrics:
         return HeadlineMetrics(
             active_animals=int(result.active_animals or 0),
             adoptions_current_month=int(result.adoptions_current_month or 0),
@@ -147,33 +398,36 @@ class DashboardRepository:
             expenses_previous_month=Decimal(result.expenses_previous_month or 0),
         )
 
-    def fetch_expenses_by_category(
+    def _expenses_by_category_statement(
         self,
-        db: Session,
         organization_id: UUID,
         *,
         current_start_date: date,
         current_end_date: date,
-    ) -> list[ExpenseCategoryRow]:
-        stmt = (
+    ) -> Select:
+        rollup = ExpenseMonthlyRollup
+        total = func.sum(rollup.total)
+        return (
             select(
-                Expense.category_id,
+                rollup.category_id,
                 ExpenseCategory.name.label("category_name"),
-                func.coalesce(func.sum(Expense.amount), 0).label("total"),
+                func.coalesce(total, 0).label("total"),
             )
             .join(
                 ExpenseCategory,
-                ExpenseCategory.id == Expense.category_id,
+                ExpenseCategory.id == rollup.category_id,
             )
             .where(
-                Expense.organization_id == organization_id,
-                Expense.expense_date >= current_start_date,
-                Expense.expense_date < current_end_date,
+                rollup.organization_id == organization_id,
+                rollup.month >= current_start_date,
+                rollup.month < current_end_date,
             )
-            .group_by(Expense.category_id, ExpenseCategory.name)
-            .order_by(func.sum(Expense.amount).desc())
+            .group_by(rollup.category_id, ExpenseCategory.name)
+            .having(func.sum(rollup.expense_count) > 0)
+            .order_by(total.desc())
         )
-        rows = db.execute(stmt).all()
+
+    def _category_rows(self, rows: Sequence[Row]) -> list[ExpenseCategoryRow]:
         return [
             ExpenseCategoryRow(
                 category_id=row.category_id,
@@ -183,5 +437,33 @@ class DashboardRepository:
             for row in rows
         ]
 
+    def _monthly_series_params(
+        self, organization_id: UUID, *, start: datetime, end: datetime
+    ) -> dict[str, Any]:
+        return {
+            "organization_id": organization_id,
+            "start_month": start.date(),
+            "end_month": end.date(),
+            "range_start": start,
+            "range_end": end,
+        }
+
+    def _series_rows(self, rows: Sequence[Row]) -> list[MonthlySeriesRow]:
+        return [
+            MonthlySeriesRow(
+                month=row.month,
+                kind=row.kind,
+                category_id=row.category_id,
+                category_name=row.category_name,
+                value=Decimal(row.value or 0),
+            )
+            for row in rows
+        ]
+
 
-__all__ = ["DashboardRepository", "HeadlineMetrics", "ExpenseCategoryRow"]
+__all__ = [
+    "DashboardRepository",
+    "HeadlineMetrics",
+    "ExpenseCategoryRow",
+    "MonthlySeriesRow",
+]
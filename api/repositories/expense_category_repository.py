@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from sqlalchemy import Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from models.expense_category import ExpenseCategory
@@ -36,7 +37,19 @@ class ExpenseCategoryRepository:
     def list_for_organization(
         self, db: Session, organization_id: UUID
     ) -> list[ExpenseCategory]:
-        stmt = (
+        stmt = self._list_for_organization_statement(organization_id)
+        return list(db.execute(stmt).scalars())
+
+    async def list_for_organization_async(
+        self, db: AsyncSession, organization_id: UUID
+    ) -> list[ExpenseCategory]:
+        stmt = self._list_for_organization_statement(organization_id)
+        return list((await db.execute(stmt)).scalars())
+
+    def _list_for_organization_statement(
+        self, organization_id: UUID
+    ) -> Select[tuple[ExpenseCategory]]:
+        return (
             self._base_query()
             .where(
                 (ExpenseCategory.organization_id == organization_id)
@@ -44,7 +57,6 @@ class ExpenseCategoryRepository:
             )
             .order_by(ExpenseCategory.name.asc())
         )
-        return list(db.execute(stmt).scalars())
 
     def exists_with_key(
         self, db: Session, *, organization_id: UUID, key: str
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.expense import Expense
+from models.expense_monthly_rollup import ExpenseMonthlyRollup
+
+
+def month_start(day: date) -> date:
+    """Primeiro dia do mês de ``day`` (chave ``month`` do rollup)."""
+    return day.replace(day=1)
+
+
+class ExpenseMonthlyRollupRepository:
+    """Totais mensais de despesas por ONG, categoria e centro de custo."""
+
+    def apply_delta(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        category_id: UUID,
+        cost_center: str | None,
+        expense_date: date,
+        amount_delta: Decimal,
+        count_delta: int,
+    ) -> None:
+        """Soma os deltas ao mês da despesa, criando a linha quando necessário.
+
+        Uma contagem que ficaria negativa viola
+        ``ck_expense_monthly_rollups_expense_count`` e a escrita falha.
+        """
+        if not amount_delta and not count_delta:
+            return
+
+        rollup = ExpenseMonthlyRollup
+        month = month_start(expense_date)
+        if count_delta < 0:
+            # Remoções vão por UPDATE: o Postgres checa
+            # ``ck_expense_monthly_rollups_expense_count`` na linha do INSERT
+            # antes do ON CONFLICT.
+            result = db.execute(
+                update(rollup)
+                .where(
+                    rollup.organization_id == organization_id,
+                    rollup.month == month,
+                    rollup.category_id == category_id,
+                    rollup.cost_center == (cost_center or ""),
+                )
+                .values(
+                    total=rollup.total + amount_delta,
+                    expense_count=rollup.expense_count + count_delta,
+                    updated_at=func.now(),
+                )
+            )
+            if result.rowcount:
+                return
+
+        stmt = insert(rollup).values(
+            organization_id=organization_id,
+            month=month,
+            category_id=category_id,
+            cost_center=cost_center or "",
+            total=amount_delta,
+            expense_count=count_delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                rollup.organization_id,
+                rollup.month,
+                rollup.category_id,
+                rollup.cost_center,
+            ],
+            set_={
+                "total": rollup.total + amount_delta,
+                "expense_count": rollup.expense_count + count_delta,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def add_expense(self, db: Session, expense: Expense) -> None:
+        """Contabiliza uma despesa nova."""
+        self._apply_expense(db, expense, sign=1)
+
+    def remove_expense(self, db: Session, expense: Expense) -> None:
+        """Desfaz a contabilização de uma despesa removida.
+
+        Para alterações, chame com os valores antigos e depois ``add_expense``
+        com os novos: mudanças de data, categoria ou centro de custo movem o
+        valor entre linhas.
+        """
+        self._apply_expense(db, expense, sign=-1)
+
+    def _apply_expense(self, db: Session, expense: Expense, *, sign: int) -> None:
+        self.apply_delta(
+            db,
+            organization_id=expense.organization_id,
+            category_id=expense.category_id,
+            cost_center=expense.cost_center,
+            expense_date=expense.expense_date,
+            amount_delta=sign * Decimal(expense.amount),
+            count_delta=sign,
+        )
+
+
+__all__ = ["ExpenseMonthlyRollupRepository", "month_start"]
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, func, select
+from sqlalchemy import Row, Select, and_, func, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from models.expense import Expense
 from models.expense_category import ExpenseCategory
+from models.expense_monthly_rollup import ExpenseMonthlyRollup
+from repositories.expense_monthly_rollup_repository import month_start
+
+
+def _full_months(start_date: date, end_date: date) -> tuple[date, date] | None:
+    """Meses inteiros contidos em [start_date, end_date], como [início, fim)."""
+    first = start_date if start_date.day == 1 else month_start(
+        start_date + timedelta(days=32 - start_date.day)
+    )
+    end = month_start(end_date + timedelta(days=1))
+    if first >= end:
+        return None
+    return first, end
 
 
 class ExpenseRepository:
@@ -34,14 +49,114 @@ class ExpenseRepository:
         category_id: UUID | None = None,
         start_date: date | None = None,
         end_date: date | None = None,
+        after: tuple[date, datetime, UUID] | None = None,
+    ) -> list[Expense]:
+        stmt = self._list_statement(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            after=after,
+        )
+        return list(db.execute(stmt).scalars())
+
+    async def list_by_organization_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        category_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: tuple[date, datetime, UUID] | None = None,
     ) -> list[Expense]:
+        stmt = self._list_statement(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            after=after,
+        )
+        return list((await db.execute(stmt)).scalars())
+
+    def get_by_id_for_organization(
+        self, db: Session, expense_id: UUID, organization_id: UUID
+    ) -> Expense | None:
+        stmt = self._get_statement(expense_id, organization_id)
+        return db.execute(stmt).unique().scalar_one_or_none()
+
+    async def get_by_id_for_organization_async(
+        self, db: AsyncSession, expense_id: UUID, organization_id: UUID
+    ) -> Expense | None:
+        stmt = self._get_statement(expense_id, organization_id)
+        return (await db.execute(stmt)).unique().scalar_one_or_none()
+
+    def totals_by_category(
+        self,
+        db: Session,
+        organization_id: UUID,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[str, Decimal]]:
+        """Total por categoria no intervalo (datas inclusivas).
+
+        Os meses inteiros do intervalo vêm de ``expense_monthly_rollups``; só
+        os dias das pontas, quando o intervalo não começa ou termina em virada
+        de mês, são somados a partir das despesas.
+        """
+        stmt = self._totals_statement(
+            organization_id, start_date=start_date, end_date=end_date
+        )
+        return self._totals(db.execute(stmt).all())
+
+    async def totals_by_category_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[str, Decimal]]:
+        stmt = self._totals_statement(
+            organization_id, start_date=start_date, end_date=end_date
+        )
+        return self._totals((await db.execute(stmt)).all())
+
+    def _list_statement(
+        self,
+        organization_id: UUID,
+        *,
+        skip: int,
+        limit: int,
+        category_id: UUID | None,
+        start_date: date | None,
+        end_date: date | None,
+        after: tuple[date, datetime, UUID] | None,
+    ) -> Select[tuple[Expense]]:
         stmt = (
             self._base_query()
             .where(Expense.organization_id == organization_id)
-            .order_by(Expense.expense_date.desc(), Expense.created_at.desc())
-            .offset(skip)
+            .order_by(
+                Expense.expense_date.desc(),
+                Expense.created_at.desc(),
+                Expense.id.desc(),
+            )
             .limit(limit)
         )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Expense.expense_date, Expense.created_at, Expense.id)
+                < tuple_(*after)
+            )
+        else:
+            stmt = stmt.offset(skip)
 
         if category_id is not None:
             stmt = stmt.where(Expense.category_id == category_id)
@@ -49,43 +164,68 @@ class ExpenseRepository:
             stmt = stmt.where(Expense.expense_date >= start_date)
         if end_date is not None:
             stmt = stmt.where(Expense.expense_date <= end_date)
+        return stmt
 
-        return list(db.execute(stmt).scalars())
-
-    def get_by_id_for_organization(
-        self, db: Session, expense_id: UUID, organization_id: UUID
-    ) -> Expense | None:
-        stmt = self._base_query().where(
+    def _get_statement(
+        self, expense_id: UUID, organization_id: UUID
+    ) -> Select[tuple[Expense]]:
+        return self._base_query().where(
             and_(
                 Expense.id == expense_id,
                 Expense.organization_id == organization_id,
             )
         )
-        return db.execute(stmt).unique().scalar_one_or_none()
 
-    def totals_by_category(
-        self,
-        db: Session,
-        organization_id: UUID,
-        *,
-        start_date: date,
-        end_date: date,
-    ) -> list[tuple[str, Decimal]]:
-        stmt = (
+    def _totals_statement(
+        self, organization_id: UUID, *, start_date: date, end_date: date
+    ) -> Select:
+        months = _full_months(start_date, end_date)
+        if months is None:
+            raw_ranges = [(start_date, end_date + timedelta(days=1))]
+        else:
+            raw_ranges = [
+                (start_date, months[0]),
+                (months[1], end_date + timedelta(days=1)),
+            ]
+
+        parts = [
             select(
-                ExpenseCategory.name.label("name"),
-                func.coalesce(func.sum(Expense.amount), 0).label("total"),
-            )
-            .join(ExpenseCategory, ExpenseCategory.id == Expense.category_id)
-            .where(
+                Expense.category_id.label("category_id"),
+                Expense.amount.label("amount"),
+            ).where(
                 Expense.organization_id == organization_id,
-                Expense.expense_date >= start_date,
-                Expense.expense_date <= end_date,
+                Expense.expense_date >= range_start,
+                Expense.expense_date < range_end,
             )
+            for range_start, range_end in raw_ranges
+            if range_start < range_end
+        ]
+        if months is not None:
+            rollup = ExpenseMonthlyRollup
+            parts.append(
+                select(
+                    rollup.category_id.label("category_id"),
+                    rollup.total.label("amount"),
+                ).where(
+                    rollup.organization_id == organization_id,
+                    rollup.month >= months[0],
+                    rollup.month < months[1],
+                    rollup.expense_count > 0,
+                )
+            )
+        amounts = union_all(*parts).subquery("amounts")
+
+        return (
+            select(
+                ExpenseCategory.name.label("name"),
+                func.coalesce(func.sum(amounts.c.amount), 0).label("total"),
+            )
+            .join(ExpenseCategory, ExpenseCategory.id == amounts.c.category_id)
             .group_by(ExpenseCategory.name)
             .order_by(ExpenseCategory.name)
         )
-        rows = db.execute(stmt).all()
+
+    def _totals(self, rows: Sequence[Row]) -> list[tuple[str, Decimal]]:
         return [
             (row.name, Decimal(row.total or 0))
             for row in rows
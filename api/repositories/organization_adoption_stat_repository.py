@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert as sa_insert, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models.adoption import Adoption
+from models.animal import Animal
+from models.organization_adoption_stat import OrganizationAdoptionStat
+
+
+def _days_until_adoption():
+    return func.extract("epoch", Adoption.adoption_date - Animal.created_at) / 86400.0
+
+
+def _days_until_adoption_sum():
+    return func.coalesce(func.sum(_days_until_adoption()), 0.0)
+
+
+class OrganizationAdoptionStatRepository:
+    """Agregados de adoções por ONG."""
+
+    def apply_delta(
+        self,
+        db: Session | Connection,
+        *,
+        organization_id: UUID,
+        adoption_delta: int = 0,
+        closed_delta: int = 0,
+        days_delta: float = 0.0,
+    ) -> None:
+        """Soma os deltas aos agregados, criando a linha quando necessário.
+
+        Contagens que ficariam negativas violam as restrições ``CHECK`` da
+        tabela e a escrita falha, em vez de esconder a divergência.
+        """
+        if not adoption_delta and not closed_delta and not days_delta:
+            return
+
+        stat = OrganizationAdoptionStat
+        if adoption_delta < 0 or closed_delta < 0:
+            # O ``INSERT ... ON CONFLICT`` valida o ``CHECK`` na linha proposta
+            # antes de detectar o conflito: descontos atualizam a linha
+            # existente e só caem no ``INSERT`` (que falha) se ela não existir.
+            result = db.execute(
+                update(stat)
+                .where(stat.organization_id == organization_id)
+                .values(
+                    adoption_count=stat.adoption_count + adoption_delta,
+                    closed_count=stat.closed_count + closed_delta,
+                    days_until_adoption_sum=stat.days_until_adoption_sum + days_delta,
+                    updated_at=func.now(),
+                )
+            )
+            if result.rowcount:
+                return
+
+        stmt = insert(stat).values(
+            organization_id=organization_id,
+            adoption_count=adoption_delta,
+            closed_count=closed_delta,
+            days_until_adoption_sum=days_delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stat.organization_id],
+            set_={
+                "adoption_count": stat.adoption_count + adoption_delta,
+                "closed_count": stat.closed_count + closed_delta,
+                "days_until_adoption_sum": stat.days_until_adoption_sum + days_delta,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def add_adoption(self, db: Session | Connection, adoption_id: UUID) -> None:
+        """Contabiliza uma adoção já gravada (encerrada, se ``closed_at`` estiver preenchido)."""
+        self._apply_adoption(db, adoption_id, sign=1)
+
+    def remove_adoption(self, db: Session | Connection, adoption_id: UUID) -> None:
+        """Desfaz a contabilização de uma adoção ainda gravada.
+
+        Para alterações, chame antes do ``UPDATE`` e depois ``add_adoption``:
+        os valores são lidos do banco, então a troca de animal, data ou
+        ``closed_at`` é descontada e somada de novo.
+        """
+        self._apply_adoption(db, adoption_id, sign=-1)
+
+    def _apply_adoption(
+        self, db: Session | Connection, adoption_id: UUID, *, sign: int
+    ) -> None:
+        row = db.execute(
+            select(
+                Adoption.organization_id,
+                Adoption.closed_at.is_not(None),
+                _days_until_adoption(),
+            )
+            .join(Animal, Animal.id == Adoption.animal_id)
+            .where(Adoption.id == adoption_id)
+        ).one_or_none()
+        if row is None:
+            return
+        organization_id, closed, days = row
+        self.apply_delta(
+            db,
+            organization_id=organization_id,
+            adoption_delta=sign,
+            closed_delta=sign * int(closed),
+            days_delta=sign * float(days),
+        )
+
+    def rebuild(
+        self, db: Session, organization_ids: Iterable[UUID] | None = None
+    ) -> int:
+        """Recalcula os agregados a partir das adoções; todas as ONGs sem filtro.
+
+        Retorna quantas ONGs ficaram com agregados. Não faz commit.
+        """
+        stat = OrganizationAdoptionStat
+        aggregates = (
+            select(
+                Adoption.organization_id,
+                func.count(Adoption.id),
+                func.count(Adoption.closed_at),
+                _days_until_adoption_sum(),
+            )
+            .join(Animal, Animal.id == Adoption.animal_id)
+            .group_by(Adoption.organization_id)
+        )
+        clear = delete(stat)
+        if organization_ids is not None:
+            organization_ids = list(organization_ids)
+            aggregates = aggregates.where(Adoption.organization_id.in_(organization_ids))
+            clear = clear.where(stat.organization_id.in_(organization_ids))
+
+        db.execute(clear)
+        result = db.execute(
+            sa_insert(stat).from_select(
+                [
+                    stat.organization_id,
+                    stat.adoption_count,
+                    stat.closed_count,
+                    stat.days_until_adoption_sum,
+                ],
+                aggregates,
+            )
+        )
+        return result.rowcount
+
+
+__all__ = ["OrganizationAdoptionStatRepository"]
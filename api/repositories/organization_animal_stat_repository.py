@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.animal import AnimalStatus
+from models.animal_species import AnimalSpecies
+from models.organization_animal_stat import OrganizationAnimalStat
+
+
+class OrganizationAnimalStatRepository:
+    """Contadores de animais por ONG, espécie e status."""
+
+    def apply_delta(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        species_id: int,
+        status: AnimalStatus,
+        delta: int,
+    ) -> None:
+        """Soma ``delta`` ao contador, criando a linha quando necessário.
+
+        Um contador que ficaria negativo viola ``ck_organization_animal_stats_count``
+        e a escrita falha, em vez de esconder a divergência.
+        """
+        if delta == 0:
+            return
+
+        stat = OrganizationAnimalStat
+        if delta < 0:
+            # A linha proposta pelo INSERT (``count`` negativo) já violaria o
+            # CHECK antes do ON CONFLICT; sem linha para atualizar, o INSERT
+            # abaixo falha como esperado.
+            result = db.execute(
+                update(stat)
+                .where(
+                    stat.organization_id == organization_id,
+                    stat.species_id == species_id,
+                    stat.status == status,
+                )
+                .values(count=stat.count + delta, updated_at=func.now())
+            )
+            if result.rowcount:
+                return
+
+        stmt = insert(stat).values(
+            organization_id=organization_id,
+            species_id=species_id,
+            status=status,
+            count=delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stat.organization_id, stat.species_id, stat.status],
+            set_={
+                "count": stat.count + delta,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def count_by_species(
+        self, db: Session, organization_ids: Iterable[UUID]
+    ) -> dict[UUID, dict[str, int]]:
+        """Total de animais (todos os status) por slug de espécie para cada ONG."""
+        organization_ids = list(organization_ids)
+        if not organization_ids:
+            return {}
+
+        stat = OrganizationAnimalStat
+        stmt = (
+            select(
+                stat.organization_id,
+                AnimalSpecies.slug,
+                func.sum(stat.count).label("total"),
+            )
+            .join(AnimalSpecies, stat.species_id == AnimalSpecies.id)
+            .where(stat.organization_id.in_(organization_ids))
+            .group_by(stat.organization_id, AnimalSpecies.slug)
+        )
+
+        counts: dict[UUID, dict[str, int]] = defaultdict(dict)
+        for organization_id, slug, total in db.execute(stmt).all():
+            if total:
+                counts[organization_id][slug] = int(total)
+        return dict(counts)
+
+
+__all__ = ["OrganizationAnimalStatRepository"]
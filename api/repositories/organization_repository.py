@@ -1,19 +1,24 @@
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from models.animal import Animal
-from models.animal_species import AnimalSpecies
-from models.help_type import HelpType
+from db.text_search import name_matches, name_similarity
 from models.organization import GeographyPoint, Organization
 
 
+# Montadas uma vez para reaproveitar a chave de cache e o SQL compilado; a
+# busca por id roda a cada requisição autenticada sem o principal em cache.
+_GET_BY_ID = select(Organization).where(Organization.id == bindparam("organization_id"))
+_GET_BY_EMAIL = select(Organization).where(Organization.email == bindparam("email"))
+
+
 class OrganizationRepository:
     """Operações de persistência para organizações."""
 
     def _base_query(self) -> Select[tuple[Organization]]:
-        return select(Organization).options(joinedload(Organization.help_types))
+        return select(Organization)
 
     def add(self, db: Session, organization: Organization) -> Organization:
         db.add(organization)
@@ -31,12 +36,17 @@ class OrganizationRepository:
         return list(db.execute(stmt).scalars())
 
     def get_by_id(self, db: Session, organization_id: UUID) -> Organization | None:
-        stmt = self._base_query().where(Organization.id == organization_id)
-        return db.execute(stmt).unique().scalar_one_or_none()
+        result = db.execute(_GET_BY_ID, {"organization_id": organization_id})
+        return result.scalar_one_or_none()
+
+    async def get_by_id_async(
+        self, db: AsyncSession, organization_id: UUID
+    ) -> Organization | None:
+        result = await db.execute(_GET_BY_ID, {"organization_id": organization_id})
+        return result.scalar_one_or_none()
 
     def get_by_email(self, db: Session, email: str) -> Organization | None:
-        stmt = self._base_query().where(Organization.email == email)
-        return db.execute(stmt).unique().scalar_one_or_none()
+        return db.execute(_GET_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
     def search(
         self,
@@ -45,46 +55,24 @@ class OrganizationRepository:
         skip: int = 0,
         limit: int = 50,
         name: str | None = None,
-        help_type_keys: list[str] | None = None,
+        fuzzy: bool = False,
+        help_type_ids: list[int] | None = None,
         latitude: float | None = None,
         longitude: float | None = None,
         radius_km: float | None = None,
-    ) -> list[tuple[Organization, float | None, int, int]]:
+    ) -> list[tuple[Organization, float | None]]:
         stmt = self._base_query()
 
-        dogs_count = (
-            select(func.count(Animal.id))
-            .select_from(Animal)
-            .join(AnimalSpecies, Animal.species_id == AnimalSpecies.id)
-            .where(Animal.organization_id == Organization.id)
-            .where(AnimalSpecies.slug == "dog")
-            .correlate(Organization)
-            .scalar_subquery()
-            .label("dogs_count")
-        )
-        cats_count = (
-            select(func.count(Animal.id))
-            .select_from(Animal)
-            .join(AnimalSpecies, Animal.species_id == AnimalSpecies.id)
-            .where(Animal.organization_id == Organization.id)
-            .where(AnimalSpecies.slug == "cat")
-            .correlate(Organization)
-            .scalar_subquery()
-            .label("cats_count")
-        )
-
-        stmt = stmt.add_columns(dogs_count, cats_count)
-
-        if name:
-            clean_name = name.strip()
-            if clean_name:
-                stmt = stmt.where(Organization.name.ilike(f"%{clean_name}%"))
-
-        if help_type_keys:
+        clean_name = name.strip() if name else ""
+        if clean_name:
             stmt = stmt.where(
-                Organization.help_types.any(HelpType.key.in_(help_type_keys))
+                name_matches(Organization.name, clean_name, fuzzy=fuzzy)
             )
 
+        if help_type_ids is not None:
+            # && sobre o array denormalizado, atendido pelo índice GIN.
+            stmt = stmt.where(Organization.help_type_ids.overlap(help_type_ids))
+
         distance_expr = None
         if latitude is not None and longitude is not None:
             radius_meters = (radius_km or 25.0) * 1000.0
@@ -102,6 +90,11 @@ class OrganizationRepository:
             ).label("distance_km")
             stmt = stmt.add_columns(distance_expr)
             stmt = stmt.order_by(distance_expr)
+        elif clean_name and fuzzy:
+            stmt = stmt.order_by(
+                name_similarity(Organization.name, clean_name).desc(),
+                Organization.created_at.desc(),
+            )
         else:
             stmt = stmt.order_by(Organization.created_at.desc())
 
@@ -109,23 +102,7 @@ class OrganizationRepository:
 
         if distance_expr is not None:
             records = db.execute(stmt).all()
-            return [
-                (
-                    organization,
-                    distance,
-                    int(dogs_count or 0),
-                    int(cats_count or 0),
-                )
-                for organization, dogs_count, cats_count, distance in records
-            ]
-
-        records = db.execute(stmt).all()
-        return [
-            (
-                organization,
-                None,
-                int(dogs_count or 0),
-                int(cats_count or 0),
-            )
-            for organization, dogs_count, cats_count in records
-        ]
+            return [(organization, distance) for organization, distance in records]
+
+        organizations = db.execute(stmt).scalars()
+        return [(organization, None) for organization in organizations]
@@ -5,6 +5,7 @@ from .auth_router import router as auth_router
 from .dashboard_router import router as dashboard_router
 from .expense_category_router import router as expense_category_router
 from .expense_router import router as expense_router
+from .metrics_router import router as metrics_router
 from .organization_router import router as organization_router
 
 api_router = APIRouter()
@@ -14,5 +15,6 @@ api_router.include_router(expense_category_router)
 api_router.include_router(expense_router)
 api_router.include_router(auth_router)
 api_router.include_router(dashboard_router)
+api_router.include_router(metrics_router)
 
 __all__ = ["api_router"]
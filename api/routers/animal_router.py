@@ -1,35 +1,72 @@
-from fastapi import APIRouter, Depends, Query, status
+from dataclasses import asdict, dataclass
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from controllers.animal_controller import (
     create_animal,
+    delete_animal,
     list_animals_by_organization,
+    list_animals_by_organization_async,
     list_characteristics,
+    search_animals_with_facets,
+    search_animals_with_facets_async,
     search_available_animals,
+    search_available_animals_async,
     list_species,
+    list_species_async,
+    update_animal_status,
+)
+from core.dependencies import (
+    dispatch,
+    get_current_organization,
+    get_dispatch_db,
+    get_dispatch_organization,
+    get_dispatch_read_db,
 )
-from core.dependencies import get_current_organization
+from core.principal import OrganizationPrincipal
 from db.session import get_db
-from models.organization import Organization
-from models.animal import AnimalSex, AnimalSize, AnimalStatus, TemperamentTrait
+from models.animal import (
+    AnimalSex,
+    AnimalSize,
+    AnimalStatus,
+    EnvironmentPreference,
+    SociableTarget,
+    TemperamentTrait,
+)
 from schemas.animal import (
     AnimalCharacteristicsRead,
     AnimalCreate,
     AnimalListItemRead,
     AnimalPublicRead,
     AnimalRead,
+    AnimalSearchResultRead,
     AnimalSpeciesRead,
+    AnimalStatusUpdate,
+    CharacteristicMatch,
 )
 
 router = APIRouter(prefix="/animals", tags=["Animais"])
 
 
-@router.get(
-    "",
-    response_model=list[AnimalPublicRead],
-    summary="Listar animais disponíveis próximos",
-)
-def list_available_animals_route(
+@dataclass(slots=True)
+class AnimalSearchParams:
+    latitude: float
+    longitude: float
+    radius_km: float
+    species_id: int | None
+    size: AnimalSize | None
+    sex: AnimalSex | None
+    age_years: int | None
+    temperament_traits: list[TemperamentTrait] | None
+    environment_preferences: list[EnvironmentPreference] | None
+    sociable_with: list[SociableTarget] | None
+    match: CharacteristicMatch
+
+
+def animal_search_params(
     latitude: float = Query(
         ...,
         ge=-90,
@@ -71,22 +108,91 @@ def list_available_animals_route(
         None,
         description="Informe múltiplas vezes para combinar temperamentos desejados.",
     ),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
-) -> list[AnimalPublicRead]:
-    return search_available_animals(
-        db,
+    environment_preferences: list[EnvironmentPreference] | None = Query(
+        None,
+        description="Informe múltiplas vezes para combinar ambientes recomendados.",
+    ),
+    sociable_with: list[SociableTarget] | None = Query(
+        None,
+        description="Informe múltiplas vezes para combinar com quem o pet convive bem.",
+    ),
+    match: CharacteristicMatch = Query(
+        CharacteristicMatch.all,
+        description=(
+            "Como combinar os valores de cada característica: all exige todos, "
+            "any aceita qualquer um."
+        ),
+    ),
+) -> AnimalSearchParams:
+    """Filtros compartilhados pelas rotas de busca pública."""
+    return AnimalSearchParams(
         latitude=latitude,
         longitude=longitude,
-        skip=skip,
-        limit=limit,
         radius_km=radius_km,
         species_id=species_id,
         size=size,
         sex=sex,
         age_years=age_years,
         temperament_traits=temperament_traits,
+        environment_preferences=environment_preferences,
+        sociable_with=sociable_with,
+        match=match,
+    )
+
+
+@router.get(
+    "",
+    response_model=list[AnimalPublicRead],
+    summary="Listar animais disponíveis próximos",
+)
+async def list_available_animals_route(
+    params: AnimalSearchParams = Depends(animal_search_params),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description=(
+            "Cursor opaco retornado no cabeçalho X-Next-Cursor. "
+            "Quando informado, o parâmetro skip é ignorado."
+        ),
+    ),
+    db: Session | AsyncSession = Depends(get_dispatch_read_db),
+) -> Response:
+    return await dispatch(
+        search_available_animals,
+        search_available_animals_async,
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        **asdict(params),
+    )
+
+
+@router.get(
+    "/search",
+    response_model=AnimalSearchResultRead,
+    summary="Buscar animais próximos com total e facetas",
+)
+async def search_animals_with_facets_route(
+    params: AnimalSearchParams = Depends(animal_search_params),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description="Cursor opaco retornado em next_cursor.",
+    ),
+    db: Session | AsyncSession = Depends(get_dispatch_read_db),
+) -> Response:
+    """Retorna a página de resultados junto às contagens usadas nos filtros."""
+    return await dispatch(
+        search_animals_with_facets,
+        search_animals_with_facets_async,
+        db,
+        limit=limit,
+        cursor=cursor,
+        **asdict(params),
     )
 
 
@@ -95,9 +201,17 @@ def list_available_animals_route(
     response_model=list[AnimalListItemRead],
     summary="Listar animais da ONG autenticada",
 )
-def list_organization_animals_route(
+async def list_organization_animals_route(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description=(
+            "Cursor opaco retornado no cabeçalho X-Next-Cursor. "
+            "Quando informado, o parâmetro skip é ignorado."
+        ),
+    ),
     name: str | None = Query(
         None,
         min_length=1,
@@ -108,16 +222,19 @@ def list_organization_animals_route(
         None,
         description="Filtrar pelo status atual (available, reserved, etc).",
     ),
-    db: Session = Depends(get_db),
-    organization: Organization = Depends(get_current_organization),
-) -> list[AnimalListItemRead]:
-    return list_animals_by_organization(
+    db: Session | AsyncSession = Depends(get_dispatch_db),
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+) -> Response:
+    return await dispatch(
+        list_animals_by_organization,
+        list_animals_by_organization_async,
         db,
         organization=organization,
         skip=skip,
         limit=limit,
         name=name,
         status=status,
+        cursor=cursor,
     )
 
 
@@ -126,9 +243,11 @@ def list_organization_animals_route(
     response_model=list[AnimalSpeciesRead],
     summary="Listar espécies de animais disponíveis",
 )
-def list_animal_species(db: Session = Depends(get_db)) -> list[AnimalSpeciesRead]:
+async def list_animal_species(
+    db: Session | AsyncSession = Depends(get_dispatch_read_db),
+) -> list[AnimalSpeciesRead]:
     """Retorna as espécies cadastradas para seleção."""
-    return list_species(db)
+    return await dispatch(list_species, list_species_async, db)
 
 
 @router.get(
@@ -150,7 +269,38 @@ def list_animal_characteristics() -> AnimalCharacteristicsRead:
 def register_animal(
     payload: AnimalCreate,
     db: Session = Depends(get_db),
-    organization: Organization = Depends(get_current_organization),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
 ) -> AnimalRead:
     """Registra um animal vinculado a uma ONG."""
     return create_animal(payload, organization=organization, db=db)
+
+
+@router.patch(
+    "/{animal_id}/status",
+    response_model=AnimalRead,
+    summary="Atualizar o status de um animal",
+)
+def change_animal_status(
+    animal_id: UUID,
+    payload: AnimalStatusUpdate,
+    db: Session = Depends(get_db),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
+) -> AnimalRead:
+    """Altera o status (disponível, reservado, adotado...) de um animal da ONG."""
+    return update_animal_status(
+        animal_id, payload, organization=organization, db=db
+    )
+
+
+@router.delete(
+    "/{animal_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Excluir um animal da ONG",
+)
+def remove_animal(
+    animal_id: UUID,
+    db: Session = Depends(get_db),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
+) -> None:
+    """Remove um animal sem despesas vinculadas."""
+    delete_animal(animal_id, organization=organization, db=db)
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from controllers.dashboard_controller import get_dashboard_summary
-from core.dependencies import get_current_organization
-from db.session import get_db
-from models.organization import Organization
-from schemas.dashboard import DashboardSummaryRead
+from controllers.dashboard_controller import (
+    get_dashboard_summary,
+    get_dashboard_summary_async,
+    get_dashboard_timeseries,
+    get_dashboard_timeseries_async,
+)
+from core.dependencies import dispatch, get_dispatch_db, get_dispatch_organization
+from core.principal import OrganizationPrincipal
+from schemas.dashboard import DashboardSummaryRead, DashboardTimeseriesRead
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -15,11 +20,40 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
     response_model=DashboardSummaryRead,
     summary="Resumo consolidado para o painel da ONG",
 )
-def read_dashboard_summary(
-    db: Session = Depends(get_db),
-    organization: Organization = Depends(get_current_organization),
+async def read_dashboard_summary(
+    db: Session | AsyncSession = Depends(get_dispatch_db),
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
 ) -> DashboardSummaryRead:
-    return get_dashboard_summary(db=db, organization=organization)
+    return await dispatch(
+        get_dashboard_summary,
+        get_dashboard_summary_async,
+        db,
+        organization=organization,
+    )
+
+
+@router.get(
+    "/timeseries",
+    response_model=DashboardTimeseriesRead,
+    summary="Série mensal de despesas, adoções, devoluções e entradas",
+)
+async def read_dashboard_timeseries(
+    db: Session | AsyncSession = Depends(get_dispatch_db),
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+    months: int = Query(
+        12,
+        ge=1,
+        le=36,
+        description="Quantidade de meses, terminando no mês atual.",
+    ),
+) -> DashboardTimeseriesRead:
+    return await dispatch(
+        get_dashboard_timeseries,
+        get_dashboard_timeseries_async,
+        db,
+        organization=organization,
+        months=months,
+    )
 
 
 __all__ = ["router"]
@@ -1,16 +1,23 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from controllers.expense_category_controller import (
     create_category,
     delete_category,
     list_categories,
+    list_categories_async,
 )
-from core.dependencies import get_current_organization
+from core.dependencies import (
+    dispatch,
+    get_current_organization,
+    get_dispatch_db,
+    get_dispatch_organization,
+)
+from core.principal import OrganizationPrincipal
 from db.session import get_db
-from models.organization import Organization
 from schemas.expense_category import ExpenseCategoryCreate, ExpenseCategoryRead
 
 router = APIRouter(prefix="/expense-categories", tags=["Categorias de Despesas"])
@@ -21,11 +28,13 @@ router = APIRouter(prefix="/expense-categories", tags=["Categorias de Despesas"]
     response_model=list[ExpenseCategoryRead],
     summary="Listar categorias acessíveis pela ONG",
 )
-def list_expense_categories(
-    organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db),
+async def list_expense_categories(
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+    db: Session | AsyncSession = Depends(get_dispatch_db),
 ) -> list[ExpenseCategoryRead]:
-    return list_categories(organization, db)
+    return await dispatch(
+        list_categories, list_categories_async, db, organization=organization
+    )
 
 
 @router.post(
@@ -36,7 +45,7 @@ def list_expense_categories(
 )
 def create_expense_category(
     payload: ExpenseCategoryCreate,
-    organization: Organization = Depends(get_current_organization),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
     db: Session = Depends(get_db),
 ) -> ExpenseCategoryRead:
     return create_category(organization, payload, db)
@@ -49,7 +58,7 @@ def create_expense_category(
 )
 def delete_expense_category(
     category_id: UUID,
-    organization: Organization = Depends(get_current_organization),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
     db: Session = Depends(get_db),
 ) -> None:
     delete_category(organization, category_id, db)
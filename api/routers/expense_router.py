@@ -2,18 +2,27 @@ from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from controllers.expense_controller import (
     create_expense,
     get_expense,
+    get_expense_async,
     list_expenses,
+    list_expenses_async,
     summarize_expenses_by_category,
+    summarize_expenses_by_category_async,
 )
-from core.dependencies import get_current_organization
+from core.dependencies import (
+    dispatch,
+    get_current_organization,
+    get_dispatch_db,
+    get_dispatch_organization,
+)
+from core.principal import OrganizationPrincipal
 from db.session import get_db
-from models.organization import Organization
 from schemas.expense import ExpenseCreate, ExpenseRead
 
 router = APIRouter(prefix="/expenses", tags=["Despesas"])
@@ -27,7 +36,7 @@ router = APIRouter(prefix="/expenses", tags=["Despesas"])
 )
 def register_expense(
     payload: ExpenseCreate,
-    organization: Organization = Depends(get_current_organization),
+    organization: OrganizationPrincipal = Depends(get_current_organization),
     db: Session = Depends(get_db),
 ) -> ExpenseRead:
     return create_expense(organization, payload, db)
@@ -38,23 +47,36 @@ def register_expense(
     response_model=list[ExpenseRead],
     summary="Listar despesas da ONG",
 )
-def list_organization_expenses(
-    organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db),
+async def list_organization_expenses(
+    response: Response,
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+    db: Session | AsyncSession = Depends(get_dispatch_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description=(
+            "Cursor opaco retornado no cabeçalho X-Next-Cursor. "
+            "Quando informado, o parâmetro skip é ignorado."
+        ),
+    ),
     category_id: UUID | None = Query(None),
     start_date: date | None = Query(None),
     end_date: date | None = Query(None),
 ) -> list[ExpenseRead]:
-    return list_expenses(
-        organization,
+    return await dispatch(
+        list_expenses,
+        list_expenses_async,
         db,
+        organization=organization,
+        response=response,
         skip=skip,
         limit=limit,
         category_id=category_id,
         start_date=start_date,
         end_date=end_date,
+        cursor=cursor,
     )
 
 
@@ -63,12 +85,18 @@ def list_organization_expenses(
     response_model=ExpenseRead,
     summary="Obter detalhes de uma despesa",
 )
-def retrieve_expense(
+async def retrieve_expense(
     expense_id: UUID,
-    organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db),
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+    db: Session | AsyncSession = Depends(get_dispatch_db),
 ) -> ExpenseRead:
-    return get_expense(organization, expense_id, db)
+    return await dispatch(
+        get_expense,
+        get_expense_async,
+        db,
+        organization=organization,
+        expense_id=expense_id,
+    )
 
 
 @router.get(
@@ -76,9 +104,9 @@ def retrieve_expense(
     response_model=dict[str, Decimal],
     summary="Totalizar despesas por categoria em um período",
 )
-def get_expense_totals_by_category(
-    organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db),
+async def get_expense_totals_by_category(
+    organization: OrganizationPrincipal = Depends(get_dispatch_organization),
+    db: Session | AsyncSession = Depends(get_dispatch_db),
     start_date: date = Query(..., description="Data inicial do período"),
     end_date: date = Query(..., description="Data final do período"),
 ) -> dict[str, Decimal]:
@@ -87,9 +115,11 @@ def get_expense_totals_by_category(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A data inicial não pode ser posterior à data final.",
         )
-    return summarize_expenses_by_category(
-        organization,
+    return await dispatch(
+        summarize_expenses_by_category,
+        summarize_expenses_by_category_async,
         db,
+        organization=organization,
         start_date=start_date,
         end_date=end_date,
     )
@@ -0,0 +1,51 @@
+from fastapi import APIRouter
+
+from controllers.metrics_controller import (
+    list_cache_stats,
+    list_index_audit_findings,
+    list_pool_stats,
+)
+from core.config import get_settings
+from schemas.metrics import CacheStatsRead, IndexAuditFindingRead, PoolStatsRead
+
+router = APIRouter(prefix="/metrics", tags=["Métricas"])
+settings = get_settings()
+
+# As métricas expõem detalhes internos do worker e não exigem autenticação:
+# só são montadas com METRICS_ENABLED.
+if settings.metrics_enabled:
+
+    @router.get(
+        "/caches",
+        response_model=dict[str, CacheStatsRead],
+        summary="Métricas dos caches em memória deste worker",
+    )
+    def read_cache_metrics() -> dict[str, CacheStatsRead]:
+        """Retorna acertos, falhas e ocupação de cada cache registrado."""
+        return list_cache_stats()
+
+    @router.get(
+        "/pool",
+        response_model=dict[str, PoolStatsRead],
+        summary="Métricas dos pools de conexão deste worker",
+    )
+    def read_pool_metrics() -> dict[str, PoolStatsRead]:
+        """Retorna ocupação, overflow e tempo de espera por conexão de cada engine."""
+        return list_pool_stats()
+
+
+# Publica o texto das consultas; existe apenas com a auditoria ligada
+# (desenvolvimento/CI).
+if settings.db_index_audit:
+
+    @router.get(
+        "/index-audit",
+        response_model=list[IndexAuditFindingRead],
+        summary="Consultas sem índice apontadas pela auditoria (DB_INDEX_AUDIT)",
+    )
+    def read_index_audit() -> list[IndexAuditFindingRead]:
+        """Retorna os filtros lidos por seq scan mesmo sem enable_seqscan."""
+        return list_index_audit_findings()
+
+
+__all__ = ["router"]
@@ -9,6 +9,7 @@ from controllers.organization_controller import (
     list_organizations,
     search_organizations,
 )
+from core.dependencies import get_read_db
 from db.session import get_db
 from schemas.organization import (
     HelpType,
@@ -41,7 +42,7 @@ def register_organization(
 def list_registered_organizations(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[OrganizationRead]:
     """Retorna uma lista paginada de ONGs."""
     return list_organizations(db, skip=skip, limit=limit)
@@ -56,6 +57,13 @@ def search_ongs(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     name: str | None = Query(None, min_length=1, max_length=255),
+    fuzzy: bool = Query(
+        False,
+        description=(
+            "Tolera erros de digitação no nome e, sem coordenadas, ordena "
+            "pela semelhança com o termo."
+        ),
+    ),
     help_types: list[HelpType] | None = Query(
         None,
         description="Filtrar por tipos de ajuda. Use o parâmetro várias vezes para múltiplos valores.",
@@ -78,7 +86,7 @@ def search_ongs(
         le=300,
         description="Raio de busca em quilômetros. Padrão 25 km.",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[OrganizationSearchRead]:
     """Busca ONGs por nome, tipo de ajuda e proximidade geográfica."""
     if (latitude is None) ^ (longitude is None):
@@ -92,6 +100,7 @@ def search_ongs(
         skip=skip,
         limit=limit,
         name=name,
+        fuzzy=fuzzy,
         help_types=help_types,
         latitude=latitude,
         longitude=longitude,
@@ -105,7 +114,7 @@ def search_ongs(
     summary="Detalhar uma ONG específica",
 )
 def retrieve_organization(
-    organization_id: UUID, db: Session = Depends(get_db)
+    organization_id: UUID, db: Session = Depends(get_read_db)
 ) -> OrganizationRead:
     """Busca informações da ONG pelo ID."""
     return get_organization(organization_id, db)
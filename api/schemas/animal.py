@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from enum import Enum
 from typing import List
 from uuid import UUID
 
@@ -16,6 +17,11 @@ from models.animal import (
 )
 
 
+class CharacteristicMatch(str, Enum):
+    all = "all"
+    any = "any"
+
+
 class AnimalSpeciesBase(BaseModel):
     slug: str = Field(..., min_length=2, max_length=50)
     label: str = Field(..., min_length=2, max_length=100)
@@ -124,6 +130,71 @@ class AnimalPublicRead(AnimalRead):
     organization: AnimalOrganizationSummary
 
 
+class AnimalCardRead(BaseModel):
+    id: UUID
+    organization_id: UUID
+    name: str = Field(..., min_length=1, max_length=255)
+    species: AnimalSpeciesRead
+    sex: AnimalSex
+    age_years: int | None = Field(None, ge=0, le=50)
+    size: AnimalSize
+    temperament_traits: list[TemperamentTrait] = Field(default_factory=list)
+    environment_preferences: list[EnvironmentPreference] = Field(default_factory=list)
+    sociable_with: list[SociableTarget] = Field(default_factory=list)
+    vaccinated: bool = False
+    neutered: bool = False
+    dewormed: bool = False
+    status: AnimalStatus
+    created_at: datetime
+    photo_url: AnyHttpUrl | str | None = Field(
+        None,
+        description="URL da principal foto cadastrada para o animal.",
+    )
+    distance_km: float = Field(
+        ...,
+        ge=0,
+        description="Distância aproximada em quilômetros até as coordenadas informadas.",
+    )
+    organization: AnimalOrganizationSummary
+
+
+class FacetBucketRead(BaseModel):
+    value: str
+    label: str
+    count: int = Field(..., ge=0)
+
+
+class AnimalSearchFacetsRead(BaseModel):
+    species: list[FacetBucketRead] = Field(default_factory=list)
+    size: list[FacetBucketRead] = Field(default_factory=list)
+    sex: list[FacetBucketRead] = Field(default_factory=list)
+    temperament_traits: list[FacetBucketRead] = Field(default_factory=list)
+
+
+class AnimalSearchResultRead(BaseModel):
+    total: int = Field(
+        ...,
+        ge=0,
+        description="Total de animais que atendem a todos os filtros no raio informado.",
+    )
+    items: list[AnimalCardRead]
+    next_cursor: str | None = Field(
+        None,
+        description="Cursor para a próxima página, quando houver.",
+    )
+    facets: AnimalSearchFacetsRead = Field(
+        ...,
+        description=(
+            "Contagens por valor de cada filtro. Cada faceta desconsidera o "
+            "próprio filtro para exibir as alternativas disponíveis."
+        ),
+    )
+
+
+class AnimalStatusUpdate(BaseModel):
+    status: AnimalStatus
+
+
 class AnimalListItemRead(BaseModel):
     id: UUID
     name: str = Field(..., min_length=1, max_length=255)
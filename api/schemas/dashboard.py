@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
@@ -45,6 +46,34 @@ class DashboardSummaryRead(BaseModel):
     )
     expenses: ExpensesHighlightRead
     expenses_by_category: list[ExpensesByCategoryRead]
+    generated_at: datetime = Field(
+        ...,
+        description=(
+            "Momento em que os números foram calculados; o painel pode ser servido "
+            "de um retrato em cache."
+        ),
+    )
+
+
+class DashboardMonthRead(BaseModel):
+    month: date = Field(..., description="Primeiro dia do mês (UTC).")
+    adoptions: int = Field(0, ge=0)
+    returns: int = Field(
+        0,
+        ge=0,
+        description="Adoções encerradas/devolvidas no mês.",
+    )
+    intake: int = Field(0, ge=0, description="Animais cadastrados no mês.")
+    expenses_total: Decimal = Field(0, ge=0)
+    expenses_by_category: list[ExpensesByCategoryRead]
+
+
+class DashboardTimeseriesRead(BaseModel):
+    months: list[DashboardMonthRead]
+    generated_at: datetime = Field(
+        ...,
+        description="Momento em que a série foi calculada.",
+    )
 
 
 __all__ = [
@@ -52,4 +81,6 @@ __all__ = [
     "ExpensesHighlightRead",
     "ExpensesByCategoryRead",
     "DashboardSummaryRead",
+    "DashboardMonthRead",
+    "DashboardTimeseriesRead",
 ]
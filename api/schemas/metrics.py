@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class CacheStatsRead(BaseModel):
+    hits: int = Field(0, ge=0)
+    misses: int = Field(0, ge=0)
+    hit_rate: float = Field(0, ge=0, le=1)
+    evictions: int = Field(0, ge=0)
+    invalidations: int = Field(0, ge=0)
+    size: int = Field(0, ge=0, description="Entradas atualmente em cache.")
+    maxsize: int = Field(0, ge=0)
+    ttl_seconds: float = Field(0, ge=0)
+
+
+class PoolStatsRead(BaseModel):
+    size: int = Field(0, ge=0, description="Conexões permanentes do pool.")
+    max_overflow: int = Field(0, ge=0)
+    checked_out: int = Field(0, ge=0, description="Conexões em uso por requisições.")
+    idle: int = Field(0, ge=0, description="Conexões abertas aguardando checkout.")
+    overflow: int = Field(0, ge=0, description="Conexões extras abertas além de size.")
+    checkouts: int = Field(0, ge=0)
+    timeouts: int = Field(
+        0, ge=0, description="Checkouts que esgotaram DB_POOL_TIMEOUT_SECONDS."
+    )
+    wait_avg_ms: float = Field(0, ge=0)
+    wait_max_ms: float = Field(0, ge=0)
+
+
+class IndexAuditFindingRead(BaseModel):
+    table: str
+    filter: str = Field(..., description="Predicado lido sem apoio de índice.")
+    statement: str = Field(..., description="Primeira consulta em que o filtro apareceu.")
+
+
+__all__ = ["CacheStatsRead", "IndexAuditFindingRead", "PoolStatsRead"]
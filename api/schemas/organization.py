@@ -88,3 +88,7 @@ class OrganizationSearchRead(OrganizationRead):
         ge=0,
         description="Quantidade de gatos cadastrados pela ONG.",
     )
+    species_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Quantidade de animais cadastrados pela ONG por espécie (slug).",
+    )
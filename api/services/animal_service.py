@@ -1,6 +1,20 @@
 from __future__ import annotations
+
+import math
+import threading
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.cache import TTLCache, register_cache
+from core.config import get_settings
+from core.pagination import Page, decode_cursor, encode_cursor
+from core.principal import OrganizationPrincipal
+from db.replicas import replica_may_lag
 from models.animal import (
     Animal,
     AnimalSex,
@@ -12,16 +26,99 @@ from models.animal import (
 )
 from models.animal_photo import AnimalPhoto
 from models.animal_species import AnimalSpecies
-from models.organization import Organization
 from repositories.animal_repository import AnimalRepository
+from repositories.animal_search_document_repository import (
+    AnimalSearchDocumentRepository,
+    AnimalSearchFacets,
+    AnimalSearchFilters,
+)
 from repositories.animal_species_repository import AnimalSpeciesRepository
-from schemas.animal import AnimalCreate, AnimalCharacteristicsRead
+from repositories.organization_animal_stat_repository import (
+    OrganizationAnimalStatRepository,
+)
+from schemas.animal import (
+    AnimalCreate,
+    AnimalCharacteristicsRead,
+    CharacteristicMatch,
+)
 
 
 class AnimalSpeciesNotFoundError(Exception):
     """Raised when the informed animal species does not exist."""
 
 
+class AnimalNotFoundError(Exception):
+    """Raised when the animal does not exist or belongs to another organization."""
+
+
+class AnimalHasExpensesError(Exception):
+    """Raised when trying to delete an animal referenced by expenses."""
+
+
+class SearchCacheKey(NamedTuple):
+    latitude: float
+    longitude: float
+    radius_km: float
+    filters: AnimalSearchFilters
+    skip: int
+    limit: int
+    cursor: str | None
+    detailed: bool
+
+
+class FacetsCacheKey(NamedTuple):
+    latitude: float
+    longitude: float
+    radius_km: float
+    filters: AnimalSearchFilters
+
+
+settings = get_settings()
+animal_search_cache: TTLCache[
+    SearchCacheKey, Page[tuple[Row, float]]
+] = register_cache(
+    "animal_search",
+    TTLCache(
+        maxsize=settings.search_cache_max_entries,
+        ttl_seconds=settings.search_cache_ttl_seconds,
+    ),
+)
+animal_facets_cache: TTLCache[FacetsCacheKey, AnimalSearchFacets] = register_cache(
+    "animal_search_facets",
+    TTLCache(
+        maxsize=settings.search_cache_max_entries,
+        ttl_seconds=settings.search_cache_ttl_seconds,
+    ),
+)
+# Catálogo de espécies (somente leitura, mantido por migrações). As instâncias
+# em cache ficam desanexadas da sessão e só são lidas pelos controllers.
+species_catalog_cache: TTLCache[str, list[AnimalSpecies]] = register_cache(
+    "species",
+    TTLCache(maxsize=1, ttl_seconds=settings.reference_cache_ttl_seconds),
+)
+
+# Incrementada a cada invalidação da busca neste worker. Uma consulta que
+# começou antes de uma invalidação não grava o resultado: ele pode ter sido
+# lido antes da escrita. As chaves reúnem animais de várias ONGs, por isso o
+# contador é único, e não por ONG como no painel.
+_search_generation = 0
+_search_generation_lock = threading.Lock()
+
+_EARTH_RADIUS_KM = 6371.0088
+_KM_PER_DEGREE = 111.32
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
 class AnimalService:
     """Regras de negócio relacionadas aos animais."""
 
@@ -52,14 +149,47 @@ class AnimalService:
         self,
         animal_repository: AnimalRepository | None = None,
         animal_species_repository: AnimalSpeciesRepository | None = None,
+        search_document_repository: AnimalSearchDocumentRepository | None = None,
+        stat_repository: OrganizationAnimalStatRepository | None = None,
+        search_cache: TTLCache[
+            SearchCacheKey, Page[tuple[Row, float]]
+        ] | None = None,
+        facets_cache: TTLCache[FacetsCacheKey, AnimalSearchFacets] | None = None,
+        species_cache: TTLCache[str, list[AnimalSpecies]] | None = None,
+        cell_degrees: float | None = None,
     ) -> None:
         self.animal_repository = animal_repository or AnimalRepository()
         self.animal_species_repository = (
             animal_species_repository or AnimalSpeciesRepository()
         )
+        self.search_document_repository = (
+            search_document_repository or AnimalSearchDocumentRepository()
+        )
+        self.stat_repository = stat_repository or OrganizationAnimalStatRepository()
+        self.search_cache = (
+            search_cache if search_cache is not None else animal_search_cache
+        )
+        self.facets_cache = (
+            facets_cache if facets_cache is not None else animal_facets_cache
+        )
+        self.species_cache = (
+            species_cache if species_cache is not None else species_catalog_cache
+        )
+        self.cell_degrees = cell_degrees or settings.search_cache_cell_degrees
 
     def list_species(self, db: Session) -> list[AnimalSpecies]:
-        return self.animal_species_repository.list_all(db)
+        species = self.species_cache.get("catalog")
+        if species is None:
+            species = self.animal_species_repository.list_all(db)
+            self.species_cache.set("catalog", species)
+        return species
+
+    async def list_species_async(self, db: AsyncSession) -> list[AnimalSpecies]:
+        species = self.species_cache.get("catalog")
+        if species is None:
+            species = await self.animal_species_repository.list_all_async(db)
+            self.species_cache.set("catalog", species)
+        return species
 
     def list_characteristics(self) -> AnimalCharacteristicsRead:
         def _options(enum_cls, labels: dict) -> list[dict[str, str]]:
@@ -79,7 +209,7 @@ class AnimalService:
     def create_animal(
         self,
         db: Session,
-        organization: Organization,
+        organization: OrganizationPrincipal,
         payload: AnimalCreate,
     ) -> Animal:
         species = self.animal_species_repository.get_by_id(db, payload.species_id)
@@ -114,14 +244,74 @@ class AnimalService:
 
         self.animal_repository.add(db, animal)
         try:
+            db.flush()
+            self.search_document_repository.refresh(db, animal_ids=[animal.id])
+            self._count_animal(db, animal, animal.status, delta=1)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        self._invalidate_search_cache(organization)
+        db.refresh(animal)
+        return animal
+
+    def update_status(
+        self,
+        db: Session,
+        organization: OrganizationPrincipal,
+        animal_id: UUID,
+        status: AnimalStatus,
+    ) -> Animal:
+        # Bloqueia o animal: o status lido abaixo decide quais contadores mudam.
+        animal = self.animal_repository.get_by_id_for_update(db, animal_id)
+        if animal is None or animal.organization_id != organization.id:
+            raise AnimalNotFoundError
+
+        previous_status = animal.status
+        animal.status = status
+        try:
+            db.flush()
+            self.search_document_repository.refresh(db, animal_ids=[animal.id])
+            if previous_status != status:
+                self._count_animal(db, animal, previous_status, delta=-1)
+                self._count_animal(db, animal, status, delta=1)
             db.commit()
         except Exception:
             db.rollback()
             raise
 
+        self._invalidate_search_cache(organization)
         db.refresh(animal)
         return animal
 
+    def delete_animal(
+        self,
+        db: Session,
+        organization: OrganizationPrincipal,
+        animal_id: UUID,
+    ) -> None:
+        # Bloqueia o animal: o status lido abaixo decide qual contador é descontado.
+        animal = self.animal_repository.get_by_id_for_update(db, animal_id)
+        if animal is None or animal.organization_id != organization.id:
+            raise AnimalNotFoundError
+        if self.animal_repository.count_expenses(db, animal.id) > 0:
+            raise AnimalHasExpensesError
+
+        # O documento de busca e as adoções são removidos em cascata junto com
+        # o animal; a exclusão de cada adoção desconta os agregados da ONG
+        # (ver ``services.dashboard_service``) dentro do mesmo flush.
+        self.animal_repository.delete(db, animal)
+        try:
+            db.flush()
+            self._count_animal(db, animal, animal.status, delta=-1)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        self._invalidate_search_cache(organization)
+
     def search_available_animals(
         self,
         db: Session,
@@ -136,37 +326,402 @@ class AnimalService:
         sex: AnimalSex | None = None,
         age_years: int | None = None,
         temperament_traits: list[TemperamentTrait] | None = None,
-    ) -> list[tuple[Animal, float]]:
-        effective_radius = radius_km if radius_km is not None else 50.0
-        return self.animal_repository.search_available(
-            db,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+        cursor: str | None = None,
+        detailed: bool = False,
+    ) -> Page[tuple[Row, float]]:
+        cache_key = self._search_key(
             latitude=latitude,
             longitude=longitude,
-            radius_km=effective_radius,
             skip=skip,
             limit=limit,
+            radius_km=radius_km,
             species_id=species_id,
             size=size,
             sex=sex,
             age_years=age_years,
             temperament_traits=temperament_traits,
+            environment_preferences=environment_preferences,
+            sociable_with=sociable_with,
+            match=match,
+            cursor=cursor,
+            detailed=detailed,
+        )
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = _search_generation
+        items = self.search_document_repository.search_available(
+            db, **self._search_arguments(cache_key, latitude, longitude)
         )
+        return self._store_search_page(db, cache_key, items, generation)
+
+    async def search_available_animals_async(
+        self,
+        db: AsyncSession,
+        *,
+        latitude: float,
+        longitude: float,
+        skip: int = 0,
+        limit: int = 50,
+        radius_km: float | None = None,
+        species_id: int | None = None,
+        size: AnimalSize | None = None,
+        sex: AnimalSex | None = None,
+        age_years: int | None = None,
+        temperament_traits: list[TemperamentTrait] | None = None,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+        cursor: str | None = None,
+        detailed: bool = False,
+    ) -> Page[tuple[Row, float]]:
+        cache_key = self._search_key(
+            latitude=latitude,
+            longitude=longitude,
+            skip=skip,
+            limit=limit,
+            radius_km=radius_km,
+            species_id=species_id,
+            size=size,
+            sex=sex,
+            age_years=age_years,
+            temperament_traits=temperament_traits,
+            environment_preferences=environment_preferences,
+            sociable_with=sociable_with,
+            match=match,
+            cursor=cursor,
+            detailed=detailed,
+        )
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = _search_generation
+        items = await self.search_document_repository.search_available_async(
+            db, **self._search_arguments(cache_key, latitude, longitude)
+        )
+        return self._store_search_page(db, cache_key, items, generation)
+
+    def search_facets(
+        self,
+        db: Session,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        species_id: int | None = None,
+        size: AnimalSize | None = None,
+        sex: AnimalSex | None = None,
+        age_years: int | None = None,
+        temperament_traits: list[TemperamentTrait] | None = None,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+    ) -> AnimalSearchFacets:
+        cache_key = self._facets_key(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            species_id=species_id,
+            size=size,
+            sex=sex,
+            age_years=age_years,
+            temperament_traits=temperament_traits,
+            environment_preferences=environment_preferences,
+            sociable_with=sociable_with,
+            match=match,
+        )
+        cached = self.facets_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = _search_generation
+        facets = self.search_document_repository.count_facets(
+            db, **self._facets_arguments(cache_key, latitude, longitude)
+        )
+        self._store(db, self.facets_cache, cache_key, facets, generation)
+        return facets
+
+    async def search_facets_async(
+        self,
+        db: AsyncSession,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        species_id: int | None = None,
+        size: AnimalSize | None = None,
+        sex: AnimalSex | None = None,
+        age_years: int | None = None,
+        temperament_traits: list[TemperamentTrait] | None = None,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+    ) -> AnimalSearchFacets:
+        cache_key = self._facets_key(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            species_id=species_id,
+            size=size,
+            sex=sex,
+            age_years=age_years,
+            temperament_traits=temperament_traits,
+            environment_preferences=environment_preferences,
+            sociable_with=sociable_with,
+            match=match,
+        )
+        cached = self.facets_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = _search_generation
+        facets = await self.search_document_repository.count_facets_async(
+            db, **self._facets_arguments(cache_key, latitude, longitude)
+        )
+        self._store(db, self.facets_cache, cache_key, facets, generation)
+        return facets
+
+    def temperament_label(self, trait: TemperamentTrait) -> str:
+        return self._TEMPERAMENT_LABELS.get(trait, trait.value)
 
     def list_animals_by_organization(
         self,
         db: Session,
         *,
-        organization: Organization,
+        organization: OrganizationPrincipal,
+        skip: int = 0,
+        limit: int = 50,
+        name: str | None = None,
+        status: AnimalStatus | None = None,
+        cursor: str | None = None,
+    ) -> Page[Row]:
+        after = decode_cursor(cursor, datetime, UUID) if cursor is not None else None
+        animals = self.animal_repository.list_by_organization(
+            db,
+            organization_id=organization.id,
+            skip=skip,
+            limit=limit,
+            name=name,
+            status=status,
+            after=after,
+        )
+        return self._organization_page(animals, limit)
+
+    async def list_animals_by_organization_async(
+        self,
+        db: AsyncSession,
+        *,
+        organization: OrganizationPrincipal,
         skip: int = 0,
         limit: int = 50,
         name: str | None = None,
         status: AnimalStatus | None = None,
-    ) -> list[Animal]:
-        return self.animal_repository.list_by_organization(
+        cursor: str | None = None,
+    ) -> Page[Row]:
+        after = decode_cursor(cursor, datetime, UUID) if cursor is not None else None
+        animals = await self.animal_repository.list_by_organization_async(
             db,
             organization_id=organization.id,
             skip=skip,
             limit=limit,
             name=name,
             status=status,
+            after=after,
         )
+        return self._organization_page(animals, limit)
+
+    def _organization_page(self, animals: list[Row], limit: int) -> Page[Row]:
+        next_cursor = None
+        if len(animals) == limit:
+            last_animal = animals[-1]
+            next_cursor = encode_cursor([last_animal.created_at, last_animal.id])
+        return Page(items=animals, next_cursor=next_cursor)
+
+    def _search_key(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        skip: int,
+        limit: int,
+        radius_km: float | None = None,
+        species_id: int | None = None,
+        size: AnimalSize | None = None,
+        sex: AnimalSex | None = None,
+        age_years: int | None = None,
+        temperament_traits: list[TemperamentTrait] | None = None,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+        cursor: str | None,
+        detailed: bool,
+    ) -> SearchCacheKey:
+        # Buscas da mesma vizinhança caem na mesma célula e compartilham o cache.
+        # Só a chave é quantizada: a consulta usa a coordenada informada.
+        return SearchCacheKey(
+            latitude=self._snap(latitude),
+            longitude=self._snap(longitude),
+            radius_km=radius_km if radius_km is not None else 50.0,
+            filters=self._build_filters(
+                species_id=species_id,
+                size=size,
+                sex=sex,
+                age_years=age_years,
+                temperament_traits=temperament_traits,
+                environment_preferences=environment_preferences,
+                sociable_with=sociable_with,
+                match=match,
+            ),
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            detailed=detailed,
+        )
+
+    def _facets_key(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        species_id: int | None = None,
+        size: AnimalSize | None = None,
+        sex: AnimalSex | None = None,
+        age_years: int | None = None,
+        temperament_traits: list[TemperamentTrait] | None = None,
+        environment_preferences: list[EnvironmentPreference] | None = None,
+        sociable_with: list[SociableTarget] | None = None,
+        match: CharacteristicMatch = CharacteristicMatch.all,
+    ) -> FacetsCacheKey:
+        return FacetsCacheKey(
+            latitude=self._snap(latitude),
+            longitude=self._snap(longitude),
+            radius_km=radius_km if radius_km is not None else 50.0,
+            filters=self._build_filters(
+                species_id=species_id,
+                size=size,
+                sex=sex,
+                age_years=age_years,
+                temperament_traits=temperament_traits,
+                environment_preferences=environment_preferences,
+                sociable_with=sociable_with,
+                match=match,
+            ),
+        )
+
+    def _search_arguments(
+        self, cache_key: SearchCacheKey, latitude: float, longitude: float
+    ) -> dict[str, Any]:
+        after = (
+            decode_cursor(cache_key.cursor, float, datetime, UUID)
+            if cache_key.cursor is not None
+            else None
+        )
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "radius_km": cache_key.radius_km,
+            "filters": cache_key.filters,
+            "skip": cache_key.skip,
+            "limit": cache_key.limit,
+            "after": after,
+            "detailed": cache_key.detailed,
+        }
+
+    def _facets_arguments(
+        self, cache_key: FacetsCacheKey, latitude: float, longitude: float
+    ) -> dict[str, Any]:
+        return cache_key._replace(latitude=latitude, longitude=longitude)._asdict()
+
+    def _store_search_page(
+        self,
+        db: Session | AsyncSession,
+        cache_key: SearchCacheKey,
+        items: list[tuple[Row, float]],
+        generation: int,
+    ) -> Page[tuple[Row, float]]:
+        next_cursor = None
+        if len(items) == cache_key.limit:
+            last_document, last_distance = items[-1]
+            next_cursor = encode_cursor(
+                [last_distance, last_document.created_at, last_document.animal_id]
+            )
+        page = Page(items=items, next_cursor=next_cursor)
+        self._store(db, self.search_cache, cache_key, page, generation)
+        return page
+
+    def _store(
+        self,
+        db: Session | AsyncSession,
+        cache: TTLCache[Any, Any],
+        key: SearchCacheKey | FacetsCacheKey,
+        value: object,
+        generation: int,
+    ) -> None:
+        # Não grava se houve invalidação durante a consulta ou se ela leu de
+        # uma réplica que pode ainda não ter a escrita que invalidou o cache.
+        if generation != _search_generation or replica_may_lag(db):
+            return
+        cache.set(key, value)
+
+    def _build_filters(
+        self,
+        *,
+        species_id: int | None,
+        size: AnimalSize | None,
+        sex: AnimalSex | None,
+        age_years: int | None,
+        temperament_traits: list[TemperamentTrait] | None,
+        environment_preferences: list[EnvironmentPreference] | None,
+        sociable_with: list[SociableTarget] | None,
+        match: CharacteristicMatch,
+    ) -> AnimalSearchFilters:
+        return AnimalSearchFilters(
+            species_id=species_id,
+            size=size,
+            sex=sex,
+            age_years=age_years,
+            temperament_traits=tuple(sorted(set(temperament_traits or []))),
+            environment_preferences=tuple(sorted(set(environment_preferences or []))),
+            sociable_with=tuple(sorted(set(sociable_with or []))),
+            match_all=match is CharacteristicMatch.all,
+        )
+
+    def _count_animal(
+        self, db: Session, animal: Animal, status: AnimalStatus, *, delta: int
+    ) -> None:
+        self.stat_repository.apply_delta(
+            db,
+            organization_id=animal.organization_id,
+            species_id=animal.species_id,
+            status=status,
+            delta=delta,
+        )
+
+    def _snap(self, value: float) -> float:
+        return round(round(value / self.cell_degrees) * self.cell_degrees, 6)
+
+    def _invalidate_search_cache(self, organization: OrganizationPrincipal) -> None:
+        if organization.latitude is None or organization.longitude is None:
+            return  # ONGs sem localização não aparecem na busca.
+
+        global _search_generation
+        with _search_generation_lock:
+            _search_generation += 1
+
+        latitude = float(organization.latitude)
+        longitude = float(organization.longitude)
+        # Folga de uma célula: a chave guarda o centro quantizado, não a coordenada consultada.
+        slack_km = self.cell_degrees * _KM_PER_DEGREE
+
+        def _reaches_organization(key: SearchCacheKey | FacetsCacheKey) -> bool:
+            distance = _haversine_km(key.latitude, key.longitude, latitude, longitude)
+            return distance <= key.radius_km + slack_km
+
+        self.search_cache.invalidate_where(_reaches_organization)
+        self.facets_cache.invalidate_where(_reaches_organization)
@@ -1,34 +1,241 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
+from core.cache import TTLCache, register_cache
+from core.config import get_settings
+from models.adoption import Adoption
+from models.animal import Animal
+from models.expense import Expense
 from repositories.dashboard_repository import (
     DashboardRepository,
     ExpenseCategoryRow,
     HeadlineMetrics,
+    MonthlySeriesRow,
+)
+from repositories.organization_adoption_stat_repository import (
+    OrganizationAdoptionStatRepository,
 )
 from schemas.dashboard import (
     AdoptionStatsRead,
+    DashboardMonthRead,
     DashboardSummaryRead,
+    DashboardTimeseriesRead,
     ExpensesByCategoryRead,
     ExpensesHighlightRead,
 )
 
 
+class DashboardSnapshotKey(NamedTuple):
+    organization_id: UUID
+    month: date
+
+
+class TimeseriesCacheKey(NamedTuple):
+    organization_id: UUID
+    month: date
+    months: int
+
+
+T = TypeVar("T")
+
+settings = get_settings()
+# O mês faz parte da chave e o TTL nunca passa da virada: na troca de mês a
+# janela "mês atual" muda e o retrato é recalculado.
+dashboard_snapshot_cache: TTLCache[
+    DashboardSnapshotKey, DashboardSummaryRead
+] = register_cache(
+    "dashboard",
+    TTLCache(
+        maxsize=settings.dashboard_cache_max_entries,
+        ttl_seconds=settings.dashboard_cache_ttl_seconds,
+    ),
+)
+dashboard_timeseries_cache: TTLCache[
+    TimeseriesCacheKey, DashboardTimeseriesRead
+] = register_cache(
+    "dashboard_timeseries",
+    TTLCache(
+        maxsize=settings.dashboard_cache_max_entries,
+        ttl_seconds=settings.dashboard_cache_ttl_seconds,
+    ),
+)
+# Incrementado a cada invalidação: um retrato calculado enquanto outra
+# requisição confirmava uma escrita da mesma ONG não chega a ser guardado.
+_generations: dict[UUID, int] = {}
+_generations_lock = threading.Lock()
+_PENDING_KEY = "dashboard_organizations"
+_adoption_stats = OrganizationAdoptionStatRepository()
+# Campos de ``adoptions`` que entram nos agregados de adoção por ONG.
+_ADOPTION_STAT_FIELDS = ("organization_id", "animal_id", "adoption_date", "closed_at")
+
+
+def invalidate_dashboard(organization_id: UUID) -> None:
+    """Descarta o retrato e as séries do painel da ONG neste worker."""
+    with _generations_lock:
+        _generations[organization_id] = _generations.get(organization_id, 0) + 1
+
+    def _belongs(key: DashboardSnapshotKey | TimeseriesCacheKey) -> bool:
+        return key.organization_id == organization_id
+
+    dashboard_snapshot_cache.invalidate_where(_belongs)
+    dashboard_timeseries_cache.invalidate_where(_belongs)
+
+
 @dataclass(slots=True)
 class DashboardService:
     """Orquestra as consultas e cálculos para o painel da ONG."""
 
     repository: DashboardRepository = DashboardRepository()
+    cache: TTLCache[DashboardSnapshotKey, DashboardSummaryRead] = (
+        dashboard_snapshot_cache
+    )
+
+    timeseries_cache: TTLCache[TimeseriesCacheKey, DashboardTimeseriesRead] = (
+        dashboard_timeseries_cache
+    )
 
     def get_summary(self, db: Session, organization_id: UUID) -> DashboardSummaryRead:
-        current_start = self._start_of_month(datetime.now(timezone.utc))
+        now = datetime.now(timezone.utc)
+        current_start = self._start_of_month(now)
+        current_end = self._shift_month(current_start, 1)
+        return self._cached(
+            self.cache,
+            DashboardSnapshotKey(organization_id, current_start.date()),
+            now,
+            current_end,
+            lambda: self._build_summary(
+                db, organization_id, now, current_start, current_end
+            ),
+        )
+
+    def get_timeseries(
+        self, db: Session, organization_id: UUID, *, months: int
+    ) -> DashboardTimeseriesRead:
+        """Série dos últimos ``months`` meses, incluindo o mês atual."""
+        now = datetime.now(timezone.utc)
+        current_start = self._start_of_month(now)
         current_end = self._shift_month(current_start, 1)
+        start = self._shift_month(current_start, 1 - months)
+        return self._cached(
+            self.timeseries_cache,
+            TimeseriesCacheKey(organization_id, current_start.date(), months),
+            now,
+            current_end,
+            lambda: DashboardTimeseriesRead(
+                months=self._serialize_months(
+                    self.repository.fetch_monthly_series(
+                        db, organization_id, start=start, end=current_end
+                    )
+                ),
+                generated_at=now,
+            ),
+        )
+
+    async def get_summary_async(
+        self, db: AsyncSession, organization_id: UUID
+    ) -> DashboardSummaryRead:
+        now = datetime.now(timezone.utc)
+        current_start = self._start_of_month(now)
+        current_end = self._shift_month(current_start, 1)
+        return await self._cached_async(
+            self.cache,
+            DashboardSnapshotKey(organization_id, current_start.date()),
+            now,
+            current_end,
+            lambda: self._build_summary_async(
+                db, organization_id, now, current_start, current_end
+            ),
+        )
+
+    async def get_timeseries_async(
+        self, db: AsyncSession, organization_id: UUID, *, months: int
+    ) -> DashboardTimeseriesRead:
+        now = datetime.now(timezone.utc)
+        current_start = self._start_of_month(now)
+        current_end = self._shift_month(current_start, 1)
+        start = self._shift_month(current_start, 1 - months)
+
+        async def build() -> DashboardTimeseriesRead:
+            rows = await self.repository.fetch_monthly_series_async(
+                db, organization_id, start=start, end=current_end
+            )
+            return DashboardTimeseriesRead(
+                months=self._serialize_months(rows), generated_at=now
+            )
+
+        return await self._cached_async(
+            self.timeseries_cache,
+            TimeseriesCacheKey(organization_id, current_start.date(), months),
+            now,
+            current_end,
+            build,
+        )
+
+    def _cached(
+        self,
+        cache: TTLCache[Any, T],
+        key: DashboardSnapshotKey | TimeseriesCacheKey,
+        now: datetime,
+        current_end: datetime,
+        build: Callable[[], T],
+    ) -> T:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = _generations.get(key.organization_id, 0)
+        value = build()
+        self._store(cache, key, generation, value, now, current_end)
+        return value
+
+    async def _cached_async(
+        self,
+        cache: TTLCache[Any, T],
+        key: DashboardSnapshotKey | TimeseriesCacheKey,
+        now: datetime,
+        current_end: datetime,
+        build: Callable[[], Awaitable[T]],
+    ) -> T:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = _generations.get(key.organization_id, 0)
+        value = await build()
+        self._store(cache, key, generation, value, now, current_end)
+        return value
+
+    def _store(
+        self,
+        cache: TTLCache[Any, T],
+        key: DashboardSnapshotKey | TimeseriesCacheKey,
+        generation: int,
+        value: T,
+        now: datetime,
+        current_end: datetime,
+    ) -> None:
+        if _generations.get(key.organization_id, 0) == generation:
+            ttl = min(cache.ttl_seconds, (current_end - now).total_seconds())
+            cache.set(key, value, ttl_seconds=ttl)
+
+    def _build_summary(
+        self,
+        db: Session,
+        organization_id: UUID,
+        now: datetime,
+        current_start: datetime,
+        current_end: datetime,
+    ) -> DashboardSummaryRead:
         previous_start = self._shift_month(current_start, -1)
         previous_end = current_start
 
@@ -46,7 +253,41 @@ class DashboardService:
             current_start_date=current_start.date(),
             current_end_date=current_end.date(),
         )
+        return self._summary(headline, categories, now)
 
+    async def _build_summary_async(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        now: datetime,
+        current_start: datetime,
+        current_end: datetime,
+    ) -> DashboardSummaryRead:
+        previous_start = self._shift_month(current_start, -1)
+        previous_end = current_start
+
+        headline = await self.repository.fetch_headline_metrics_async(
+            db,
+            organization_id,
+            current_start=current_start,
+            current_end=current_end,
+            previous_start=previous_start,
+            previous_end=previous_end,
+        )
+        categories = await self.repository.fetch_expenses_by_category_async(
+            db,
+            organization_id,
+            current_start_date=current_start.date(),
+            current_end_date=current_end.date(),
+        )
+        return self._summary(headline, categories, now)
+
+    def _summary(
+        self,
+        headline: HeadlineMetrics,
+        categories: list[ExpenseCategoryRow],
+        now: datetime,
+    ) -> DashboardSummaryRead:
         return DashboardSummaryRead(
             active_animals=headline.active_animals,
             adoptions=AdoptionStatsRead(
@@ -64,6 +305,7 @@ class DashboardService:
                 ),
             ),
             expenses_by_category=self._serialize_categories(categories),
+            generated_at=now,
         )
 
     def _calculate_variation(
@@ -95,5 +337,118 @@ class DashboardService:
             for row in rows
         ]
 
+    def _serialize_months(
+        self, rows: list[MonthlySeriesRow]
+    ) -> list[DashboardMonthRead]:
+        months: dict[date, DashboardMonthRead] = {}
+        for row in rows:
+            point = months.get(row.month)
+            if point is None:
+                point = months[row.month] = DashboardMonthRead(
+                    month=row.month,
+                    expenses_total=Decimal(0),
+                    expenses_by_category=[],
+                )
+            if row.kind == "adoptions":
+                point.adoptions = int(row.value)
+            elif row.kind == "returns":
+                point.returns = int(row.value)
+            elif row.kind == "intake":
+                point.intake = int(row.value)
+            elif row.kind == "expenses":
+                point.expenses_total += row.value
+                point.expenses_by_category.append(
+                    ExpensesByCategoryRead(
+                        category_id=row.category_id,
+                        category_name=row.category_name,
+                        total=row.value,
+                    )
+                )
+        for point in months.values():
+            point.expenses_by_category.sort(key=lambda item: item.total, reverse=True)
+        return list(months.values())
+
+
+def _mark_pending(target: Any) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.organization_id)
+
+
+@event.listens_for(Expense, "after_insert")
+@event.listens_for(Expense, "after_update")
+@event.listens_for(Expense, "after_delete")
+@event.listens_for(Adoption, "after_insert")
+@event.listens_for(Adoption, "after_update")
+@event.listens_for(Adoption, "after_delete")
+@event.listens_for(Animal, "after_insert")
+@event.listens_for(Animal, "after_delete")
+def _on_dashboard_write(_mapper: Any, _connection: Any, target: Any) -> None:
+    _mark_pending(target)
+
+
+@event.listens_for(Animal, "after_update")
+def _on_animal_update(_mapper: Any, _connection: Any, target: Animal) -> None:
+    if inspect(target).attrs.status.history.has_changes():
+        _mark_pending(target)
+
+
+# Os agregados de adoção são mantidos na mesma conexão do flush, portanto na
+# mesma transação da escrita em ``adoptions`` (inclusive das exclusões em
+# cascata de um animal).
+@event.listens_for(Adoption, "after_insert")
+def _count_inserted_adoption(_mapper: Any, connection: Any, target: Adoption) -> None:
+    _adoption_stats.add_adoption(connection, target.id)
+
+
+@event.listens_for(Adoption, "before_delete")
+def _discount_deleted_adoption(
+    _mapper: Any, connection: Any, target: Adoption
+) -> None:
+    _adoption_stats.remove_adoption(connection, target.id)
+
+
+def _adoption_stats_changed(target: Adoption) -> bool:
+    attrs = inspect(target).attrs
+    return any(
+        getattr(attrs, field).history.has_changes() for field in _ADOPTION_STAT_FIELDS
+    )
+
+
+@event.listens_for(Adoption, "before_update")
+def _discount_updated_adoption(
+    _mapper: Any, connection: Any, target: Adoption
+) -> None:
+    if _adoption_stats_changed(target):
+        _adoption_stats.remove_adoption(connection, target.id)
+
+
+@event.listens_for(Adoption, "after_update")
+def _recount_updated_adoption(
+    _mapper: Any, connection: Any, target: Adoption
+) -> None:
+    if _adoption_stats_changed(target):
+        _adoption_stats.add_adoption(connection, target.id)
+
+
+# Invalida só após o commit: antes disso outra requisição recalcularia o
+# retrato sem a escrita e o guardaria de novo.
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for organization_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_dashboard(organization_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
 
-__all__ = ["DashboardService"]
+__all__ = [
+    "DashboardService",
+    "DashboardSnapshotKey",
+    "TimeseriesCacheKey",
+    "dashboard_snapshot_cache",
+    "dashboard_timeseries_cache",
+    "invalidate_dashboard",
+]
@@ -5,10 +5,11 @@ import re
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.principal import OrganizationPrincipal
 from models.expense_category import ExpenseCategory
-from models.organization import Organization
 from repositories.expense_category_repository import ExpenseCategoryRepository
 from schemas.expense_category import ExpenseCategoryCreate
 
@@ -40,12 +41,17 @@ class ExpenseCategoryService:
     repository: ExpenseCategoryRepository = ExpenseCategoryRepository()
 
     def list_categories(
-        self, db: Session, organization: Organization
+        self, db: Session, organization: OrganizationPrincipal
     ) -> list[ExpenseCategory]:
         return self.repository.list_for_organization(db, organization.id)
 
+    async def list_categories_async(
+        self, db: AsyncSession, organization: OrganizationPrincipal
+    ) -> list[ExpenseCategory]:
+        return await self.repository.list_for_organization_async(db, organization.id)
+
     def create_category(
-        self, db: Session, organization: Organization, payload: ExpenseCategoryCreate
+        self, db: Session, organization: OrganizationPrincipal, payload: ExpenseCategoryCreate
     ) -> ExpenseCategory:
         normalized_key = self._normalize_key(payload.key)
 
@@ -72,7 +78,7 @@ class ExpenseCategoryService:
         return category
 
     def delete_category(
-        self, db: Session, organization: Organization, category_id: UUID
+        self, db: Session, organization: OrganizationPrincipal, category_id: UUID
     ) -> None:
         category = self.repository.get_by_id(db, category_id)
         if category is None:
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.pagination import Page, decode_cursor, encode_cursor
+from core.principal import OrganizationPrincipal
 from models.expense import Expense
 from models.expense_attachment import ExpenseAttachment
-from models.organization import Organization
 from repositories.animal_repository import AnimalRepository
 from repositories.expense_category_repository import ExpenseCategoryRepository
+from repositories.expense_monthly_rollup_repository import (
+    ExpenseMonthlyRollupRepository,
+)
 from repositories.expense_repository import ExpenseRepository
 from schemas.expense import ExpenseCreate
 
@@ -35,9 +40,12 @@ class ExpenseService:
     expense_repository: ExpenseRepository = ExpenseRepository()
     category_repository: ExpenseCategoryRepository = ExpenseCategoryRepository()
     animal_repository: AnimalRepository = AnimalRepository()
+    rollup_repository: ExpenseMonthlyRollupRepository = (
+        ExpenseMonthlyRollupRepository()
+    )
 
     def create_expense(
-        self, db: Session, organization: Organization, payload: ExpenseCreate
+        self, db: Session, organization: OrganizationPrincipal, payload: ExpenseCreate
     ) -> Expense:
         category = self.category_repository.get_by_id(db, payload.category_id)
         if (
@@ -72,6 +80,7 @@ class ExpenseService:
 
         self.expense_repository.add(db, expense)
         try:
+            self.rollup_repository.add_expense(db, expense)
             db.commit()
         except Exception:
             db.rollback()
@@ -83,15 +92,19 @@ class ExpenseService:
     def list_expenses(
         self,
         db: Session,
-        organization: Organization,
+        organization: OrganizationPrincipal,
         *,
         skip: int = 0,
         limit: int = 50,
         category_id: UUID | None = None,
         start_date: date | None = None,
         end_date: date | None = None,
-    ) -> list[Expense]:
-        return self.expense_repository.list_by_organization(
+        cursor: str | None = None,
+    ) -> Page[Expense]:
+        after = (
+            decode_cursor(cursor, date, datetime, UUID) if cursor is not None else None
+        )
+        expenses = self.expense_repository.list_by_organization(
             db,
             organization.id,
             skip=skip,
@@ -99,10 +112,39 @@ class ExpenseService:
             category_id=category_id,
             start_date=start_date,
             end_date=end_date,
+            after=after,
         )
+        return self._page(expenses, limit)
+
+    async def list_expenses_async(
+        self,
+        db: AsyncSession,
+        organization: OrganizationPrincipal,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        category_id: UUID | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        cursor: str | None = None,
+    ) -> Page[Expense]:
+        after = (
+            decode_cursor(cursor, date, datetime, UUID) if cursor is not None else None
+        )
+        expenses = await self.expense_repository.list_by_organization_async(
+            db,
+            organization.id,
+            skip=skip,
+            limit=limit,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            after=after,
+        )
+        return self._page(expenses, limit)
 
     def get_expense(
-        self, db: Session, organization: Organization, expense_id: UUID
+        self, db: Session, organization: OrganizationPrincipal, expense_id: UUID
     ) -> Expense:
         expense = self.expense_repository.get_by_id_for_organization(
             db, expense_id, organization.id
@@ -111,10 +153,20 @@ class ExpenseService:
             raise ExpenseNotFoundError
         return expense
 
+    async def get_expense_async(
+        self, db: AsyncSession, organization: OrganizationPrincipal, expense_id: UUID
+    ) -> Expense:
+        expense = await self.expense_repository.get_by_id_for_organization_async(
+            db, expense_id, organization.id
+        )
+        if expense is None:
+            raise ExpenseNotFoundError
+        return expense
+
     def totals_by_category(
         self,
         db: Session,
-        organization: Organization,
+        organization: OrganizationPrincipal,
         *,
         start_date: date,
         end_date: date,
@@ -126,3 +178,28 @@ class ExpenseService:
             end_date=end_date,
         )
         return {name: total for name, total in rows}
+
+    async def totals_by_category_async(
+        self,
+        db: AsyncSession,
+        organization: OrganizationPrincipal,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, Decimal]:
+        rows = await self.expense_repository.totals_by_category_async(
+            db,
+            organization.id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return {name: total for name, total in rows}
+
+    def _page(self, expenses: list[Expense], limit: int) -> Page[Expense]:
+        next_cursor = None
+        if len(expenses) == limit:
+            last_expense = expenses[-1]
+            next_cursor = encode_cursor(
+                [last_expense.expense_date, last_expense.created_at, last_expense.id]
+            )
+        return Page(items=expenses, next_cursor=next_cursor)
@@ -5,13 +5,23 @@ from typing import Iterable
 from uuid import UUID
 
 from sqlalchemy import func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from core.security import get_password_hash, verify_password
+from core.cache import TTLCache, register_cache
+from core.config import get_settings
+from core.security import (
+    PasswordHasherBusyError,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from models.help_type import HelpType
 from models.organization import Organization
 from repositories.help_type_repository import HelpTypeRepository
+from repositories.organization_animal_stat_repository import (
+    OrganizationAnimalStatRepository,
+)
 from repositories.organization_repository import OrganizationRepository
 from schemas.organization import (
     HelpType as HelpTypeEnum,
@@ -44,6 +54,14 @@ class HelpTypeNotFoundError(Exception):
         return f"Tipos de ajuda não encontrados: {keys}."
 
 
+settings = get_settings()
+# Catálogo id -> key dos tipos de ajuda; dados de referência, raramente mudam.
+help_type_catalog_cache: TTLCache[str, dict[int, str]] = register_cache(
+    "help_types",
+    TTLCache(maxsize=1, ttl_seconds=settings.reference_cache_ttl_seconds),
+)
+
+
 class OrganizationService:
     """Regras de negócio para o domínio de organizações."""
 
@@ -51,9 +69,17 @@ class OrganizationService:
         self,
         organization_repository: OrganizationRepository | None = None,
         help_type_repository: HelpTypeRepository | None = None,
+        animal_stat_repository: OrganizationAnimalStatRepository | None = None,
+        help_type_cache: TTLCache[str, dict[int, str]] | None = None,
     ) -> None:
         self.organization_repository = organization_repository or OrganizationRepository()
         self.help_type_repository = help_type_repository or HelpTypeRepository()
+        self.animal_stat_repository = (
+            animal_stat_repository or OrganizationAnimalStatRepository()
+        )
+        self.help_type_cache = (
+            help_type_cache if help_type_cache is not None else help_type_catalog_cache
+        )
 
     def create_organization(
         self, db: Session, payload: OrganizationCreate
@@ -68,7 +94,7 @@ class OrganizationService:
         help_types = self._get_help_types_by_keys(db, keys)
 
         organization = Organization(**data)
-        organization.help_types = [help_types[key] for key in keys]
+        self._set_help_types(organization, [help_types[key] for key in keys])
         self._apply_location(organization)
 
         self.organization_repository.add(db, organization)
@@ -105,6 +131,8 @@ class OrganizationService:
             raise InvalidCredentialsError
         if not organization.is_active:
             raise InactiveOrganizationError
+        if password_needs_rehash(organization.hashed_password):
+            self._rehash_password(db, organization, password)
         return organization
 
     def search_organizations(
@@ -114,26 +142,84 @@ class OrganizationService:
         skip: int = 0,
         limit: int = 50,
         name: str | None = None,
+        fuzzy: bool = False,
         help_types: list[HelpTypeEnum] | None = None,
         latitude: float | None = None,
         longitude: float | None = None,
         radius_km: float | None = None,
-    ) -> list[tuple[Organization, float | None, int, int]]:
-        help_type_keys = (
-            [help_type.value for help_type in help_types] if help_types else None
-        )
+    ) -> list[tuple[Organization, float | None, dict[str, int]]]:
+        help_type_ids = None
+        if help_types:
+            keys = {help_type.value for help_type in help_types}
+            help_type_ids = [
+                help_type_id
+                for help_type_id, key in self.help_type_catalog(db).items()
+                if key in keys
+            ]
 
         results = self.organization_repository.search(
             db,
             skip=skip,
             limit=limit,
             name=name,
-            help_type_keys=help_type_keys,
+            fuzzy=fuzzy,
+            help_type_ids=help_type_ids,
             latitude=latitude,
             longitude=longitude,
             radius_km=radius_km,
         )
-        return results
+        species_counts = self.animal_stat_repository.count_by_species(
+            db, [organization.id for organization, _ in results]
+        )
+        return [
+            (organization, distance, species_counts.get(organization.id, {}))
+            for organization, distance in results
+        ]
+
+    def help_type_catalog(self, db: Session) -> dict[int, str]:
+        """Mapa id -> key dos tipos de ajuda, mantido em cache."""
+        catalog = self.help_type_cache.get("catalog")
+        if catalog is None:
+            catalog = {
+                help_type.id: help_type.key
+                for help_type in self.help_type_repository.list_all(db)
+            }
+            self.help_type_cache.set("catalog", catalog)
+        return catalog
+
+    def help_type_keys(self, db: Session, organization: Organization) -> list[str]:
+        """Tipos de ajuda da ONG a partir da coluna denormalizada, sem join."""
+        catalog = self.help_type_catalog(db)
+        return [
+            catalog[help_type_id]
+            for help_type_id in organization.help_type_ids
+            if help_type_id in catalog
+        ]
+
+    def _rehash_password(
+        self, db: Session, organization: Organization, password: str
+    ) -> None:
+        # Atualiza o custo do hash aproveitando a senha já validada; uma falha
+        # aqui não deve impedir o login.
+        try:
+            hashed_password = get_password_hash(password)
+        except PasswordHasherBusyError:
+            return  # Sem processo livre: tenta de novo no próximo login.
+
+        organization.hashed_password = hashed_password
+        try:
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            return
+        db.refresh(organization)
+
+    def _set_help_types(
+        self, organization: Organization, help_types: list[HelpType]
+    ) -> None:
+        # A tabela de associação continua sendo a fonte; o array acompanha.
+        organization.help_types = help_types
+        organization.help_type_ids = [help_type.id for help_type in help_types]
 
     def _get_help_types_by_keys(
         self, db: Session, keys: Iterable[str]
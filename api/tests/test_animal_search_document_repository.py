@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models.animal import Animal, AnimalSex, AnimalSize, TemperamentTrait
+from models.animal_photo import AnimalPhoto
+from models.animal_species import AnimalSpecies
+from models.organization import Organization
+from repositories.animal_search_document_repository import (
+    AnimalSearchDocumentRepository,
+    AnimalSearchFilters,
+)
+
+LATITUDE = -23.5505
+LONGITUDE = -46.6333
+
+repository = AnimalSearchDocumentRepository()
+
+
+@pytest.fixture
+def species(db: Session) -> AnimalSpecies:
+    species = db.execute(select(AnimalSpecies).limit(1)).scalar_one_or_none()
+    if species is None:
+        pytest.skip("catálogo de espécies vazio; rode as migrações")
+    return species
+
+
+@pytest.fixture
+def organization(db: Session) -> Organization:
+    suffix = uuid4().hex[:12]
+    organization = Organization(
+        name="ONG Teste",
+        cnpj=suffix,
+        email=f"{suffix}@example.com",
+        accepts_terms=True,
+        latitude=LATITUDE,
+        longitude=LONGITUDE,
+        location=func.ST_SetSRID(func.ST_MakePoint(LONGITUDE, LATITUDE), 4326),
+    )
+    db.add(organization)
+    db.flush()
+    return organization
+
+
+def _add_animal(
+    db: Session,
+    organization: Organization,
+    species: AnimalSpecies,
+    *,
+    size: AnimalSize,
+    temperament_traits: list[TemperamentTrait],
+    photos: list[AnimalPhoto] | None = None,
+) -> Animal:
+    animal = Animal(
+        organization_id=organization.id,
+        species_id=species.id,
+        name="Rex",
+        sex=AnimalSex.male,
+        size=size,
+        temperament_traits=temperament_traits,
+        photos=photos or [],
+    )
+    db.add(animal)
+    db.flush()
+    repository.refresh(db, animal_ids=[animal.id])
+    return animal
+
+
+def test_count_facets_groups_by_temperament_trait(
+    db: Session, organization: Organization, species: AnimalSpecies
+) -> None:
+    _add_animal(
+        db,
+        organization,
+        species,
+        size=AnimalSize.small,
+        temperament_traits=[TemperamentTrait.calm, TemperamentTrait.playful],
+    )
+    _add_animal(
+        db,
+        organization,
+        species,
+        size=AnimalSize.large,
+        temperament_traits=[TemperamentTrait.calm],
+    )
+
+    facets = repository.count_facets(
+        db,
+        latitude=LATITUDE,
+        longitude=LONGITUDE,
+        radius_km=1,
+        filters=AnimalSearchFilters(size=AnimalSize.small),
+    )
+
+    assert facets.total == 1
+    # A faceta de porte ignora o próprio filtro.
+    assert set(facets.size) == {(AnimalSize.small, 1), (AnimalSize.large, 1)}
+    assert set(facets.temperament_traits) == {
+        (TemperamentTrait.calm, 1),
+        (TemperamentTrait.playful, 1),
+    }
+
+
+def test_search_available_returns_cards_in_radius(
+    db: Session, organization: Organization, species: AnimalSpecies
+) -> None:
+    animal = _add_animal(
+        db,
+        organization,
+        species,
+        size=AnimalSize.medium,
+        temperament_traits=[TemperamentTrait.shy],
+    )
+
+    items = repository.search_available(
+        db,
+        latitude=LATITUDE,
+        longitude=LONGITUDE,
+        radius_km=1,
+        filters=AnimalSearchFilters(temperament_traits=(TemperamentTrait.shy,)),
+    )
+
+    assert [row.animal_id for row, _ in items] == [animal.id]
+    assert items[0][1] == pytest.approx(0.0, abs=0.01)
+
+
+def test_search_available_detailed_returns_ordered_photos(
+    db: Session, organization: Organization, species: AnimalSpecies
+) -> None:
+    _add_animal(
+        db,
+        organization,
+        species,
+        size=AnimalSize.medium,
+        temperament_traits=[TemperamentTrait.docile],
+        photos=[
+            AnimalPhoto(url="https://example.com/2.jpg", position=2),
+            AnimalPhoto(url="https://example.com/sem-ordem.jpg"),
+            AnimalPhoto(url="https://example.com/1.jpg", position=1),
+        ],
+    )
+
+    items = repository.search_available(
+        db,
+        latitude=LATITUDE,
+        longitude=LONGITUDE,
+        radius_km=1,
+        filters=AnimalSearchFilters(temperament_traits=(TemperamentTrait.docile,)),
+        detailed=True,
+    )
+
+    row = items[0][0]
+    assert row.photo_url == "https://example.com/1.jpg"
+    assert [photo["url"] for photo in row.photos] == [
+        "https://example.com/1.jpg",
+        "https://example.com/2.jpg",
+        "https://example.com/sem-ordem.jpg",
+    ]
+    assert row.updated_at is not None